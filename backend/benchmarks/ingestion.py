@@ -0,0 +1,280 @@
+"""
+Offline benchmark suite for the Habr ingestion pipeline.
+
+Measures, on synthetic listing pages built from the test fixture:
+
+* parse: cards/sec and peak RSS of each parser engine;
+* fields: per-field extraction cost (µs per card) of each parser engine;
+* validation: `JobSchema` validation throughput;
+* persistence: the `JobService` save loop against a SQLite file for a page
+  of new jobs, for the same page once all jobs are known, and for the same
+  page once every job has changed.
+
+Every case runs in a fresh process, so peak RSS is not polluted by earlier
+cases. Run from the `backend` directory:
+
+    python -m benchmarks.ingestion --cards 100 1000 10000 --output bench.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+from lxml import etree, html
+
+from benchmarks.synthetic import build_listing_page
+from src.core.parsers.base import BaseParser
+from src.core.parsers.habr import HabrParser
+from src.core.parsers.habr_lxml import (
+    _COMPANY_LINK,
+    _DESCRIPTION,
+    _LOCATION,
+    _SALARY,
+    _TITLE_LINK,
+    HabrLxmlParser,
+)
+from src.core.schemas import JobSchema
+
+DEFAULT_CARDS = [100, 1000, 10000]
+ENGINES: dict[str, Callable[[], BaseParser]] = {
+    "bs4": HabrParser,
+    "lxml": HabrLxmlParser,
+}
+
+
+def _find_in(outer: tuple[str, str], tag: str) -> Callable[[Tag], Any]:
+    def find(card: Tag) -> Any:
+        found = card.find(*outer)
+        return found.find(tag) if isinstance(found, Tag) else None
+
+    return find
+
+
+_BS4_FIELDS: dict[str, Callable[[Tag], Any]] = {
+    "title": lambda card: card.find("a", class_="vacancy-card__title-link"),
+    "company": _find_in(("div", "vacancy-card__company-title"), "a"),
+    "salary": lambda card: card.find("div", class_="vacancy-card__salary-value"),
+    "location": _find_in(("div", "vacancy-card__meta"), "span"),
+    "description": lambda card: card.find("div", class_="vacancy-card__description"),
+}
+_LXML_FIELDS: dict[str, etree.XPath] = {
+    "title": _TITLE_LINK,
+    "company": _COMPANY_LINK,
+    "salary": _SALARY,
+    "location": _LOCATION,
+    "description": _DESCRIPTION,
+}
+_LXML_CARDS = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' vacancy-card ')]",
+)
+
+
+def _peak_rss_kb() -> int:
+    """Returns the peak resident set size of the current process in KiB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _throughput(cards_count: int, seconds: float) -> float:
+    return round(cards_count / seconds, 1) if seconds else 0.0
+
+
+def bench_parse(engine: str, cards_count: int) -> dict[str, Any]:
+    """Parses a synthetic page once with the given engine."""
+    content = build_listing_page(cards_count)
+    parser = ENGINES[engine]()
+
+    start = time.perf_counter()
+    jobs = parser.parse(content)
+    seconds = time.perf_counter() - start
+
+    return {
+        "benchmark": "parse",
+        "engine": engine,
+        "cards": cards_count,
+        "jobs": len(jobs),
+        "seconds": round(seconds, 6),
+        "cards_per_sec": _throughput(cards_count, seconds),
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def bench_fields(engine: str, cards_count: int) -> dict[str, Any]:
+    """Measures the cost of locating each field of a card, in µs per card."""
+    content = build_listing_page(cards_count)
+    cards: list[Any]
+    selectors: dict[str, Callable[[Any], Any]]
+    if engine == "bs4":
+        soup = BeautifulSoup(content, "lxml")
+        cards = [
+            card for card in soup.find_all("div", class_="vacancy-card") if isinstance(card, Tag)
+        ]
+        selectors = _BS4_FIELDS
+    else:
+        cards = _LXML_CARDS(html.fromstring(content))
+        selectors = _LXML_FIELDS
+
+    us_per_card: dict[str, float] = {}
+    for field, select in selectors.items():
+        start = time.perf_counter()
+        for card in cards:
+            select(card)
+        us_per_card[field] = round((time.perf_counter() - start) / len(cards) * 1e6, 3)
+
+    return {
+        "benchmark": "fields",
+        "engine": engine,
+        "cards": cards_count,
+        "us_per_card": us_per_card,
+    }
+
+
+def bench_validation(cards_count: int) -> dict[str, Any]:
+    """Validates raw card data into `JobSchema` objects."""
+    raw_jobs = [
+        job.model_dump(mode="json")
+        for job in HabrLxmlParser().parse(build_listing_page(cards_count))
+    ]
+
+    start = time.perf_counter()
+    for raw_job in raw_jobs:
+        JobSchema.model_validate(raw_job)
+    seconds = time.perf_counter() - start
+
+    return {
+        "benchmark": "validation",
+        "cards": cards_count,
+        "seconds": round(seconds, 6),
+        "cards_per_sec": _throughput(cards_count, seconds),
+    }
+
+
+def bench_persistence(cards_count: int) -> dict[str, Any]:
+    """Runs the `JobService` save loop against a temporary SQLite database."""
+    return asyncio.run(_bench_persistence(cards_count))
+
+
+async def _bench_persistence(cards_count: int) -> dict[str, Any]:
+    from src.config.config import DatabaseConfig
+    from src.core.services import JobService
+    from src.db.db import close_db, init_db
+    from src.utils.notify_logger.logger import logger
+
+    logger.setup(handlers=[], level="WARNING")
+    jobs = HabrLxmlParser().parse(build_listing_page(cards_count))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir, "bench.sqlite3")
+        await init_db(DatabaseConfig(url=f"sqlite://{db_path}", engine="tortoise.backends.sqlite"))
+        try:
+            service = JobService()
+
+            start = time.perf_counter()
+            inserted = (await service._save_jobs(jobs)).created  # noqa: SLF001
+            insert_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            await service._save_jobs(jobs)  # noqa: SLF001
+            dedupe_seconds = time.perf_counter() - start
+
+            changed_jobs = [job.model_copy(update={"salary": "от 1 ₽"}) for job in jobs]
+            start = time.perf_counter()
+            updated = (await service._save_jobs(changed_jobs)).updated  # noqa: SLF001
+            update_seconds = time.perf_counter() - start
+        finally:
+            await close_db()
+
+    return {
+        "benchmark": "persistence",
+        "cards": cards_count,
+        "inserted": inserted,
+        "insert_seconds": round(insert_seconds, 6),
+        "insert_cards_per_sec": _throughput(cards_count, insert_seconds),
+        "dedupe_seconds": round(dedupe_seconds, 6),
+        "dedupe_cards_per_sec": _throughput(cards_count, dedupe_seconds),
+        "updated": updated,
+        "update_seconds": round(update_seconds, 6),
+        "update_cards_per_sec": _throughput(cards_count, update_seconds),
+        "peak_rss_kb": _peak_rss_kb(),
+    }
+
+
+def _run_isolated(func: Callable[..., dict[str, Any]], *args: Any) -> dict[str, Any]:
+    """Runs a benchmark case in a fresh interpreter to get an unpolluted peak RSS."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(func, *args).result()
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_suite(cards: list[int]) -> dict[str, Any]:
+    """
+    Runs every benchmark for every page size.
+
+    Args:
+        cards: The page sizes, in `vacancy-card` elements.
+
+    Returns:
+        The JSON-serializable report.
+    """
+    results: list[dict[str, Any]] = []
+    for cards_count in cards:
+        for engine in ENGINES:
+            results.append(_run_isolated(bench_parse, engine, cards_count))
+            results.append(_run_isolated(bench_fields, engine, cards_count))
+        results.append(_run_isolated(bench_validation, cards_count))
+        results.append(_run_isolated(bench_persistence, cards_count))
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Offline benchmark suite for the Habr ingestion pipeline.",
+    )
+    arg_parser.add_argument("--cards", type=int, nargs="+", default=DEFAULT_CARDS)
+    arg_parser.add_argument("--output", type=Path, help="JSON file to write; stdout if omitted")
+    args = arg_parser.parse_args()
+
+    report = json.dumps(run_suite(args.cards), ensure_ascii=False, indent=2)
+    if args.output:
+        args.output.write_text(report, encoding="utf-8")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Measures the cost of a `NotifyLogger` call, suppressed or emitted.
+
+With the level set to WARNING, it compares a suppressed `debug` call:
+
+* eager: the former `_log`, resolving the caller, formatting the message
+  and binding the notify flag before loguru drops the record;
+* NotifyLogger: the current `_log`, returning after the level check;
+* loguru: a bare loguru `debug` call, the floor for any wrapper;
+
+and an emitted `warning` to a sink discarding the message, for scale.
+
+Run from the `backend` directory:
+
+    python -m benchmarks.logger --calls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import TYPE_CHECKING
+
+from loguru import logger as loguru_logger
+
+from src.utils.notify_logger.logger import logger
+from src.utils.notify_logger.tools import get_dynamic_func_path
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def eager_debug(message: str) -> None:
+    """A suppressed call as `NotifyLogger._log` made it before the level check."""
+    func_path = get_dynamic_func_path()
+    formatted_message = logger.formatter.format_message(
+        message=message,
+        func_path=func_path,
+        exception=None,
+        author="benchmark",
+        details=None,
+    )
+    loguru_logger.bind(notify=False).opt(exception=None, lazy=True).log("DEBUG", formatted_message)
+
+
+CALLS: dict[str, Callable[[], None]] = {
+    "suppressed, eager": lambda: eager_debug("card parsed"),
+    "suppressed, NotifyLogger": lambda: logger.debug(
+        "card parsed",
+        author="benchmark",
+        notify=False,
+    ),
+    "suppressed, loguru": lambda: loguru_logger.debug("card parsed"),
+    "emitted, NotifyLogger": lambda: logger.warning(
+        "card parsed",
+        author="benchmark",
+        notify=False,
+    ),
+}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--calls", type=int, default=200_000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    logger.setup(handlers=[], level="WARNING")
+    logger.original.remove()
+    logger.original.add(lambda _: None, level="WARNING")
+
+    print(f"{'call':<28} {'ns/call':>10}")
+    for name, call in CALLS.items():
+        best = min(timeit.repeat(call, number=args.calls, repeat=args.repeat))
+        print(f"{name:<28} {best / args.calls * 1e9:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
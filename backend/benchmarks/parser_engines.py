@@ -0,0 +1,42 @@
+"""
+Compares the BeautifulSoup and lxml Habr parser engines on synthetic pages.
+
+Run from the `backend` directory:
+
+    python -m benchmarks.parser_engines
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from benchmarks.synthetic import build_listing_page
+from src.core.parsers.base import BaseParser
+from src.core.parsers.habr import HabrParser
+from src.core.parsers.habr_lxml import HabrLxmlParser
+
+
+def best_time(parser: BaseParser, content: str, repeat: int) -> float:
+    """Returns the best wall time in seconds of parsing `content` once."""
+    return min(timeit.repeat(lambda: parser.parse(content), number=1, repeat=repeat))
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--cards", type=int, nargs="+", default=[100, 1000, 5000])
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'cards':>8} {'bs4, s':>10} {'lxml, s':>10} {'speedup':>8}")
+    for cards_count in args.cards:
+        content = build_listing_page(cards_count)
+        bs4_time = best_time(HabrParser(), content, args.repeat)
+        lxml_time = best_time(HabrLxmlParser(), content, args.repeat)
+        print(
+            f"{cards_count:>8} {bs4_time:>10.4f} {lxml_time:>10.4f} {bs4_time / lxml_time:>7.1f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Compares the ways of turning a large list of stored jobs into a response body.
+
+Each path reads the same newest-first page from a temporary SQLite database
+and serializes it:
+
+* models + jsonable_encoder: ORM models validated into `JobResponse`, then
+  FastAPI's default JSON encoding (the original endpoints);
+* models + to_json: ORM models validated into `JobResponse`, then serialized
+  by pydantic-core (the endpoints before rows were read with `.values()`);
+* rows + to_json: plain rows read with `.values()` and serialized directly
+  (the current JSON path);
+* rows + msgpack: the same rows as MessagePack, when msgpack is installed.
+
+Run from the `backend` directory:
+
+    python -m benchmarks.serialization --jobs 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from fastapi.encoders import jsonable_encoder
+from pydantic_core import to_json
+
+from benchmarks.synthetic import build_listing_page
+from src.api.schemas import JobResponse
+from src.api.serialization import JOB_RESPONSE_FIELDS, MSGPACK_MEDIA_TYPE, msgpack, serialize
+from src.config.config import DatabaseConfig
+from src.core.parsers.habr_lxml import HabrLxmlParser
+from src.db.db import close_db, init_db
+from src.db.models import Job
+from src.db.repository import JobRepository
+from src.utils.notify_logger.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+async def models_jsonable_encoder(limit: int) -> bytes:
+    jobs = await Job.all().order_by("-created_at", "-id").limit(limit)
+    payload = [JobResponse.model_validate(job) for job in jobs]
+    return json.dumps(jsonable_encoder(payload)).encode()
+
+
+async def models_to_json(limit: int) -> bytes:
+    jobs = await Job.all().order_by("-created_at", "-id").limit(limit)
+    return to_json([JobResponse.model_validate(job) for job in jobs])
+
+
+async def rows_to_json(limit: int) -> bytes:
+    rows = await JobRepository().get_jobs_page(limit, JOB_RESPONSE_FIELDS)
+    return serialize(rows)
+
+
+async def rows_msgpack(limit: int) -> bytes:
+    rows = await JobRepository().get_jobs_page(limit, JOB_RESPONSE_FIELDS)
+    return serialize(rows, MSGPACK_MEDIA_TYPE)
+
+
+PATHS: dict[str, Callable[[int], Awaitable[bytes]]] = {
+    "models + jsonable_encoder": models_jsonable_encoder,
+    "models + to_json": models_to_json,
+    "rows + to_json": rows_to_json,
+}
+if msgpack is not None:
+    PATHS["rows + msgpack"] = rows_msgpack
+
+
+async def best_time(path: Callable[[int], Awaitable[bytes]], limit: int, repeat: int) -> float:
+    """Returns the best wall time in seconds of building one response body."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await path(limit)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def run(jobs_counts: list[int], repeat: int) -> None:
+    logger.setup(handlers=[], level="WARNING")
+    jobs = HabrLxmlParser().parse(build_listing_page(max(jobs_counts)))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = Path(tmp_dir, "bench.sqlite3")
+        await init_db(DatabaseConfig(url=f"sqlite://{db_path}", engine="tortoise.backends.sqlite"))
+        try:
+            await JobRepository().bulk_create_jobs(jobs)
+
+            print(f"{'jobs':>8} " + " ".join(f"{name + ', ms':>28}" for name in PATHS))
+            for jobs_count in jobs_counts:
+                timings = [await best_time(path, jobs_count, repeat) for path in PATHS.values()]
+                print(f"{jobs_count:>8} " + " ".join(f"{t * 1000:>28.2f}" for t in timings))
+        finally:
+            await close_db()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--jobs", type=int, nargs="+", default=[1000, 10000])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+    asyncio.run(run(args.jobs, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+FIXTURE_PATH = (
+    Path(__file__).parent.parent / "tests" / "test_data" / "html" / "habr_python_developer.html"
+)
+_CARD_START = '<div class="vacancy-card">'
+_FIXTURE_VACANCY_ID = "1000123456"
+
+
+def build_listing_page(cards_count: int, fixture_path: Path = FIXTURE_PATH) -> str:
+    """
+    Builds a synthetic Habr listing page by repeating the fixture's vacancy card.
+
+    Every card gets a unique vacancy URL, so the jobs can also be stored.
+
+    Args:
+        cards_count: The number of `vacancy-card` elements on the page.
+        fixture_path: The HTML fixture containing a single vacancy card.
+
+    Returns:
+        The HTML of the page.
+    """
+    html = fixture_path.read_text(encoding="utf-8")
+    card_start = html.index(_CARD_START)
+    card_end = html.rindex("</body>")
+    card = html[card_start:card_end]
+
+    first_id = int(_FIXTURE_VACANCY_ID)
+    cards = (card.replace(_FIXTURE_VACANCY_ID, str(first_id + i)) for i in range(cards_count))
+    return f"{html[:card_start]}{''.join(cards)}{html[card_end:]}"
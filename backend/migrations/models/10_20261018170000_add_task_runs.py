@@ -0,0 +1,30 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        CREATE TABLE IF NOT EXISTS "task_runs" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "task" VARCHAR(128) NOT NULL,
+    "status" VARCHAR(16) NOT NULL,
+    "started_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "finished_at" TIMESTAMPTZ,
+    "duration" DOUBLE PRECISION,
+    "pages" INT NOT NULL DEFAULT 0,
+    "jobs_parsed" INT NOT NULL DEFAULT 0,
+    "jobs_created" INT NOT NULL DEFAULT 0,
+    "jobs_updated" INT NOT NULL DEFAULT 0,
+    "errors" INT NOT NULL DEFAULT 0,
+    "fetch_seconds" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    "parse_seconds" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    "dedupe_seconds" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    "write_seconds" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    "error" TEXT
+);
+CREATE INDEX IF NOT EXISTS "idx_task_runs_task_3c9e1a" ON "task_runs" ("task", "id");
+COMMENT ON TABLE "task_runs" IS 'Model for storing the outcome of a scheduled task run.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        DROP TABLE IF EXISTS "task_runs";"""
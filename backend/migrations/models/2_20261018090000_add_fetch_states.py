@@ -0,0 +1,20 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        CREATE TABLE IF NOT EXISTS "fetch_states" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "url" VARCHAR(512) NOT NULL UNIQUE,
+    "etag" VARCHAR(255),
+    "last_modified" VARCHAR(64),
+    "content_hash" VARCHAR(64) NOT NULL,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS "idx_fetch_state_url_4c0d6e" ON "fetch_states" ("url");
+COMMENT ON TABLE "fetch_states" IS 'Model for storing HTTP caching metadata of fetched source pages.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        DROP TABLE IF EXISTS "fetch_states";"""
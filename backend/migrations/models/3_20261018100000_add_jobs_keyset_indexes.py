@@ -0,0 +1,15 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_jobs_created_b2e1c4" ON "jobs" ("created_at", "id");
+CREATE INDEX IF NOT EXISTS "idx_jobs_company_6f3a9d" ON "jobs" ("company", "created_at", "id");
+CREATE INDEX IF NOT EXISTS "idx_jobs_locatio_0d7e52" ON "jobs" ("location", "created_at", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        DROP INDEX IF EXISTS "idx_jobs_created_b2e1c4";
+DROP INDEX IF EXISTS "idx_jobs_company_6f3a9d";
+DROP INDEX IF EXISTS "idx_jobs_locatio_0d7e52";"""
@@ -0,0 +1,17 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        ALTER TABLE "jobs" ADD COLUMN IF NOT EXISTS "search_vector" tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('russian', coalesce("title", '')), 'A')
+        || setweight(to_tsvector('russian', coalesce("description", '')), 'B')
+    ) STORED;
+CREATE INDEX IF NOT EXISTS "idx_jobs_search_vector" ON "jobs" USING GIN ("search_vector");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        DROP INDEX IF EXISTS "idx_jobs_search_vector";
+ALTER TABLE "jobs" DROP COLUMN IF EXISTS "search_vector";"""
@@ -0,0 +1,11 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        ALTER TABLE "jobs" ADD "content_hash" VARCHAR(64);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        ALTER TABLE "jobs" DROP COLUMN "content_hash";"""
@@ -0,0 +1,22 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        CREATE TABLE IF NOT EXISTS "source_watermarks" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "source" VARCHAR(64) NOT NULL,
+    "listing_url" VARCHAR(512) NOT NULL UNIQUE,
+    "newest_url" VARCHAR(512),
+    "caught_up" BOOL NOT NULL DEFAULT True,
+    "gap_url" VARCHAR(512),
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS "idx_source_wate_source_5b1f3c" ON "source_watermarks" ("source");
+CREATE INDEX IF NOT EXISTS "idx_source_wate_listing_0e7a9d" ON "source_watermarks" ("listing_url");
+COMMENT ON TABLE "source_watermarks" IS 'Model for storing how far the last ingestion run got in a source listing.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        DROP TABLE IF EXISTS "source_watermarks";"""
@@ -0,0 +1,21 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        ALTER TABLE "jobs" ADD "salary_min" INT;
+ALTER TABLE "jobs" ADD "salary_max" INT;
+ALTER TABLE "jobs" ADD "salary_currency" VARCHAR(3);
+CREATE INDEX IF NOT EXISTS "idx_jobs_salary__4a8c1e" ON "jobs" ("salary_max");
+CREATE INDEX IF NOT EXISTS "idx_jobs_salary__9b2d7f" ON "jobs" ("salary_min", "id");
+CREATE INDEX IF NOT EXISTS "idx_jobs_salary__c3e5a0" ON "jobs" ("salary_currency", "salary_min", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        DROP INDEX IF EXISTS "idx_jobs_salary__c3e5a0";
+DROP INDEX IF EXISTS "idx_jobs_salary__9b2d7f";
+DROP INDEX IF EXISTS "idx_jobs_salary__4a8c1e";
+ALTER TABLE "jobs" DROP COLUMN "salary_currency";
+ALTER TABLE "jobs" DROP COLUMN "salary_max";
+ALTER TABLE "jobs" DROP COLUMN "salary_min";"""
@@ -0,0 +1,19 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        CREATE TABLE IF NOT EXISTS "job_stats" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "metric" VARCHAR(16) NOT NULL,
+    "key" VARCHAR(255) NOT NULL,
+    "count" INT NOT NULL DEFAULT 0,
+    CONSTRAINT "uid_job_stats_metric_6d2b8e" UNIQUE ("metric", "key")
+);
+CREATE INDEX IF NOT EXISTS "idx_job_stats_metric_f41c7a" ON "job_stats" ("metric", "count");
+COMMENT ON TABLE "job_stats" IS 'Model for storing a precomputed counter of the job statistics.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        DROP TABLE IF EXISTS "job_stats";"""
@@ -0,0 +1,16 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        CREATE TABLE IF NOT EXISTS "task_locks" (
+    "name" VARCHAR(128) NOT NULL PRIMARY KEY,
+    "owner" VARCHAR(32) NOT NULL,
+    "expires_at" TIMESTAMPTZ NOT NULL
+);
+COMMENT ON TABLE "task_locks" IS 'Model for storing the lock of a task running somewhere in the cluster.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:  # noqa: ARG001
+    return """
+        DROP TABLE IF EXISTS "task_locks";"""
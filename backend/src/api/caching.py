@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from fastapi import Request, Response, status
+
+from src.api.serialization import negotiate_media_type, serialize
+from src.core.cache import job_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+
+class CachedResponse(NamedTuple):
+    """A serialized response body with its extra headers and entity tag."""
+
+    body: bytes
+    headers: dict[str, str]
+    etag: str
+
+
+async def cached_response(
+    request: Request,
+    loader: Callable[[], Awaitable[tuple[Any, dict[str, str]]]],
+) -> Response:
+    """
+    Serves a response from the job cache, honouring `If-None-Match`.
+
+    The serialized body is served from the cache, or loaded, serialized once
+    and cached, keyed by path, query and the media type negotiated from
+    `Accept` (JSON or MessagePack). The `ETag` is a hash of that body, so it
+    changes with the data itself: jobs written by another worker or by a
+    maintenance command, or a date-dependent aggregate rolling over, show up
+    as soon as the cached entry is invalidated or expires. A client
+    presenting the current `ETag` gets `304 Not Modified`, without database
+    access while the entry is cached.
+
+    Args:
+        request: The incoming request.
+        loader: Produces the payload and its extra headers on a cache miss.
+
+    Returns:
+        The serialized response, or an empty 304 response.
+    """
+    media_type = negotiate_media_type(request.headers.get("accept"))
+
+    async def load() -> CachedResponse:
+        payload, headers = await loader()
+        body = serialize(payload, media_type)
+        return CachedResponse(body=body, headers=headers, etag=_body_etag(body))
+
+    key = (request.url.path, request.url.query, media_type)
+    cached: CachedResponse = await job_cache.get_or_set(key, load)
+    cache_headers = {"ETag": cached.etag, "Cache-Control": "no-cache", "Vary": "Accept"}
+
+    if cached.etag in _parse_if_none_match(request.headers.get("if-none-match")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    return Response(
+        content=cached.body,
+        media_type=media_type,
+        headers={**cached.headers, **cache_headers},
+    )
+
+
+def _body_etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _parse_if_none_match(header: str | None) -> set[str]:
+    if not header:
+        return set()
+    return {tag.strip() for tag in header.split(",")}
@@ -1,3 +1,9 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Query
+
+from src.core.schemas import JobFilters
 from src.core.services import JobService
 
 
@@ -9,3 +15,38 @@ def get_job_service() -> JobService:
         JobService: An instance of the JobService.
     """
     return JobService()
+
+
+def get_job_filters(
+    company: str | None = None,
+    location: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    salary_from: Annotated[int | None, Query(ge=0)] = None,
+    salary_to: Annotated[int | None, Query(ge=0)] = None,
+    salary_currency: Annotated[str | None, Query(pattern="^[A-Z]{3}$")] = None,
+) -> JobFilters:
+    """
+    Dependency provider for job list filters taken from query parameters.
+
+    Args:
+        company: Only jobs of this company.
+        location: Only jobs in this location.
+        created_from: Only jobs created at or after this time.
+        created_to: Only jobs created before this time.
+        salary_from: Only jobs whose minimum salary is at least this amount.
+        salary_to: Only jobs whose maximum salary is at most this amount.
+        salary_currency: Only jobs paying in this currency (ISO 4217 code).
+
+    Returns:
+        JobFilters: The filters to apply.
+    """
+    return JobFilters(
+        company=company,
+        location=location,
+        created_from=created_from,
+        created_to=created_to,
+        salary_from=salary_from,
+        salary_to=salary_to,
+        salary_currency=salary_currency,
+    )
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from src.api.schemas import JobResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from src.db.models import Job
+
+SSE_MEDIA_TYPE = "text/event-stream"
+
+# Milliseconds a disconnected EventSource waits before reconnecting
+SSE_RETRY_MS = 5000
+
+
+async def stream_sse(batches: AsyncIterator[list[Job]]) -> AsyncIterator[str]:
+    """
+    Serializes batches of jobs as server-sent events, one `job` event per job.
+
+    The event ID is the job ID, so a reconnecting `EventSource` resumes the
+    stream by sending it back in the `Last-Event-ID` header. An empty batch
+    becomes a comment line, keeping idle connections open through proxies.
+
+    Args:
+        batches: Batches of jobs to serialize.
+
+    Yields:
+        str: The serialized events of a batch.
+    """
+    yield f"retry: {SSE_RETRY_MS}\n\n"
+    async for jobs in batches:
+        if not jobs:
+            yield ": keep-alive\n\n"
+            continue
+        yield "".join(
+            f"id: {job.id}\nevent: job\ndata: {JobResponse.model_validate(job).model_dump_json()}\n\n"
+            for job in jobs
+        )
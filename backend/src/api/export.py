@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import csv
+import io
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import to_json, to_jsonable_python
+
+from src.api.serialization import JOB_RESPONSE_FIELDS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class ExportFormat(StrEnum):
+    """Supported formats of the job export."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """The MIME type of the exported document."""
+        return {
+            ExportFormat.NDJSON: "application/x-ndjson",
+            ExportFormat.CSV: "text/csv; charset=utf-8",
+        }[self]
+
+
+async def stream_ndjson(chunks: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[bytes]:
+    """
+    Serializes chunks of job rows as newline-delimited JSON, one job per line.
+
+    Args:
+        chunks: Chunks of job rows, with the `JOB_RESPONSE_FIELDS` columns.
+
+    Yields:
+        bytes: The serialized lines of a chunk.
+    """
+    async for rows in chunks:
+        yield b"".join(to_json(row) + b"\n" for row in rows)
+
+
+async def stream_csv(chunks: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[str]:
+    """
+    Serializes chunks of job rows as CSV with a header row.
+
+    Args:
+        chunks: Chunks of job rows, with the `JOB_RESPONSE_FIELDS` columns.
+
+    Yields:
+        str: The header, then the serialized rows of a chunk.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=JOB_RESPONSE_FIELDS)
+    writer.writeheader()
+    yield buffer.getvalue()
+
+    async for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(to_jsonable_python(rows))
+        yield buffer.getvalue()
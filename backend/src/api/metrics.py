@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from fastapi import APIRouter, Response
+
+from src.core.metrics import CallbackCounter, Gauge, Histogram, metrics
+from src.utils.notify_logger.websocket_manager import WebSocketHandlerManager
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+api_request_seconds = metrics.register(
+    Histogram(
+        "api_request_seconds",
+        "Latency of API requests until the response starts.",
+        ("method", "route", "status"),
+    ),
+)
+metrics.register(
+    Gauge(
+        "log_websocket_queue_depth",
+        "Log records waiting in the WebSocket handler queue.",
+        lambda: WebSocketHandlerManager().queued_records,
+    ),
+)
+metrics.register(
+    CallbackCounter(
+        "log_websocket_dropped_total",
+        "Log records dropped by the WebSocket handler on a full queue.",
+        lambda: WebSocketHandlerManager().dropped_count,
+    ),
+)
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    """Возвращает метрики процесса в текстовом формате Prometheus."""
+    return Response(metrics.render(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+
+class RequestMetricsMiddleware:
+    """
+    Records the latency of every HTTP request per method, route and status.
+
+    Requests are labelled with the path template of the matched route, such
+    as `/api/v1/jobs/{job_id}`, so the number of label values stays bounded;
+    requests matching no route are labelled `unmatched`. The latency is
+    measured until the response starts, which for a streamed export is the
+    time to the first byte.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = "500"
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+                _observe(scope, status, time.perf_counter() - start)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            _observe(scope, status, time.perf_counter() - start)
+            raise
+
+
+def _observe(scope: Scope, status: str, seconds: float) -> None:
+    route = scope.get("route")
+    api_request_seconds.observe(
+        seconds,
+        method=scope["method"],
+        route=getattr(route, "path", "unmatched"),
+        status=status,
+    )
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -14,6 +14,9 @@ class JobResponse(BaseModel):
         url (HttpUrl): The URL of the job posting.
         description (str | None): A brief description of the job.
         salary (str | None): The salary information for the job.
+        salary_min (int | None): The lower bound of the salary.
+        salary_max (int | None): The upper bound of the salary.
+        salary_currency (str | None): The ISO 4217 code of the salary currency.
         created_at (datetime): The timestamp when the job record was created.
         updated_at (datetime): The timestamp when the job record was last updated.
     """
@@ -24,7 +27,125 @@ class JobResponse(BaseModel):
     url: HttpUrl
     description: str | None = None
     salary: str | None = None
+    salary_min: int | None = None
+    salary_max: int | None = None
+    salary_currency: str | None = None
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
     model_config = {"from_attributes": True}
+
+
+class CompanyStatResponse(BaseModel):
+    """
+    Pydantic model for the number of jobs of a company.
+
+    Attributes:
+        company (str): The company name.
+        jobs_count (int): The number of its jobs.
+    """
+
+    company: str
+    jobs_count: int
+
+    model_config = {"from_attributes": True}
+
+
+class DailyStatResponse(BaseModel):
+    """
+    Pydantic model for the number of jobs added on a day.
+
+    Attributes:
+        day (date): The day.
+        jobs_count (int): The number of jobs added that day.
+    """
+
+    day: date
+    jobs_count: int
+
+    model_config = {"from_attributes": True}
+
+
+class SalaryBucketResponse(BaseModel):
+    """
+    Pydantic model for a bucket of the salary distribution.
+
+    Attributes:
+        currency (str): The ISO 4217 code of the salary currency.
+        salary_from (int): The inclusive lower bound of the bucket.
+        salary_to (int): The exclusive upper bound of the bucket.
+        jobs_count (int): The number of jobs whose salary falls in the bucket.
+    """
+
+    currency: str
+    salary_from: int
+    salary_to: int
+    jobs_count: int
+
+    model_config = {"from_attributes": True}
+
+
+class StatsResponse(BaseModel):
+    """
+    Pydantic model for the dashboard statistics of the stored jobs.
+
+    Attributes:
+        total_jobs (int): The number of stored jobs.
+        top_companies (list[CompanyStatResponse]): The companies with the most jobs.
+        new_per_day (list[DailyStatResponse]): The number of new jobs per day, oldest first.
+        salary_distribution (list[SalaryBucketResponse]): The number of jobs per
+            salary bucket, by currency and amount.
+    """
+
+    total_jobs: int
+    top_companies: list[CompanyStatResponse]
+    new_per_day: list[DailyStatResponse]
+    salary_distribution: list[SalaryBucketResponse]
+
+    model_config = {"from_attributes": True}
+
+
+class TaskRunResponse(BaseModel):
+    """
+    Pydantic model for a recorded scheduled task run.
+
+    Stage times are summed over the pages of the run, which are processed
+    concurrently, so they may add up to more than its duration.
+
+    Attributes:
+        id (int): The unique identifier of the run.
+        task (str): The name of the task, such as "parse_habr".
+        status (str): "running", "succeeded" or "failed".
+        started_at (datetime): When the run started.
+        finished_at (datetime | None): When the run ended, None while running.
+        duration (float | None): The wall time of the run in seconds.
+        pages (int): The number of listing pages visited.
+        jobs_parsed (int): The number of job cards parsed.
+        jobs_created (int): The number of new jobs inserted.
+        jobs_updated (int): The number of changed jobs updated.
+        errors (int): The number of pages that failed to load.
+        fetch_seconds (float): The time spent fetching pages.
+        parse_seconds (float): The time spent parsing pages.
+        dedupe_seconds (float): The time spent telling new and changed jobs from known ones.
+        write_seconds (float): The time spent writing to the database.
+        error (str | None): The error that made the run fail.
+    """
+
+    id: int
+    task: str
+    status: str
+    started_at: datetime
+    finished_at: datetime | None = None
+    duration: float | None = None
+    pages: int
+    jobs_parsed: int
+    jobs_created: int
+    jobs_updated: int
+    errors: int
+    fetch_seconds: float
+    parse_seconds: float
+    dedupe_seconds: float
+    write_seconds: float
+    error: str | None = None
+
+    model_config = {"from_attributes": True}
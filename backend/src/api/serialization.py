@@ -0,0 +1,61 @@
+"""
+Serialization of API responses, with content negotiation.
+
+Responses are JSON by default. Clients sending `Accept: application/msgpack`
+get MessagePack instead, when the optional `msgpack` package is installed.
+Payloads may be pydantic models or plain rows read with `.values()`; both are
+serialized in a single pass by pydantic-core, without building models for rows.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic_core import to_json, to_jsonable_python
+
+from src.api.schemas import JobResponse
+
+msgpack: Any
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+# The columns read for job responses, in the order of the response model
+JOB_RESPONSE_FIELDS = tuple(JobResponse.model_fields)
+
+
+def negotiate_media_type(accept: str | None) -> str:
+    """
+    Chooses the response media type from the `Accept` header.
+
+    Args:
+        accept: The `Accept` header of the request.
+
+    Returns:
+        The MessagePack media type if the client accepts it and it is
+        available, otherwise the JSON media type.
+    """
+    if msgpack is not None and accept and any(alias in accept for alias in _MSGPACK_ALIASES):
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def serialize(payload: Any, media_type: str = JSON_MEDIA_TYPE) -> bytes:
+    """
+    Serializes a response payload.
+
+    Args:
+        payload: The models, rows or plain values to serialize.
+        media_type: The media type returned by `negotiate_media_type`.
+
+    Returns:
+        The response body.
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(to_jsonable_python(payload))
+    return to_json(payload)
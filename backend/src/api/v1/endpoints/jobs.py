@@ -1,32 +1,132 @@
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from src.api.dependencies import get_job_service
+from src.api.caching import cached_response
+from src.api.dependencies import get_job_filters, get_job_service
+from src.api.events import SSE_MEDIA_TYPE, stream_sse
+from src.api.export import ExportFormat, stream_csv, stream_ndjson
 from src.api.schemas import JobResponse
+from src.api.serialization import JOB_RESPONSE_FIELDS
+from src.core.schemas import JobFilters, JobSort
 from src.core.services import JobService
 
 router = APIRouter()
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
 
-@router.get("/jobs")
+
+@router.get("/jobs", response_model=list[JobResponse])
 async def get_all_jobs(
+    request: Request,
+    job_service: Annotated[JobService, Depends(get_job_service)],
+    filters: Annotated[JobFilters, Depends(get_job_filters)],
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    cursor: str | None = None,
+    sort: JobSort = JobSort.NEWEST,
+) -> Response:
+    """
+    Возвращает страницу вакансий, по умолчанию начиная с самых новых.
+
+    `sort=salary`/`sort=-salary` упорядочивает по минимальной зарплате и
+    оставляет только вакансии, где она указана; суммы в разных валютах
+    несравнимы, поэтому такая сортировка требует `salary_currency`.
+
+    Курсор следующей страницы передаётся в заголовке `X-Next-Cursor`; если
+    заголовка нет, это последняя страница. Ответы кэшируются и поддерживают
+    `ETag`/`If-None-Match`.
+    """
+
+    async def load() -> tuple[list[dict[str, Any]], dict[str, str]]:
+        rows, next_cursor = await job_service.get_jobs_page(
+            limit,
+            JOB_RESPONSE_FIELDS,
+            cursor=cursor,
+            filters=filters,
+            sort=sort,
+        )
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+        return rows, headers
+
+    return await cached_response(request, load)
+
+
+@router.get("/jobs/export", response_class=StreamingResponse)
+async def export_jobs(
+    job_service: Annotated[JobService, Depends(get_job_service)],
+    filters: Annotated[JobFilters, Depends(get_job_filters)],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+) -> StreamingResponse:
+    """
+    Выгружает все вакансии потоком в формате NDJSON или CSV.
+
+    Вакансии читаются из базы порциями, поэтому память не растёт с размером таблицы.
+    """
+    chunks = job_service.iter_job_chunks(JOB_RESPONSE_FIELDS, filters)
+    stream = stream_csv(chunks) if export_format is ExportFormat.CSV else stream_ndjson(chunks)
+    return StreamingResponse(
+        stream,
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="jobs.{export_format}"'},
+    )
+
+
+@router.get("/jobs/search", response_model=list[JobResponse])
+async def search_jobs(
+    request: Request,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
     job_service: Annotated[JobService, Depends(get_job_service)],
-) -> list[JobResponse]:
+    limit: Annotated[int, Query(ge=1, le=200)] = 50,
+    offset: Annotated[int, Query(ge=0)] = 0,
+) -> Response:
     """
-    Возвращает список всех вакансий.
+    Ищет вакансии по названию и описанию, самые релевантные первыми.
     """
-    jobs = await job_service.get_all_jobs()
-    return [JobResponse.model_validate(job) for job in jobs]
 
+    async def load() -> tuple[list[dict[str, Any]], dict[str, str]]:
+        rows = await job_service.search_jobs(q, JOB_RESPONSE_FIELDS, limit=limit, offset=offset)
+        return rows, {}
+
+    return await cached_response(request, load)
 
-@router.get("/jobs/{job_id}")
+
+@router.get("/jobs/stream", response_class=StreamingResponse)
+async def stream_jobs(
+    job_service: Annotated[JobService, Depends(get_job_service)],
+    cursor: Annotated[int | None, Query(ge=0)] = None,
+    last_event_id: Annotated[int | None, Header(ge=0)] = None,
+) -> StreamingResponse:
+    """
+    Передаёт новые вакансии по мере их добавления как server-sent events.
+
+    Каждая вакансия приходит событием `job` с ID вакансии в поле `id`.
+    Чтобы продолжить поток после разрыва, передайте ID последней полученной
+    вакансии в `cursor` или в заголовке `Last-Event-ID` (его `EventSource`
+    отправляет сам); без них приходят только вакансии, добавленные после
+    подключения. В процессе без планировщика новые вакансии читаются из базы
+    после 30 секунд затишья, поэтому приходят с такой задержкой.
+    """
+    after_id = last_event_id if last_event_id is not None else cursor
+    return StreamingResponse(
+        stream_sse(job_service.stream_new_jobs(after_id)),
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
 async def get_job_by_id(
+    request: Request,
     job_id: int,
     job_service: Annotated[JobService, Depends(get_job_service)],
-) -> JobResponse:
+) -> Response:
     """
     Возвращает детали конкретной вакансии по её ID.
     """
-    job = await job_service.get_job_by_id(job_id)
-    return JobResponse.model_validate(job)
+
+    async def load() -> tuple[JobResponse, dict[str, str]]:
+        job = await job_service.get_job_by_id(job_id)
+        return JobResponse.model_validate(job), {}
+
+    return await cached_response(request, load)
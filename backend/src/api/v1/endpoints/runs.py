@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from src.api.dependencies import get_job_service
+from src.api.schemas import TaskRunResponse
+from src.core.services import JobService
+
+router = APIRouter()
+
+
+@router.get("/runs", response_model=list[TaskRunResponse])
+async def get_runs(
+    job_service: Annotated[JobService, Depends(get_job_service)],
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+    task: str | None = None,
+) -> list[TaskRunResponse]:
+    """
+    Возвращает историю запусков задач планировщика, начиная с последних:
+    длительность, число страниц и вакансий, ошибки и время каждого этапа
+    (загрузка, разбор, дедупликация, запись).
+    """
+    runs = await job_service.get_runs(limit=limit, task=task)
+    return [TaskRunResponse.model_validate(run) for run in runs]
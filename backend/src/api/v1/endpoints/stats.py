@@ -0,0 +1,32 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from src.api.caching import cached_response
+from src.api.dependencies import get_job_service
+from src.api.schemas import StatsResponse
+from src.core.services import JobService
+
+router = APIRouter()
+
+
+@router.get("/stats", response_model=StatsResponse)
+async def get_stats(
+    request: Request,
+    job_service: Annotated[JobService, Depends(get_job_service)],
+    companies: Annotated[int, Query(ge=1, le=100)] = 20,
+    days: Annotated[int, Query(ge=1, le=365)] = 30,
+) -> Response:
+    """
+    Возвращает статистику для дашборда: число вакансий, компании с наибольшим
+    числом вакансий, новые вакансии по дням и распределение зарплат.
+
+    Статистика читается из счётчиков, которые обновляются при сохранении
+    вакансий, поэтому запрос не сканирует таблицу вакансий.
+    """
+
+    async def load() -> tuple[StatsResponse, dict[str, str]]:
+        stats = await job_service.get_stats(companies_limit=companies, days=days)
+        return StatsResponse.model_validate(stats), {}
+
+    return await cached_response(request, load)
@@ -1,7 +1,8 @@
+import importlib.util
 from pathlib import Path
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from src.utils.notify_logger.config import LoggerConfig
 
@@ -88,6 +89,89 @@ class ApiConfig(BaseModel):
     port: int = 8000
 
 
+class HttpClientConfig(BaseModel):
+    """
+    Configuration settings for the shared HTTP client used to fetch sources.
+
+    Attributes:
+        max_connections (int): The maximum number of concurrent connections.
+        max_keepalive_connections (int): The maximum number of idle
+         connections kept in the pool.
+        keepalive_expiry (float): Seconds an idle connection is kept alive.
+        timeout (float): The default timeout for reads, writes and pool
+         acquisition, in seconds.
+        connect_timeout (float): The timeout for establishing a connection,
+         in seconds.
+        http2 (bool): Whether to enable HTTP/2. Requires the `h2` package,
+         installed with `httpx[http2]`; enabling it without raises a
+         validation error.
+        user_agent (str): The `User-Agent` header sent with every request.
+    """
+
+    max_connections: int = 10
+    max_keepalive_connections: int = 5
+    keepalive_expiry: float = 30.0
+    timeout: float = 10.0
+    connect_timeout: float = 5.0
+    http2: bool = False
+    user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"  # noqa: E501
+
+    @field_validator("http2")
+    @classmethod
+    def check_h2_installed(cls, http2: bool) -> bool:  # noqa: FBT001
+        if http2 and importlib.util.find_spec("h2") is None:
+            msg = "http2 requires the h2 package. Please install it with 'uv add \"httpx[http2]\"'"
+            raise ValueError(msg)
+        return http2
+
+
+class IngestionConfig(BaseModel):
+    """
+    Configuration settings for crawling job sources.
+
+    Attributes:
+        max_concurrent_fetches (int): The maximum number of requests in flight
+         across all job sources at once.
+        parser_executor (str): Where listing pages are parsed: in worker
+         processes ("process"), worker threads ("thread", worthwhile for
+         lxml-based parsers, which release the GIL) or in the event loop
+         ("inline").
+        parser_workers (Optional[int]): The number of parser workers, the
+         number of CPUs if omitted.
+        max_retries (int): How many times a failed fetch is retried.
+        retry_backoff (float): The base of the exponential retry backoff, in
+         seconds.
+        retry_backoff_max (float): The maximum delay between retries, in
+         seconds, including delays requested with `Retry-After`.
+        circuit_failure_threshold (int): The number of consecutive failed
+         fetches after which a host is no longer requested.
+        circuit_reset_timeout (float): Seconds a host is left alone before it
+         is tried again.
+    """
+
+    max_concurrent_fetches: int = 8
+    parser_executor: Literal["process", "thread", "inline"] = "process"
+    parser_workers: int | None = None
+    max_retries: int = 3
+    retry_backoff: float = 1.0
+    retry_backoff_max: float = 60.0
+    circuit_failure_threshold: int = 5
+    circuit_reset_timeout: float = 300.0
+
+
+class SchedulerConfig(BaseModel):
+    """
+    Configuration settings for the scheduler of the ingestion runs.
+
+    Attributes:
+        enabled (bool): Whether this process runs the scheduler. With several
+         API workers, it can be left on in one of them only; the ingestion
+         runs of a source never overlap across processes anyway.
+    """
+
+    enabled: bool = True
+
+
 class BackendConfig(BaseModel):
     """
     Overall backend application configuration.
@@ -98,11 +182,20 @@ class BackendConfig(BaseModel):
         database (DatabaseConfig): Configuration settings for the database
         connection.
         api (ApiConfig): Configuration settings for the API server.
+        http_client (HttpClientConfig): Configuration settings for the shared
+        HTTP client.
+        ingestion (IngestionConfig): Configuration settings for crawling job
+        sources.
+        scheduler (SchedulerConfig): Configuration settings for the scheduler
+        of the ingestion runs.
     """
 
     logger: LoggerConfig = Field(default_factory=LoggerConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     api: ApiConfig = Field(default_factory=ApiConfig)
+    http_client: HttpClientConfig = Field(default_factory=HttpClientConfig)
+    ingestion: IngestionConfig = Field(default_factory=IngestionConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
 
 
 class MainConfig(BaseModel):
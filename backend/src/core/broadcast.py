@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from src.db.models import Job
+
+
+class JobSubscription:
+    """
+    The queue of new jobs delivered to one subscriber.
+
+    The queue is bounded, so a subscriber that cannot keep up does not make
+    memory grow: once it is full, further jobs are dropped and the
+    subscription is marked as lagging, telling the subscriber to catch up
+    from the database instead.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """
+        Initializes an empty subscription.
+
+        Args:
+            maxsize: The maximum number of undelivered batches of jobs.
+        """
+        self._queue: asyncio.Queue[list[Job]] = asyncio.Queue(maxsize=maxsize)
+        self.lagging = False
+
+    def put(self, jobs: list[Job]) -> None:
+        """Queues a batch of new jobs without waiting, or marks the subscription as lagging."""
+        if self.lagging:
+            return
+        try:
+            self._queue.put_nowait(jobs)
+        except asyncio.QueueFull:
+            self.lagging = True
+
+    async def get(self, timeout: float) -> list[Job] | None:
+        """
+        Waits for the next batch of new jobs.
+
+        Args:
+            timeout: Seconds to wait before giving up.
+
+        Returns:
+            The batch, or None if no job arrived in time.
+        """
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except TimeoutError:
+            return None
+
+    def reset(self) -> None:
+        """Drops the undelivered jobs and clears the lagging mark, once caught up."""
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self.lagging = False
+
+
+class JobBroadcaster:
+    """
+    Fans new jobs out to the subscribers of the job stream.
+
+    The ingestion pipeline publishes every batch of jobs it inserts, and each
+    subscriber receives it through its own bounded queue. The IDs of the
+    recently published jobs are remembered, so a job inserted by two
+    overlapping crawls is delivered once.
+    """
+
+    def __init__(self, queue_size: int = 100, recent_size: int = 1000) -> None:
+        """
+        Initializes a broadcaster without subscribers.
+
+        Args:
+            queue_size: The maximum number of undelivered batches per subscriber.
+            recent_size: The number of published job IDs remembered.
+        """
+        self.queue_size = queue_size
+        self.recent_size = recent_size
+        self._subscriptions: set[JobSubscription] = set()
+        self._recent_ids: OrderedDict[int, None] = OrderedDict()
+
+    @property
+    def has_subscribers(self) -> bool:
+        """Whether anybody is listening, i.e. whether publishing is worth the work."""
+        return bool(self._subscriptions)
+
+    @contextmanager
+    def subscribe(self) -> Iterator[JobSubscription]:
+        """
+        Subscribes to the new jobs for the duration of the `with` block.
+
+        Yields:
+            The subscription receiving the jobs published meanwhile.
+        """
+        subscription = JobSubscription(self.queue_size)
+        self._subscriptions.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, jobs: list[Job]) -> None:
+        """
+        Delivers newly inserted jobs to every subscriber.
+
+        Args:
+            jobs: The new jobs, in ascending order of ID.
+        """
+        fresh = [job for job in jobs if job.id not in self._recent_ids]
+        if not fresh:
+            return
+        for job in fresh:
+            self._recent_ids[job.id] = None
+        while len(self._recent_ids) > self.recent_size:
+            self._recent_ids.popitem(last=False)
+
+        for subscription in self._subscriptions:
+            subscription.put(fresh)
+
+
+# Broadcaster of the jobs inserted by the ingestion pipeline
+job_broadcaster = JobBroadcaster()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+
+class TTLCache[V]:
+    """
+    In-process cache with a time-to-live and a least-recently-used size bound.
+
+    The cache carries a `version` string that changes on every invalidation,
+    so a loader can tell whether the data it read was invalidated meanwhile.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes the cache.
+
+        Args:
+            maxsize: The maximum number of entries kept.
+            ttl: Seconds an entry stays valid after being stored.
+            clock: The monotonic clock used for expiry.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._instance_id = uuid4().hex[:12]
+        self._generation = 0
+
+    @property
+    def version(self) -> str:
+        """An identifier of the current cached data generation."""
+        return f"{self._instance_id}-{self._generation}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> V | None:
+        """
+        Returns the cached value, or None if it is missing or expired.
+
+        Args:
+            key: The cache key.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """
+        Stores a value, evicting the least recently used entries if full.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+        """
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def get_or_set(self, key: Hashable, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        Returns the cached value, loading and storing it on a miss.
+
+        A value loaded while the cache was invalidated is returned but not
+        stored, so data read before a write never outlives that write.
+
+        Args:
+            key: The cache key.
+            loader: Produces the value on a cache miss.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        version = self.version
+        value = await loader()
+        if version == self.version:
+            self.set(key, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drops every entry and moves the cache to a new version."""
+        self._entries.clear()
+        self._generation += 1
+
+
+# Cache of job API responses, invalidated whenever jobs are written
+job_cache: TTLCache[Any] = TTLCache()
@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from loguru import logger
+
+from src.config.config import IngestionConfig
+from src.core.metrics import http_fetch_seconds, http_fetches
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# Responses worth retrying: the host is overloaded or temporarily broken
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the host's circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        """
+        Initializes the error.
+
+        Args:
+            host: The host whose circuit is open.
+            retry_in: Seconds until the circuit lets a trial request through.
+        """
+        super().__init__(f"Circuit for {host} is open, retry in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class TokenBucket:
+    """
+    A token bucket limiting the rate of requests.
+
+    Tokens are refilled at `rate` per second up to `capacity`. A caller
+    finding the bucket empty takes a token on credit and sleeps until it
+    would have been refilled, so concurrent callers queue up fairly.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        """
+        Initializes a full bucket.
+
+        Args:
+            rate: The number of tokens added per second.
+            capacity: The maximum number of tokens, i.e. the allowed burst.
+            clock: The monotonic clock used to refill the bucket.
+            sleep: The coroutine function used to wait for a token.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = capacity
+        self._updated_at = clock()
+
+    async def acquire(self) -> None:
+        """Takes a token, waiting until one is available."""
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+        # Taken before sleeping, so the next caller waits for the token after it
+        self._tokens -= 1
+        if self._tokens < 0:
+            await self._sleep(-self._tokens / self.rate)
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker guarding a single host.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are refused for `reset_timeout` seconds. Then a single trial
+    request is let through: its success closes the circuit, its failure opens
+    it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes a closed circuit.
+
+        Args:
+            failure_threshold: The number of consecutive failures opening the circuit.
+            reset_timeout: Seconds the circuit stays open.
+            clock: The monotonic clock used to time the open state.
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently refused."""
+        return self.retry_in() > 0 or self._trial_in_flight
+
+    def retry_in(self) -> float:
+        """Returns the seconds left until a trial request is allowed, 0 if closed."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def before_request(self, host: str) -> bool:
+        """
+        Checks that a request may be sent.
+
+        Args:
+            host: The host, for the error message.
+
+        Returns:
+            Whether the request is the trial of a half-open circuit, to be
+            passed to `end_request`.
+
+        Raises:
+            CircuitOpenError: If the circuit is open.
+        """
+        if self._opened_at is None:
+            return False
+        if self.is_open:
+            raise CircuitOpenError(host, self.retry_in())
+        # Half-open: this request is the trial, the others are refused meanwhile
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Closes the circuit and resets the failure count."""
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Counts a failure, opening the circuit if the threshold is reached."""
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+
+    def end_request(self, trial: bool) -> None:  # noqa: FBT001
+        """
+        Releases the trial slot once the trial request is over, however it ended.
+
+        A trial request that was cancelled or failed with an unexpected error
+        records no outcome; without this the circuit would stay half-open with
+        a trial in flight forever, refusing every later request. Requests
+        already in flight when the circuit went half-open are not the trial
+        and leave the slot alone.
+
+        Args:
+            trial: What `before_request` returned for the request.
+        """
+        if trial:
+            self._trial_in_flight = False
+
+
+class Fetcher:
+    """
+    Fetches source pages politely and resiliently over the shared HTTP client.
+
+    Every request:
+
+    * is refused at once while its host's circuit breaker is open;
+    * waits for a token of its host's rate limit;
+    * waits for a slot in the budget shared by all sources, taken only once
+      the token is there, so a throttled host does not hold slots idle;
+    * is retried on network errors, 429 and 5xx responses with jittered
+      exponential backoff, honouring `Retry-After`.
+
+    Rate limits and circuit breakers are per host and live as long as the
+    fetcher, so they carry over from one ingestion run to the next.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        config: IngestionConfig | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Initializes the fetcher.
+
+        Args:
+            client: The shared HTTP client.
+            config: The ingestion configuration, the defaults if omitted.
+            clock: The monotonic clock used by rate limits and circuit breakers.
+            sleep: The coroutine function used to wait between retries.
+            rng: The random generator used for backoff jitter.
+        """
+        self.client = client
+        self.config = config or IngestionConfig()
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()  # noqa: S311  jitter, not cryptography
+        self._budget = asyncio.Semaphore(self.config.max_concurrent_fetches)
+        self._buckets: dict[str, TokenBucket] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """Returns the circuit breaker of a host, creating it on first use."""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                self.config.circuit_failure_threshold,
+                self.config.circuit_reset_timeout,
+                clock=self._clock,
+            )
+            self._breakers[host] = breaker
+        return breaker
+
+    async def get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        rate: float | None = None,
+    ) -> httpx.Response:
+        """
+        Sends a GET request, retrying transient failures.
+
+        Args:
+            url: The URL to fetch.
+            params: The query parameters.
+            headers: The request headers.
+            rate: The maximum number of requests per second to the URL's host,
+                unlimited if None. The first rate given for a host is kept.
+
+        Returns:
+            A successful (2xx) or `304 Not Modified` response.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open.
+            httpx.HTTPStatusError: If the response is an error once retries are exhausted.
+            httpx.RequestError: If the request fails once retries are exhausted.
+        """
+        host = httpx.URL(url).host
+        breaker = self.breaker(host)
+        bucket = self._bucket(host, rate)
+
+        attempt = 0
+        while True:
+            trial = breaker.before_request(host)
+            try:
+                if bucket is not None:
+                    await bucket.acquire()
+                async with self._budget:
+                    with http_fetch_seconds.time(host=host):
+                        response = await self.client.get(url, params=params, headers=headers)
+            except httpx.RequestError as e:
+                http_fetches.inc(host=host, status="error")
+                breaker.record_failure()
+                if attempt >= self.config.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    "Request to {url} failed ({error}), retry {attempt} in {delay:.1f}s",
+                    url=url,
+                    error=e,
+                    attempt=attempt + 1,
+                    delay=delay,
+                )
+            else:
+                http_fetches.inc(host=host, status=str(response.status_code))
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    # Any other answer, even a 404, means the host is up
+                    breaker.record_success()
+                    if response.is_error:
+                        response.raise_for_status()
+                    return response
+
+                breaker.record_failure()
+                if attempt >= self.config.max_retries:
+                    response.raise_for_status()
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                logger.warning(
+                    "{url} answered {status}, retry {attempt} in {delay:.1f}s",
+                    url=url,
+                    status=response.status_code,
+                    attempt=attempt + 1,
+                    delay=delay,
+                )
+            finally:
+                breaker.end_request(trial)
+
+            attempt += 1
+            await self._sleep(delay)
+
+    def _bucket(self, host: str, rate: float | None) -> TokenBucket | None:
+        bucket = self._buckets.get(host)
+        if bucket is None and rate:
+            bucket = TokenBucket(rate, clock=self._clock, sleep=self._sleep)
+            self._buckets[host] = bucket
+        return bucket
+
+    def _backoff(self, attempt: int) -> float:
+        """Returns a "full jitter" exponential backoff delay for the attempt."""
+        ceiling = min(self.config.retry_backoff_max, self.config.retry_backoff * 2**attempt)
+        return self._rng.uniform(0, ceiling)
+
+    def _retry_after(self, response: httpx.Response) -> float | None:
+        """Returns the delay requested by `Retry-After`, capped by the maximum backoff."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=UTC)
+            delay = (retry_at - datetime.now(UTC)).total_seconds()
+        return min(max(delay, 0.0), self.config.retry_backoff_max)
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from src.config.config import HttpClientConfig
+
+
+def create_http_client(
+    config: HttpClientConfig,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Creates a pooled HTTP client for fetching job sources.
+
+    The client is meant to be long-lived: one instance is created at
+    application startup, shared by all fetches, and closed on shutdown.
+
+    Args:
+        config: The HTTP client configuration.
+        transport: An optional custom transport, e.g. `httpx.MockTransport`.
+
+    Returns:
+        The configured HTTP client.
+
+    """
+    return httpx.AsyncClient(
+        headers={"User-Agent": config.user_agent},
+        follow_redirects=True,
+        http2=config.http2,
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(config.timeout, connect=config.connect_timeout),
+        transport=transport,
+    )
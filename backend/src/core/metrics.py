@@ -0,0 +1,283 @@
+"""
+In-process metrics exposed in the Prometheus text format.
+
+A deliberately small registry of counters, gauges and histograms, enough for
+the `/metrics` endpoint without an external client library or a running
+Prometheus to test against. Metrics are updated from the event loop, where
+updates never interleave.
+
+The instruments of the hot paths are defined here, so every module records
+into the same registry:
+
+* HTTP fetches per host and status, and their latency per host;
+* parse time per page and parser;
+* `JobRepository` query latency per method;
+* scheduler lag between the planned and actual start of a run, and runs
+  skipped as too late or overlapping a running one.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+# Latency buckets in seconds, from a cache hit to a slow crawl page
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = tuple[str, ...]
+
+
+class Metric:
+    """The name, help text and label names shared by all metric kinds."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        """
+        Initializes the metric.
+
+        Args:
+            name: The metric name, such as `http_fetches_total`.
+            documentation: The help text.
+            labelnames: The names of the labels every sample carries.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        if labels.keys() != set(self.labelnames):
+            msg = f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            raise ValueError(msg)
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _format_labels(self, values: LabelValues, extra: dict[str, str] | None = None) -> str:
+        pairs = list(zip(self.labelnames, values, strict=True))
+        if extra:
+            pairs.extend(extra.items())
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def samples(self) -> Iterator[str]:
+        """Yields the sample lines of the metric."""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        """Returns the metric in the Prometheus text format."""
+        lines = [
+            f"# HELP {self.name} {_escape_help(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """A value that only goes up, such as a number of requests."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increases the counter of the given labels.
+
+        Args:
+            amount: The non-negative increase.
+            **labels: The value of every label.
+        """
+        key = self._label_values(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Returns the current value for the given labels, 0 if never increased."""
+        return self._values.get(self._label_values(labels), 0)
+
+    def samples(self) -> Iterator[str]:
+        for key, value in sorted(self._values.items()):
+            yield f"{self.name}{self._format_labels(key)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    """A value read when the metrics are collected, such as a queue depth."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, callback: Callable[[], float]) -> None:
+        """
+        Initializes the gauge.
+
+        Args:
+            name: The metric name.
+            documentation: The help text.
+            callback: Returns the current value.
+        """
+        super().__init__(name, documentation)
+        self._callback = callback
+
+    def samples(self) -> Iterator[str]:
+        yield f"{self.name} {_format_value(self._callback())}"
+
+
+class CallbackCounter(Gauge):
+    """A counter kept by another object and read when the metrics are collected."""
+
+    kind = "counter"
+
+
+class Histogram(Metric):
+    """Observations counted in cumulative buckets, such as request latencies."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Initializes the histogram.
+
+        Args:
+            name: The metric name.
+            documentation: The help text.
+            labelnames: The names of the labels every sample carries.
+            buckets: The upper bounds of the buckets, in ascending order.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        # Per label values: the count of every bucket (the last one is +Inf), and the sum
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Records an observation.
+
+        Args:
+            value: The observed value.
+            **labels: The value of every label.
+        """
+        key = self._label_values(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observes the duration of the `with` block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Returns the number of observations for the given labels."""
+        return sum(self._counts.get(self._label_values(labels), ()))
+
+    def samples(self) -> Iterator[str]:
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                le = {"le": _format_value(bound)}
+                yield f"{self.name}_bucket{self._format_labels(key, le)} {cumulative}"
+            yield f"{self.name}_sum{self._format_labels(key)} {_format_value(self._sums[key])}"
+            yield f"{self.name}_count{self._format_labels(key)} {cumulative}"
+
+
+class MetricsRegistry:
+    """The metrics of the process, rendered together for `/metrics`."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register[M: Metric](self, metric: M) -> M:
+        """
+        Adds a metric to the registry.
+
+        Args:
+            metric: The metric to add.
+
+        Returns:
+            The same metric, for assignment at definition.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if metric.name in self._metrics:
+            msg = f"Metric '{metric.name}' is already registered"
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        """Removes a metric from the registry, if present."""
+        self._metrics.pop(name, None)
+
+    def render(self) -> str:
+        """Returns all metrics in the Prometheus text format."""
+        return "".join(metric.render() for metric in self._metrics.values())
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# Registry of the process metrics served at /metrics
+metrics = MetricsRegistry()
+
+http_fetches = metrics.register(
+    Counter("http_fetches_total", "HTTP fetches of job sources.", ("host", "status")),
+)
+http_fetch_seconds = metrics.register(
+    Histogram("http_fetch_seconds", "Latency of HTTP fetches of job sources.", ("host",)),
+)
+parser_page_seconds = metrics.register(
+    Histogram("parser_page_seconds", "Time to parse a listing page.", ("parser",)),
+)
+db_query_seconds = metrics.register(
+    Histogram("db_query_seconds", "Latency of job repository queries.", ("operation",)),
+)
+scheduler_lag_seconds = metrics.register(
+    Histogram(
+        "scheduler_job_lag_seconds",
+        "Delay between the planned and actual start of a scheduled run.",
+        ("job",),
+    ),
+)
+scheduler_skipped_runs = metrics.register(
+    Counter(
+        "scheduler_skipped_runs_total",
+        "Scheduled runs skipped as too late (misfire) or still running (overlap).",
+        ("job", "reason"),
+    ),
+)
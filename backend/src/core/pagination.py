@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from src.core.schemas import JobSort
+
+
+def encode_cursor(position: datetime | int, job_id: int) -> str:
+    """
+    Encodes a keyset pagination position into an opaque cursor.
+
+    Args:
+        position: The sort key of the last job on the page: its creation time
+            or its minimum salary.
+        job_id: The ID of the last job on the page.
+
+    Returns:
+        A URL-safe cursor string.
+    """
+    value = position.isoformat() if isinstance(position, datetime) else position
+    payload = json.dumps([value, job_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: JobSort = JobSort.NEWEST) -> tuple[datetime | int, int]:
+    """
+    Decodes a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: The cursor string.
+        sort: The order of the listing the cursor belongs to.
+
+    Returns:
+        The (sort key, id) position.
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another order.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, job_id = json.loads(base64.urlsafe_b64decode(padded))
+        if sort is JobSort.NEWEST:
+            return datetime.fromisoformat(value), int(job_id)
+        if not isinstance(value, int):
+            raise TypeError(value)
+        return value, int(job_id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        msg = f"Invalid cursor: {cursor}"
+        raise ValueError(msg) from e
@@ -1,3 +1,4 @@
 from .base import BaseParser
+from .pool import ParserPool
 
-__all__ = ["BaseParser"]
+__all__ = ["BaseParser", "ParserPool"]
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+from lxml import etree
+from pydantic import HttpUrl, ValidationError
+
+from src.core.schemas import JobSchema
+from src.utils.notify_logger.logger import logger
+
+from .base import BaseParser
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def _first_by_class(tag: str, class_name: str) -> str:
+    """Builds an XPath to the first descendant `tag` having the `class_name` class token."""
+    return f"(.//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')])[1]"
+
+
+_TITLE_LINK = etree.XPath(_first_by_class("a", "vacancy-card__title-link"))
+_COMPANY_LINK = etree.XPath(f"({_first_by_class('div', 'vacancy-card__company-title')}//a)[1]")
+_SALARY = etree.XPath(_first_by_class("div", "vacancy-card__salary-value"))
+_LOCATION = etree.XPath(f"({_first_by_class('div', 'vacancy-card__meta')}//span)[1]")
+_DESCRIPTION = etree.XPath(_first_by_class("div", "vacancy-card__description"))
+_TEXT = etree.XPath("string()")
+
+
+class HabrLxmlParser(BaseParser):
+    """
+    A streaming parser for job listings from career.habr.com.
+
+    Produces the same results as `HabrParser`, but walks the page with lxml's
+    incremental HTML parser and precompiled XPath selectors instead of building
+    a full BeautifulSoup tree. Processed cards are freed as soon as they are
+    parsed, so memory stays flat on very large pages.
+    """
+
+    BASE_URL = "https://career.habr.com"
+
+    def parse(self, content: str) -> list[JobSchema]:
+        """
+        Parses the HTML content of a habr job listing page.
+
+        Args:
+            content: The HTML content of the page.
+
+        Returns:
+            A list of JobSchema objects.
+        """
+        return list(self.iter_jobs(content))
+
+    def iter_jobs(self, content: str) -> Iterator[JobSchema]:
+        """
+        Yields jobs one by one while the page is being parsed.
+
+        Args:
+            content: The HTML content of the page.
+
+        Yields:
+            JobSchema objects in page order.
+        """
+        if not content.strip():
+            return
+
+        events = etree.iterparse(
+            BytesIO(content.encode("utf-8")),
+            events=("end",),
+            tag="div",
+            html=True,
+            encoding="utf-8",
+            recover=True,
+        )
+        try:
+            for _, element in events:
+                if "vacancy-card" not in element.get("class", "").split():
+                    continue
+
+                job = self._parse_job_card(element)
+                if job:
+                    yield job
+
+                # Free the processed card and everything parsed before it
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                while parent is not None and element.getprevious() is not None:
+                    del parent[0]
+        except etree.XMLSyntaxError as e:
+            logger.debug("Error parsing Habr page", exception=e)
+
+    def _parse_job_card(self, card: etree._Element) -> JobSchema | None:
+        """
+        Parses a single job card from the page.
+
+        Args:
+            card: An lxml element representing a single job card.
+
+        Returns:
+            A JobSchema object or None if parsing fails.
+        """
+        title_tag = self._first(_TITLE_LINK, card)
+        if title_tag is None:
+            return None
+
+        try:
+            return JobSchema(
+                title=_TEXT(title_tag),
+                url=HttpUrl(f"{self.BASE_URL}{title_tag.get('href', '')}"),
+                company=self._text_or_none(_COMPANY_LINK, card),
+                salary=self._text_or_none(_SALARY, card),
+                location=self._text_or_none(_LOCATION, card),
+                description=self._text_or_none(_DESCRIPTION, card),
+            )
+        except ValidationError as e:
+            logger.debug(
+                "Error parsing job card",
+                exception=e,
+                details=f"Card HTML: {etree.tostring(card, encoding='unicode')}",
+            )
+            return None
+
+    @staticmethod
+    def _first(selector: etree.XPath, card: etree._Element) -> etree._Element | None:
+        found = selector(card)
+        return found[0] if found else None
+
+    def _text_or_none(self, selector: etree.XPath, card: etree._Element) -> str | None:
+        element = self._first(selector, card)
+        return None if element is None else _TEXT(element).strip()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import get_context
+from typing import TYPE_CHECKING
+
+from src.core.metrics import parser_page_seconds
+from src.core.schemas import JobSchema
+
+if TYPE_CHECKING:
+    from src.config.config import IngestionConfig
+
+    from .base import BaseParser
+
+# The order of the fields in the compact job rows sent back by the workers
+JOB_FIELDS = ("title", "url", "company", "salary", "location", "description")
+
+JobRow = tuple[str, str, str | None, str | None, str | None, str | None]
+
+
+def parse_rows(parser: BaseParser, content: str) -> list[JobRow]:
+    """
+    Parses a page into compact job rows.
+
+    Runs in a pool worker: rows are plain tuples, which are much cheaper to
+    send back to the event loop process than pydantic models.
+
+    Args:
+        parser: The parser for the page.
+        content: The HTML content of the page.
+
+    Returns:
+        One row per job, with the values in `JOB_FIELDS` order.
+    """
+    return [
+        (job.title, str(job.url), job.company, job.salary, job.location, job.description)
+        for job in parser.parse(content)
+    ]
+
+
+class ParserPool:
+    """
+    Runs page parsing off the event loop.
+
+    Parsing HTML is CPU-bound, so running it in the event loop stalls API
+    requests for the whole duration of an ingestion run. The pool hands raw
+    pages to worker processes (or threads) and turns the returned rows back
+    into `JobSchema` objects. Without an executor, pages are parsed inline.
+    """
+
+    def __init__(self, executor: Executor | None = None) -> None:
+        """
+        Initializes the pool.
+
+        Args:
+            executor: The executor running the parsers, or None to parse in
+                the calling thread.
+        """
+        self._executor = executor
+
+    @classmethod
+    def from_config(cls, config: IngestionConfig) -> ParserPool:
+        """
+        Creates the pool described by the ingestion configuration.
+
+        Args:
+            config: The ingestion configuration.
+
+        Returns:
+            The configured pool.
+        """
+        executor: Executor | None = None
+        if config.parser_executor == "process":
+            # Spawned workers do not inherit the event loop, sockets or DB connections
+            executor = ProcessPoolExecutor(
+                max_workers=config.parser_workers,
+                mp_context=get_context("spawn"),
+            )
+        elif config.parser_executor == "thread":
+            executor = ThreadPoolExecutor(
+                max_workers=config.parser_workers,
+                thread_name_prefix="parser",
+            )
+        return cls(executor)
+
+    async def parse(self, parser: BaseParser, content: str) -> list[JobSchema]:
+        """
+        Parses a page without blocking the event loop.
+
+        Several pages can be parsed at once, one per worker.
+
+        Args:
+            parser: The parser for the page. It must be picklable when the
+                pool runs worker processes.
+            content: The HTML content of the page.
+
+        Returns:
+            The jobs found on the page.
+        """
+        with parser_page_seconds.time(parser=type(parser).__name__):
+            if self._executor is None:
+                return parser.parse(content)
+
+            loop = asyncio.get_running_loop()
+            rows = await loop.run_in_executor(self._executor, parse_rows, parser, content)
+            return [
+                JobSchema.model_validate(dict(zip(JOB_FIELDS, row, strict=True))) for row in rows
+            ]
+
+    def shutdown(self) -> None:
+        """Stops the workers, waiting for the pages being parsed."""
+        if self._executor is not None:
+            self._executor.shutdown()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class RunStage(StrEnum):
+    """The stages every page of an ingestion run goes through."""
+
+    FETCH = "fetch"
+    PARSE = "parse"
+    DEDUPE = "dedupe"
+    WRITE = "write"
+
+
+class RunStatus(StrEnum):
+    """The states of a recorded task run."""
+
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class RunReport:
+    """
+    The counters and stage timings of one ingestion run, filled in as it goes.
+
+    The time of a stage is summed over all pages, and pages are processed
+    concurrently, so the stage times may add up to more than the run took.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Initializes an empty report.
+
+        Args:
+            clock: The clock used to time the stages.
+        """
+        self._clock = clock
+        self.pages = 0
+        self.jobs_parsed = 0
+        self.jobs_created = 0
+        self.jobs_updated = 0
+        self.errors = 0
+        self.stage_seconds = dict.fromkeys(RunStage, 0.0)
+
+    @contextmanager
+    def stage(self, stage: RunStage) -> Iterator[None]:
+        """Adds the time spent in the `with` block to the stage."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.stage_seconds[stage] += self._clock() - start
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+
+class SalaryRange(NamedTuple):
+    """A salary parsed into numeric bounds; unknown parts are None."""
+
+    min: int | None
+    max: int | None
+    currency: str | None
+
+
+EMPTY_SALARY = SalaryRange(None, None, None)
+
+# Currency symbols and words as written on job boards, with their ISO 4217 codes
+_CURRENCIES = {
+    "₽": "RUB",
+    "руб": "RUB",
+    "rub": "RUB",
+    "$": "USD",
+    "usd": "USD",
+    "€": "EUR",
+    "eur": "EUR",
+    "₸": "KZT",
+    "kzt": "KZT",
+    "£": "GBP",
+    "gbp": "GBP",
+}
+_CURRENCY = re.compile(
+    "|".join(re.escape(token) for token in sorted(_CURRENCIES, key=len, reverse=True)),
+)
+# Digits grouped by spaces, including the non-breaking and thin ones
+_NUMBER = re.compile(r"\d+(?:[ \u00a0\u2009\u202f]\d{3})*")
+_FROM = re.compile(r"\bот\b|\bfrom\b")
+_TO = re.compile(r"\bдо\b|\bup to\b|\bto\b")
+
+
+def parse_salary(text: str | None) -> SalaryRange:
+    """
+    Parses a free-form salary such as "от 200 000 до 300 000 ₽" or "$5000 - $7000".
+
+    A single amount is taken as both bounds unless it is introduced by
+    "от"/"from" (lower bound only) or "до"/"up to" (upper bound only).
+
+    Args:
+        text: The salary as shown on the job board.
+
+    Returns:
+        The parsed range, with all parts None if the text has no amount.
+    """
+    if not text:
+        return EMPTY_SALARY
+    lowered = text.lower()
+    amounts = [int(re.sub(r"\D", "", number)) for number in _NUMBER.findall(lowered)]
+    if not amounts:
+        return EMPTY_SALARY
+
+    currency_match = _CURRENCY.search(lowered)
+    currency = _CURRENCIES[currency_match.group()] if currency_match else None
+
+    if len(amounts) >= 2:  # noqa: PLR2004
+        low, high = sorted(amounts[:2])
+        return SalaryRange(low, high, currency)
+    (amount,) = amounts
+    if _FROM.search(lowered):
+        return SalaryRange(amount, None, currency)
+    if _TO.search(lowered):
+        return SalaryRange(None, amount, currency)
+    return SalaryRange(amount, amount, currency)
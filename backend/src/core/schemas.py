@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+from datetime import datetime  # noqa: TC003  need for pydantic
+from enum import StrEnum
+
 from pydantic import BaseModel, HttpUrl, field_validator
 
+from src.core.salary import SalaryRange, parse_salary
+
 
 class JobSchema(BaseModel):
     """Represents a job vacancy with its essential details."""
@@ -20,3 +26,69 @@ class JobSchema(BaseModel):
         if value:
             return " ".join(value.strip().split())
         return value
+
+    @property
+    def fingerprint(self) -> str:
+        """A SHA-256 hash of the scraped content, which changes with any field but the URL."""
+        parts = (self.title, self.company, self.salary, self.location, self.description)
+        # None and "" must not collide, and no field may bleed into the next one
+        content = "\x1f".join("\x00" if part is None else part for part in parts)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    @property
+    def salary_range(self) -> SalaryRange:
+        """The salary parsed into numeric bounds and a currency."""
+        return parse_salary(self.salary)
+
+
+class FetchedPage(BaseModel):
+    """
+    Represents the outcome of a conditional fetch of a source page.
+
+    `content` is None when the page is unchanged since it was last processed.
+    """
+
+    url: str
+    content: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+
+
+class JobFilters(BaseModel):
+    """Filters for job listings; every unset field matches all jobs."""
+
+    company: str | None = None
+    location: str | None = None
+    created_from: datetime | None = None
+    """Inclusive lower bound of the creation time."""
+    created_to: datetime | None = None
+    """Exclusive upper bound of the creation time."""
+    salary_from: int | None = None
+    """Inclusive lower bound of the minimum salary; jobs without one do not match."""
+    salary_to: int | None = None
+    """Inclusive upper bound of the maximum salary; jobs without one do not match."""
+    salary_currency: str | None = None
+    """ISO 4217 code of the salary currency, e.g. "RUB"."""
+
+
+class JobSort(StrEnum):
+    """Orders of job listings.
+
+    Salary orders use the minimum salary and leave out jobs without one.
+    They apply to jobs paying in a single currency only.
+    """
+
+    NEWEST = "newest"
+    SALARY_DESC = "-salary"
+    SALARY_ASC = "salary"
+
+    @property
+    def field(self) -> str:
+        """The job field the listing is ordered by, with `id` as a tie-breaker."""
+        return "created_at" if self is JobSort.NEWEST else "salary_min"
+
+    @property
+    def descending(self) -> bool:
+        """Whether the listing is in descending order."""
+        return self is not JobSort.SALARY_ASC
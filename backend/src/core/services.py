@@ -1,10 +1,64 @@
+import asyncio
+import hashlib
+from collections.abc import AsyncIterator, Sequence
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from operator import attrgetter
+from typing import Any, NamedTuple
+
 import httpx
 from fastapi import HTTPException
 from loguru import logger
+from tortoise import timezone
 
+from src.config.config import HttpClientConfig
+from src.core.broadcast import job_broadcaster
+from src.core.cache import job_cache
+from src.core.fetcher import CircuitOpenError, Fetcher
+from src.core.http import create_http_client
+from src.core.pagination import decode_cursor, encode_cursor
+from src.core.parsers import BaseParser, ParserPool
 from src.core.parsers.habr import HabrParser
-from src.db.models import Job
-from src.db.repository import JobRepository
+from src.core.runs import RunReport, RunStage
+from src.core.salary import SalaryRange
+from src.core.schemas import FetchedPage, JobFilters, JobSchema, JobSort
+from src.core.sources import HABR_SOURCE, JobSource
+from src.core.stats import (
+    CompanyCount,
+    DailyCount,
+    JobStats,
+    SalaryBucket,
+    StatKey,
+    StatMetric,
+    job_stat_keys,
+    salary_bucket_width,
+    stat_deltas,
+)
+from src.db.models import Job, TaskRun
+from src.db.repository import (
+    FetchStateRepository,
+    JobRepository,
+    StatsRepository,
+    TaskRunRepository,
+    WatermarkRepository,
+)
+
+
+class _Crawl(NamedTuple):
+    """The state shared by all page fetches of one listing URL."""
+
+    fetcher: Fetcher
+    source: JobSource
+    url: str
+    parser: BaseParser
+    report: RunReport
+
+
+class SavedJobs(NamedTuple):
+    """The outcome of saving the jobs of a page."""
+
+    created: int
+    updated: int
 
 
 class JobService:
@@ -13,14 +67,42 @@ class JobService:
     def __init__(
         self,
         repo: JobRepository | None = None,
+        parser: BaseParser | None = None,
+        fetch_state_repo: FetchStateRepository | None = None,
+        client: httpx.AsyncClient | None = None,
+        fetcher: Fetcher | None = None,
+        parser_pool: ParserPool | None = None,
+        watermark_repo: WatermarkRepository | None = None,
+        stats_repo: StatsRepository | None = None,
+        run_repo: TaskRunRepository | None = None,
     ) -> None:
         """
         Initializes the JobService.
 
         Args:
             repo: An instance of JobRepository.
+            parser: The parser for Habr listing pages, `HabrParser` by default.
+            fetch_state_repo: An instance of FetchStateRepository.
+            client: The shared HTTP client, used when no fetcher is given. If
+                omitted too, a client with the default settings is created and
+                closed for each run.
+            fetcher: The shared fetcher, which rate-limits and retries requests
+                across all sources. If omitted, one is created for each run.
+            parser_pool: The pool parsing pages off the event loop. If omitted,
+                pages are parsed in the event loop.
+            watermark_repo: An instance of WatermarkRepository.
+            stats_repo: An instance of StatsRepository.
+            run_repo: An instance of TaskRunRepository.
         """
         self._repo = repo or JobRepository()
+        self._parser = parser
+        self._fetch_state_repo = fetch_state_repo or FetchStateRepository()
+        self._client = client
+        self._fetcher = fetcher
+        self._parser_pool = parser_pool or ParserPool()
+        self._watermark_repo = watermark_repo or WatermarkRepository()
+        self._stats_repo = stats_repo or StatsRepository()
+        self._run_repo = run_repo or TaskRunRepository()
 
     async def get_all_jobs(self) -> list[Job]:
         """
@@ -31,56 +113,617 @@ class JobService:
         """
         return await self._repo.get_all_jobs()
 
-    async def process_habr_vacancies(self) -> None:
+    async def get_jobs_page(
+        self,
+        limit: int,
+        fields: Sequence[str],
+        cursor: str | None = None,
+        filters: JobFilters | None = None,
+        sort: JobSort = JobSort.NEWEST,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Retrieves one page of job vacancies, newest first by default.
+
+        Args:
+            limit: The maximum number of jobs on the page.
+            fields: The columns of the returned rows.
+            cursor: The cursor returned with the previous page, if any.
+            filters: Optional filters on company, location, creation time and salary.
+            sort: The order of the jobs.
+
+        Returns:
+            The jobs of the page as plain rows, and the cursor of the next
+            page, or None if this is the last page.
+
+        Raises:
+            HTTPException: If the cursor is malformed, or the jobs are sorted
+                by salary without being filtered on a single currency.
+        """
+        if sort is not JobSort.NEWEST and (filters is None or filters.salary_currency is None):
+            # Amounts in different currencies are not comparable
+            raise HTTPException(
+                status_code=400, detail="Sorting by salary requires salary_currency"
+            )
+        try:
+            after = decode_cursor(cursor, sort) if cursor else None
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+        # The cursor is built from the sort key and ID of the last row
+        fields = list(dict.fromkeys([*fields, sort.field, "id"]))
+        # One extra row tells whether there is a next page
+        rows = await self._repo.get_jobs_page(
+            limit + 1,
+            fields,
+            after=after,
+            filters=filters,
+            sort=sort,
+        )
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        last_row = rows[-1]
+        return rows, encode_cursor(last_row[sort.field], last_row["id"])
+
+    def iter_job_chunks(
+        self,
+        fields: Sequence[str],
+        filters: JobFilters | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Iterates over all matching job vacancies in chunks, newest first.
+
+        Args:
+            fields: The columns of the returned rows.
+            filters: Optional filters on company, location, creation time and salary.
+
+        Returns:
+            An async iterator over chunks of jobs as plain rows.
+        """
+        return self._repo.iter_job_chunks(fields, filters=filters)
+
+    async def stream_new_jobs(
+        self,
+        after_id: int | None = None,
+        heartbeat: float = 15.0,
+        chunk_size: int = 100,
+        catch_up_interval: float = 30.0,
+    ) -> AsyncIterator[list[Job]]:
+        """
+        Streams the jobs as they are inserted, never ending by itself.
+
+        Jobs inserted after `after_id` are first read from the database; from
+        then on, new jobs are pushed by the ingestion pipeline without any
+        polling. A subscriber too slow to take the pushed jobs catches up from
+        the database again.
+
+        Jobs are only pushed within the process running the scheduler, so
+        once nothing was pushed for `catch_up_interval` seconds, the database
+        is checked for jobs inserted by another process. A worker without the
+        scheduler thus delivers new jobs within that delay.
+
+        Args:
+            after_id: The ID of the last job the client has, to resume a
+                stream. If None, only jobs inserted from now on are streamed.
+            heartbeat: Seconds without new jobs after which an empty batch
+                is yielded, so the caller can keep the connection alive.
+            chunk_size: The number of jobs read per database query when
+                catching up.
+            catch_up_interval: Seconds without pushed jobs after which the
+                database is checked for new jobs.
+
+        Yields:
+            list[Job]: The next batch of new jobs, or an empty heartbeat batch.
+        """
+        loop = asyncio.get_running_loop()
+        # Subscribed before reading the database, so no job falls in between
+        with job_broadcaster.subscribe() as subscription:
+            last_id = await self._repo.get_latest_job_id() if after_id is None else after_id
+            idle = False
+            while True:
+                subscription.reset()
+                caught_up_id = last_id
+                while jobs := await self._repo.get_jobs_after_id(last_id, chunk_size):
+                    yield jobs
+                    last_id = jobs[-1].id
+                if idle and last_id == caught_up_id:
+                    # The heartbeat skipped to check the database is due
+                    yield []
+
+                # Pushed jobs already read while catching up are skipped
+                caught_up_id = last_id
+                last_activity = loop.time()
+                idle = False
+                while not subscription.lagging:
+                    jobs = await subscription.get(timeout=heartbeat)
+                    if jobs is None:
+                        if loop.time() - last_activity >= catch_up_interval:
+                            idle = True
+                            break
+                        yield []
+                        continue
+                    last_activity = loop.time()
+                    jobs = [job for job in jobs if job.id > caught_up_id]
+                    if jobs:
+                        yield jobs
+                        last_id = max(last_id, jobs[-1].id)
+
+    async def search_jobs(
+        self,
+        query: str,
+        fields: Sequence[str],
+        limit: int,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Searches job vacancies by title and description.
+
+        Args:
+            query: The search query.
+            fields: The columns of the returned rows.
+            limit: The maximum number of jobs to return.
+            offset: The number of best matches to skip.
+
+        Returns:
+            The matching jobs as plain rows, most relevant first.
+        """
+        return await self._repo.search_jobs(query, fields, limit=limit, offset=offset)
+
+    async def process_habr_vacancies(
+        self,
+        max_pages: int = 50,
+        concurrency: int = 5,
+    ) -> None:
+        """
+        Crawls, parses, and saves new and changed job vacancies from Habr Career.
+
+        Args:
+            max_pages: The maximum number of listing pages to visit.
+            concurrency: The maximum number of pages fetched at once.
+        """
+        await self.process_source(
+            HABR_SOURCE,
+            parser=self._parser or HabrParser(),
+            max_pages=max_pages,
+            concurrency=concurrency,
+        )
+
+    async def process_source(
+        self,
+        source: JobSource,
+        parser: BaseParser | None = None,
+        max_pages: int | None = None,
+        concurrency: int = 5,
+        report: RunReport | None = None,
+    ) -> RunReport:
+        """
+        Crawls, parses, and saves new and changed job vacancies from a job source.
+
+        All listing URLs of the source are crawled concurrently. For each of
+        them the first page is fetched alone. If it contains new or changed
+        vacancies, the following pages are fetched in windows of `concurrency`
+        requests over the shared client. New jobs are inserted and known jobs
+        whose content changed are updated. The crawl of a listing stops at its
+        watermark, the newest vacancy seen by the last complete crawl, or at
+        the first page that is empty or fails to load.
+
+        Pages are fetched conditionally (`If-None-Match`/`If-Modified-Since`),
+        and a page whose body hash matches the last processed one is not parsed.
+        Requests go through the fetcher, which applies the rate limit of the
+        source, the fetch budget shared with the other sources, retries and the
+        circuit breaker. Pages are parsed in the parser pool.
+
+        Args:
+            source: The source to crawl.
+            parser: The parser for the listing pages, created with the
+                source's parser factory if omitted.
+            max_pages: The maximum number of pages visited per listing URL,
+                the source's own limit if omitted.
+            concurrency: The maximum number of pages of a listing fetched at once.
+            report: The report the counters and stage timings of the run are
+                added to as it goes, so they are kept even if it fails.
+
+        Returns:
+            The report of the run.
+        """
+        logger.info("Starting {source} processing...", source=source.title)
+
+        parser = parser or source.parser_factory()
+        report = report or RunReport()
+
+        async with AsyncExitStack() as stack:
+            fetcher = self._fetcher
+            if fetcher is None:
+                client = self._client or await stack.enter_async_context(
+                    create_http_client(HttpClientConfig()),
+                )
+                fetcher = Fetcher(client)
+            results = await asyncio.gather(
+                *(
+                    self._crawl_listing(
+                        _Crawl(fetcher, source, url, parser, report),
+                        max_pages or source.max_pages,
+                        concurrency,
+                    )
+                    for url in source.urls
+                ),
+            )
+
+        pages_count = sum(pages for pages, _ in results)
+        new_jobs_count = sum(saved.created for _, saved in results)
+        updated_jobs_count = sum(saved.updated for _, saved in results)
+        if new_jobs_count == 0:
+            logger.info("No new jobs found on {source}.", source=source.title)
+
+        logger.info(
+            "{source} processing finished. Visited {pages} pages, added {count} new jobs, "
+            "updated {updated} changed jobs.",
+            source=source.title,
+            pages=pages_count,
+            count=new_jobs_count,
+            updated=updated_jobs_count,
+        )
+        return report
+
+    async def _crawl_listing(
+        self,
+        crawl: _Crawl,
+        max_pages: int,
+        concurrency: int,
+    ) -> tuple[int, SavedJobs]:
         """
-        Fetches, parses, and saves new job vacancies from Habr Career.
+        Crawls the pages of a single listing URL down to its watermark.
+
+        The watermark is the newest vacancy seen by the last complete crawl, so
+        the crawl stops at the page containing it; in the steady state that is
+        the first page. If the last crawl failed halfway, the crawl goes down
+        to the watermark it was heading for instead, and unchanged or already
+        known pages do not stop it until that gap is filled. Without a
+        watermark, the crawl stops at the first page without new or changed jobs.
+
+        A crawl is complete once it crosses its target, reaches the end of the
+        listing or the page limit, or catches up with the database. Before the
+        first jobs are saved, the target is recorded as the gap for the next
+        run, and the listing is marked as caught up only once the crawl is
+        complete, so a run that fails or crashes halfway leaves the gap behind.
+
+        Args:
+            crawl: The listing being crawled.
+            max_pages: The maximum number of pages to visit.
+            concurrency: The maximum number of pages fetched at once.
+
+        Returns:
+            The number of visited pages and the numbers of created and updated jobs.
         """
-        url = "https://career.habr.com/vacancies/python_developer"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",  # noqa: E501
-        }
-        logger.info("Starting Habr Career processing...")
+        watermark = await self._watermark_repo.get_by_listing_url(crawl.url)
+        caught_up = watermark.caught_up if watermark else True
+        # The vacancy the last complete crawl started at, or the one the
+        # interrupted crawl was heading for
+        target_url = None
+        if watermark:
+            target_url = watermark.newest_url if caught_up else watermark.gap_url
+        newest_url = watermark.newest_url if watermark else None
+
+        new_jobs_count = 0
+        updated_jobs_count = 0
+        pages_count = 0
+        gap_recorded = False
+        page = 1
+        window = 1
+        finished = False
+        completed = False
+        while not finished and page <= max_pages:
+            numbers = range(page, min(page + window, max_pages + 1))
+            # The pages of a window are fetched and parsed in parallel
+            loaded_pages = await asyncio.gather(
+                *(self._load_page(crawl, number) for number in numbers),
+            )
+
+            for number, (fetched_page, jobs) in zip(numbers, loaded_pages, strict=True):
+                if fetched_page is None:
+                    finished = True
+                    break
+                pages_count += 1
+                crawl.report.pages += 1
+
+                if fetched_page.content is None:
+                    # Already processed, so it has nothing new for us
+                    logger.info(
+                        "{source} page {url} skipped: unchanged",
+                        source=crawl.source.title,
+                        url=fetched_page.url,
+                    )
+                    if caught_up:
+                        finished = completed = True
+                        break
+                    continue
+
+                if number == 1 and jobs:
+                    newest_url = str(jobs[0].url)
+                if jobs and not gap_recorded:
+                    # Until the crawl completes, the jobs between the newest
+                    # vacancy and the target are missing
+                    await self._watermark_repo.save(
+                        source=crawl.source.name,
+                        listing_url=crawl.url,
+                        newest_url=newest_url,
+                        caught_up=False,
+                        gap_url=target_url,
+                    )
+                    gap_recorded = True
+                saved = await self._save_jobs(jobs, crawl.report) if jobs else SavedJobs(0, 0)
+                new_jobs_count += saved.created
+                updated_jobs_count += saved.updated
+                crawl.report.jobs_created += saved.created
+                crawl.report.jobs_updated += saved.updated
+                # Remembered only after its jobs are saved, so a failed run
+                # never marks a page as processed
+                with crawl.report.stage(RunStage.WRITE):
+                    await self._fetch_state_repo.save(
+                        url=fetched_page.url,
+                        etag=fetched_page.etag,
+                        last_modified=fetched_page.last_modified,
+                        content_hash=fetched_page.content_hash or "",
+                    )
+                # An empty page is the end of the listing, the target is where
+                # the listing has already been crawled from, and a page without
+                # new or changed jobs means we have caught up with the database.
+                if (
+                    not jobs
+                    or any(str(job.url) == target_url for job in jobs)
+                    or (caught_up and not saved.created and not saved.updated)
+                ):
+                    finished = completed = True
+                    break
+
+            page += len(numbers)
+            window = concurrency
+
+        # Without `finished`, the loop ended at the page limit
+        if completed or not finished:
+            await self._watermark_repo.save(
+                source=crawl.source.name,
+                listing_url=crawl.url,
+                newest_url=newest_url,
+                caught_up=True,
+            )
+        else:
+            logger.warning(
+                "{source} listing {url} crawl stopped after {pages} pages, "
+                "the rest is left for the next run.",
+                source=crawl.source.title,
+                url=crawl.url,
+                pages=pages_count,
+            )
+            await self._watermark_repo.save(
+                source=crawl.source.name,
+                listing_url=crawl.url,
+                newest_url=newest_url,
+                caught_up=False,
+                gap_url=target_url,
+            )
+
+        return pages_count, SavedJobs(new_jobs_count, updated_jobs_count)
+
+    async def _load_page(
+        self,
+        crawl: _Crawl,
+        page: int,
+    ) -> tuple[FetchedPage | None, list[JobSchema]]:
+        """
+        Fetches a listing page and, if it has changed, parses it in the parser pool.
+
+        Args:
+            crawl: The listing being crawled.
+            page: The 1-based page number.
+
+        Returns:
+            The fetched page, or None if the request failed, and its jobs.
+        """
+        with crawl.report.stage(RunStage.FETCH):
+            fetched_page = await self._fetch_page(crawl, page)
+        if fetched_page is None or fetched_page.content is None:
+            return fetched_page, []
+        with crawl.report.stage(RunStage.PARSE):
+            jobs = await self._parser_pool.parse(crawl.parser, fetched_page.content)
+        crawl.report.jobs_parsed += len(jobs)
+        return fetched_page, jobs
+
+    async def _fetch_page(self, crawl: _Crawl, page: int) -> FetchedPage | None:
+        """
+        Conditionally fetches a single listing page.
+
+        Sends the validators stored for the page URL and treats both a
+        `304 Not Modified` response and a body with an already seen hash as
+        an unchanged page.
+
+        Args:
+            crawl: The listing being crawled.
+            page: The 1-based page number.
+
+        Returns:
+            The fetched page (without content if unchanged), or None if the
+            request failed or the host is not being requested at the moment.
+        """
+        params = {crawl.source.page_param: page} if page > 1 else None
+        url = str(httpx.URL(crawl.url, params=params))
+        state = await self._fetch_state_repo.get_by_url(url)
+
+        headers: dict[str, str] = {}
+        if state and state.etag:
+            headers["If-None-Match"] = state.etag
+        if state and state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
 
         try:
-            async with httpx.AsyncClient(headers=headers, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+            response = await crawl.fetcher.get(
+                crawl.url,
+                params=params,
+                headers=headers,
+                rate=crawl.source.requests_per_second,
+            )
+        except CircuitOpenError as e:
+            logger.warning(
+                "Skipping {source} page {url}: {error}",
+                source=crawl.source.title,
+                url=url,
+                error=e,
+            )
+            crawl.report.errors += 1
+            return None
         except httpx.HTTPStatusError as e:
-            logger.error("HTTP error occurred while fetching Habr vacancies: {error}", error=e)
-            return
+            logger.error(
+                "HTTP error occurred while fetching {source} vacancies: {error}",
+                source=crawl.source.title,
+                error=e,
+            )
+            crawl.report.errors += 1
+            return None
         except httpx.RequestError as e:
-            logger.error("Request error occurred while fetching Habr vacancies: {error}", error=e)
-            return
+            logger.error(
+                "Request error occurred while fetching {source} vacancies: {error}",
+                source=crawl.source.title,
+                error=e,
+            )
+            crawl.report.errors += 1
+            return None
 
-        parser = HabrParser()
-        jobs = parser.parse(response.text)
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return FetchedPage(url=url)
 
-        if not jobs:
-            logger.info("No new jobs found on Habr Career.")
-            return
+        content_hash = hashlib.sha256(response.content).hexdigest()
+        if state and state.content_hash == content_hash:
+            return FetchedPage(url=url)
 
+        return FetchedPage(
+            url=url,
+            content=response.text,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=content_hash,
+        )
+
+    async def _save_jobs(self, jobs: list[JobSchema], report: RunReport | None = None) -> SavedJobs:
+        """
+        Saves the new jobs of a page and updates the ones whose content changed.
+
+        Stored fingerprints of all the page's URLs are fetched in one query;
+        unknown URLs are bulk-inserted, URLs with a different fingerprint are
+        bulk-updated, and unchanged jobs cost no writes. The statistics
+        counters are adjusted by the same jobs, so they never need a scan,
+        and new jobs are pushed to the subscribers of the job stream.
+
+        Args:
+            jobs: The jobs parsed from a single page.
+            report: The report of the run the dedupe and write times are added to.
+
+        Returns:
+            The numbers of created and updated jobs.
+        """
         logger.info("Found {count} jobs on the page.", count=len(jobs))
+        report = report or RunReport()
 
-        new_jobs_count = 0
-        for job_schema in jobs:
-            existing_job = await self._repo.get_job_by_url(job_schema.url)
-            if not existing_job:
-                await self._repo.create_job(
-                    title=job_schema.title,
-                    url=job_schema.url,
-                    company=job_schema.company,
-                    description=job_schema.description,
-                    location=job_schema.location,
-                    salary=job_schema.salary,
-                )
-                new_jobs_count += 1
-                logger.bind(notify=True).info(
-                    "✅ Found new job: {title}", title=job_schema.title,
-                )
+        with report.stage(RunStage.DEDUPE):
+            fingerprints = await self._repo.get_fingerprints([job.url for job in jobs])
 
-        logger.info(
-            "Habr Career processing finished. Added {count} new jobs.",
-            count=new_jobs_count,
+            new_jobs: dict[str, JobSchema] = {}
+            changed_jobs: dict[str, JobSchema] = {}
+            for job_schema in jobs:
+                url = str(job_schema.url)
+                if url not in fingerprints:
+                    new_jobs.setdefault(url, job_schema)
+                elif fingerprints[url] != job_schema.fingerprint:
+                    changed_jobs.setdefault(url, job_schema)
+
+        with report.stage(RunStage.WRITE):
+            today = timezone.now().date()
+            added_keys = [
+                job_stat_keys(job.company, today, job.salary_range) for job in new_jobs.values()
+            ]
+            removed_keys: list[list[StatKey]] = []
+            if new_jobs:
+                await self._repo.bulk_create_jobs(list(new_jobs.values()))
+            updated_count = 0
+            if changed_jobs:
+                # The previous versions are taken off the statistics they counted in
+                for job in await self._repo.get_by_urls(changed_jobs):
+                    day = job.created_at.date()
+                    salary = SalaryRange(job.salary_min, job.salary_max, job.salary_currency)
+                    removed_keys.append(job_stat_keys(job.company, day, salary))
+                    new_version = changed_jobs[job.url]
+                    added_keys.append(
+                        job_stat_keys(new_version.company, day, new_version.salary_range),
+                    )
+                updated_count = await self._repo.bulk_update_jobs(list(changed_jobs.values()))
+            await self._stats_repo.apply(stat_deltas(added_keys, removed_keys))
+            if new_jobs or updated_count:
+                job_cache.invalidate()
+            if new_jobs and job_broadcaster.has_subscribers:
+                created = await self._repo.get_by_urls(new_jobs)
+                job_broadcaster.publish(sorted(created, key=attrgetter("id")))
+
+        for job_schema in new_jobs.values():
+            logger.bind(notify=True).info(
+                "✅ Found new job: {title}",
+                title=job_schema.title,
+            )
+        return SavedJobs(created=len(new_jobs), updated=updated_count)
+
+    async def get_runs(self, limit: int = 50, task: str | None = None) -> list[TaskRun]:
+        """
+        Retrieves the most recent scheduled task runs, newest first.
+
+        Args:
+            limit: The maximum number of runs to return.
+            task: Only runs of this task, such as "parse_habr", if given.
+
+        Returns:
+            A list of TaskRun objects.
+        """
+        return await self._run_repo.get_recent(limit, task=task)
+
+    async def get_stats(self, companies_limit: int = 20, days: int = 30) -> JobStats:
+        """
+        Retrieves the dashboard statistics from the precomputed counters.
+
+        The cost depends on the number of companies, days and salary buckets
+        returned, not on the number of stored jobs.
+
+        Args:
+            companies_limit: The number of companies with the most jobs returned.
+            days: The number of days, up to today, of the new jobs per day.
+
+        Returns:
+            The statistics, with days without new jobs counted as 0.
+        """
+        today = timezone.now().date()
+        first_day = today - timedelta(days=days - 1)
+
+        total_jobs = await self._stats_repo.get_count(StatMetric.TOTAL)
+        companies = await self._stats_repo.get_top(StatMetric.COMPANY, companies_limit)
+        daily = await self._stats_repo.get_all(StatMetric.DAY, key_from=first_day.isoformat())
+        salaries = await self._stats_repo.get_all(StatMetric.SALARY)
+
+        new_per_day = []
+        for offset in range(days):
+            day = first_day + timedelta(days=offset)
+            new_per_day.append(DailyCount(day, daily.get(day.isoformat(), 0)))
+
+        salary_distribution = []
+        for key, count in salaries.items():
+            currency, salary_from = key.split(":")
+            width = salary_bucket_width(currency)
+            salary_distribution.append(
+                SalaryBucket(currency, int(salary_from), int(salary_from) + width, count),
+            )
+        salary_distribution.sort()
+
+        return JobStats(
+            total_jobs=total_jobs,
+            top_companies=[CompanyCount(company, count) for company, count in companies],
+            new_per_day=new_per_day,
+            salary_distribution=salary_distribution,
         )
 
     async def get_job_by_id(self, job_id: int) -> Job:
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from src.core.parsers.habr import HabrParser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from src.core.parsers import BaseParser
+
+HABR_VACANCIES_URL = "https://career.habr.com/vacancies/python_developer"
+
+
+@dataclass(frozen=True)
+class JobSource:
+    """
+    A job board crawled by the ingestion pipeline.
+
+    Every listing URL of a source is paginated with the `page_param` query
+    parameter (`?page=2`, `?page=3`, ...), the first page having none.
+
+    Attributes:
+        name: The unique identifier of the source, used in job IDs and logs.
+        title: The human-readable name of the source.
+        urls: The listing URLs to crawl.
+        parser_factory: Creates the parser for the listing pages.
+        interval_minutes: How often the source is crawled.
+        requests_per_second: The maximum request rate against the source,
+            unlimited if None.
+        max_pages: The maximum number of pages visited per listing URL.
+        page_param: The query parameter holding the page number.
+    """
+
+    name: str
+    title: str
+    urls: tuple[str, ...]
+    parser_factory: Callable[[], BaseParser]
+    interval_minutes: int = 60
+    requests_per_second: float | None = None
+    max_pages: int = 50
+    page_param: str = "page"
+
+
+class SourceRegistry:
+    """A registry of the job sources to crawl, keyed by name."""
+
+    def __init__(self) -> None:
+        """Initializes an empty registry."""
+        self._sources: dict[str, JobSource] = {}
+
+    def register(self, source: JobSource) -> JobSource:
+        """
+        Adds a source to the registry.
+
+        Args:
+            source: The source to add.
+
+        Returns:
+            The registered source.
+
+        Raises:
+            ValueError: If a source with the same name is already registered.
+        """
+        if source.name in self._sources:
+            msg = f"Job source '{source.name}' is already registered"
+            raise ValueError(msg)
+        self._sources[source.name] = source
+        return source
+
+    def get(self, name: str) -> JobSource:
+        """
+        Returns a registered source.
+
+        Args:
+            name: The name of the source.
+
+        Raises:
+            KeyError: If no source with this name is registered.
+        """
+        return self._sources[name]
+
+    def __iter__(self) -> Iterator[JobSource]:
+        return iter(self._sources.values())
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+
+HABR_SOURCE = JobSource(
+    name="habr",
+    title="Habr Career",
+    urls=(HABR_VACANCIES_URL,),
+    parser_factory=HabrParser,
+    requests_per_second=2.0,
+)
+
+# The sources crawled by the scheduler
+source_registry = SourceRegistry()
+source_registry.register(HABR_SOURCE)
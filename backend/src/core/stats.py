@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections import Counter
+from enum import StrEnum
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import date
+
+    from src.core.salary import SalaryRange
+
+# The width of a salary distribution bucket per currency; others use the default
+SALARY_BUCKET_WIDTHS = {"RUB": 50_000, "KZT": 250_000}
+DEFAULT_SALARY_BUCKET_WIDTH = 1_000
+
+
+class StatMetric(StrEnum):
+    """The kinds of counters kept in the job statistics table."""
+
+    TOTAL = "total"
+    COMPANY = "company"
+    DAY = "day"
+    SALARY = "salary"
+
+
+StatKey = tuple[StatMetric, str]
+
+
+class CompanyCount(NamedTuple):
+    """The number of jobs of a company."""
+
+    company: str
+    jobs_count: int
+
+
+class DailyCount(NamedTuple):
+    """The number of jobs added on a day."""
+
+    day: date
+    jobs_count: int
+
+
+class SalaryBucket(NamedTuple):
+    """The number of jobs whose salary falls in `[salary_from, salary_to)`."""
+
+    currency: str
+    salary_from: int
+    salary_to: int
+    jobs_count: int
+
+
+class JobStats(NamedTuple):
+    """Dashboard statistics of the stored jobs."""
+
+    total_jobs: int
+    top_companies: list[CompanyCount]
+    new_per_day: list[DailyCount]
+    salary_distribution: list[SalaryBucket]
+
+
+def salary_bucket_width(currency: str) -> int:
+    """Returns the width of the salary distribution buckets of a currency."""
+    return SALARY_BUCKET_WIDTHS.get(currency, DEFAULT_SALARY_BUCKET_WIDTH)
+
+
+def salary_bucket_key(salary: SalaryRange) -> str | None:
+    """
+    Returns the salary distribution key of a job, e.g. "RUB:150000".
+
+    The job is counted by its lower bound, or its upper bound if only that
+    is known, rounded down to the bucket width of its currency.
+
+    Args:
+        salary: The parsed salary of the job.
+
+    Returns:
+        The key, or None if the salary amount or currency is unknown.
+    """
+    amount = salary.min if salary.min is not None else salary.max
+    if amount is None or salary.currency is None:
+        return None
+    width = salary_bucket_width(salary.currency)
+    return f"{salary.currency}:{amount // width * width}"
+
+
+def job_stat_keys(company: str | None, day: date, salary: SalaryRange) -> list[StatKey]:
+    """
+    Returns the counters a job contributes to.
+
+    Args:
+        company: The company of the job.
+        day: The day the job was added.
+        salary: The parsed salary of the job.
+
+    Returns:
+        The keys of the counters to increment by one for the job.
+    """
+    keys: list[StatKey] = [(StatMetric.TOTAL, ""), (StatMetric.DAY, day.isoformat())]
+    if company:
+        keys.append((StatMetric.COMPANY, company))
+    salary_key = salary_bucket_key(salary)
+    if salary_key is not None:
+        keys.append((StatMetric.SALARY, salary_key))
+    return keys
+
+
+def stat_deltas(
+    added: Iterable[list[StatKey]],
+    removed: Iterable[list[StatKey]] = (),
+) -> Counter[StatKey]:
+    """
+    Sums the changes of the counters for added and removed job versions.
+
+    An updated job is passed both as its removed old version and its added
+    new version, so only the counters it moved between change.
+
+    Args:
+        added: The counter keys of every added job version.
+        removed: The counter keys of every removed job version.
+
+    Returns:
+        The non-zero change of every affected counter.
+    """
+    deltas: Counter[StatKey] = Counter()
+    for keys in added:
+        deltas.update(keys)
+    for keys in removed:
+        deltas.subtract(keys)
+    return Counter({key: delta for key, delta in deltas.items() if delta})
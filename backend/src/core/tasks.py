@@ -1,20 +1,106 @@
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING
+
 from loguru import logger
 
+from src.core.runs import RunReport, RunStatus
 from src.core.services import JobService
+from src.core.sources import source_registry
+from src.db.locks import task_lock
+from src.db.repository import TaskRunRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
+    from src.core.fetcher import Fetcher
+    from src.core.parsers import ParserPool
+    from src.core.sources import JobSource
 
-async def parse_habr_vacancies() -> None:
+
+async def parse_source(
+    source_name: str,
+    fetcher: Fetcher | None = None,
+    parser_pool: ParserPool | None = None,
+) -> None:
     """
-    Runs the job processing logic for Habr Career.
+    Runs the job processing logic for a registered job source.
 
     This function acts as an entry point for the scheduler.
-    It initializes the JobService and calls the main processing method.
+    It initializes the JobService and calls the main processing method,
+    unless the source is already being processed by another process.
+
+    Args:
+        source_name: The name of the source in the source registry.
+        fetcher: The shared fetcher to fetch pages with.
+        parser_pool: The pool parsing pages off the event loop.
+    """
+    source = source_registry.get(source_name)
+    logger.info("Starting {source} parsing task...", source=source.title)
+
+    service = JobService(fetcher=fetcher, parser_pool=parser_pool)
+    if await _process_exclusively(service, source):
+        logger.info("{source} parsing task finished.", source=source.title)
+
+
+async def parse_sources(
+    sources: Iterable[JobSource] | None = None,
+    fetcher: Fetcher | None = None,
+    parser_pool: ParserPool | None = None,
+) -> None:
     """
-    logger.info("Starting Habr Career parsing task...")
+    Runs the job processing logic for several sources concurrently.
 
-    service = JobService()
-    await service.process_habr_vacancies()
+    The total run time is that of the slowest source rather than the sum.
+    A failing source is logged and does not interrupt the others, and a
+    source already being processed by another process is skipped.
+
+    Args:
+        sources: The sources to crawl, all registered sources if omitted.
+        fetcher: The shared fetcher to fetch pages with.
+        parser_pool: The pool parsing pages off the event loop.
+    """
+    sources = list(source_registry if sources is None else sources)
+    service = JobService(fetcher=fetcher, parser_pool=parser_pool)
+    results = await asyncio.gather(
+        *(_process_exclusively(service, source) for source in sources),
+        return_exceptions=True,
+    )
+    for source, result in zip(sources, results, strict=True):
+        if isinstance(result, Exception):
+            logger.opt(exception=result).error(
+                "{source} parsing task failed.",
+                source=source.title,
+            )
+
+
+async def _process_exclusively(service: JobService, source: JobSource) -> bool:
+    """
+    Processes a source while holding its cluster-wide lock.
+
+    The run is recorded in the task run history with its outcome, counters
+    and stage timings, which are kept even if it fails.
+
+    Returns:
+        Whether the source was processed, False if another run holds the lock.
+    """
+    task = f"parse_{source.name}"
+    async with task_lock(task) as acquired:
+        if not acquired:
+            logger.info(
+                "{source} parsing task skipped: another run is in progress.",
+                source=source.title,
+            )
+            return False
 
-    logger.info("Habr Career parsing task finished.")
+        runs = TaskRunRepository()
+        run = await runs.start(task)
+        report = RunReport()
+        try:
+            await service.process_source(source, report=report)
+        except BaseException as e:
+            await runs.finish(run, RunStatus.FAILED, report, error=repr(e))
+            raise
+        await runs.finish(run, RunStatus.SUCCEEDED, report)
+        return True
@@ -0,0 +1,121 @@
+"""
+Backfills data derived from the stored jobs.
+
+The command parses the salary columns of jobs saved before they existed,
+then rebuilds the statistics counters from scratch. Jobs are processed in
+chunks of increasing `id`, so it uses little memory, can be interrupted and
+is safe to run again. Run from the `backend` directory after applying the
+migrations:
+
+    python -m src.db.backfill
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+
+from src.config import get_main_config
+from src.core.salary import SalaryRange, parse_salary
+from src.core.stats import StatKey, job_stat_keys
+from src.db.db import close_db, init_db
+from src.db.models import Job
+from src.db.repository import StatsRepository
+from src.utils.notify_logger.logger import logger
+
+
+async def backfill_salaries(batch_size: int = 500) -> int:
+    """
+    Parses the salary text of every job into the numeric salary columns.
+
+    Args:
+        batch_size: The number of jobs loaded and updated per query.
+
+    Returns:
+        The number of jobs whose salary columns changed.
+    """
+    updated_count = 0
+    last_id = 0
+    while True:
+        jobs = (
+            await Job.filter(id__gt=last_id, salary__isnull=False).order_by("id").limit(batch_size)
+        )
+        if not jobs:
+            return updated_count
+        last_id = jobs[-1].id
+
+        changed: list[Job] = []
+        for job in jobs:
+            salary_range = parse_salary(job.salary)
+            if salary_range != (job.salary_min, job.salary_max, job.salary_currency):
+                job.salary_min, job.salary_max, job.salary_currency = salary_range
+                changed.append(job)
+        if changed:
+            await Job.bulk_update(
+                changed,
+                fields=["salary_min", "salary_max", "salary_currency"],
+                batch_size=batch_size,
+            )
+            updated_count += len(changed)
+        logger.info(
+            f"Salary backfill: {updated_count} jobs updated, up to id {last_id}.",
+            notify=False,
+        )
+
+
+async def rebuild_stats(batch_size: int = 500) -> int:
+    """
+    Recomputes the statistics counters from all stored jobs.
+
+    Corrects any drift of the incrementally updated counters, e.g. after
+    jobs were written outside the ingestion pipeline.
+
+    Args:
+        batch_size: The number of jobs loaded per query.
+
+    Returns:
+        The number of jobs counted.
+    """
+    counted = 0
+    last_id = 0
+    counts: Counter[StatKey] = Counter()
+    while True:
+        rows = (
+            await Job.filter(id__gt=last_id)
+            .order_by("id")
+            .limit(batch_size)
+            .values_list(
+                "id", "company", "created_at", "salary_min", "salary_max", "salary_currency"
+            )
+        )
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        counted += len(rows)
+        for _, company, created_at, *salary in rows:
+            counts.update(job_stat_keys(company, created_at.date(), SalaryRange(*salary)))
+    await StatsRepository().rebuild(counts)
+    return counted
+
+
+async def _run(batch_size: int) -> None:
+    await init_db(get_main_config().backend.database)
+    try:
+        updated_count = await backfill_salaries(batch_size)
+        logger.info(f"Salary backfill finished: {updated_count} jobs updated.")
+        counted = await rebuild_stats(batch_size)
+        logger.info(f"Statistics rebuilt from {counted} jobs.")
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    arg_parser.add_argument("--batch-size", type=int, default=500)
+    args = arg_parser.parse_args()
+    asyncio.run(_run(args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from tortoise.connection import connections
 from src.utils.notify_logger.logger import logger
 
 from .config import get_tortoise_orm_config
+from .search import ensure_search_index
 
 if TYPE_CHECKING:
     from src.config.config import DatabaseConfig
@@ -15,6 +16,11 @@ if TYPE_CHECKING:
 
 _MODELS_FILES = [
     "src.db.models.job",
+    "src.db.models.fetch_state",
+    "src.db.models.watermark",
+    "src.db.models.stats",
+    "src.db.models.task_lock",
+    "src.db.models.task_run",
 ]
 
 
@@ -36,6 +42,7 @@ async def init_db(db_config: DatabaseConfig) -> None:
     try:
         await Tortoise.init(config=tortoise_orm_config)
         await Tortoise.generate_schemas()
+        await ensure_search_index()
         logger.info("Database connection initialized successfully.")
     except Exception as e:
         logger.error("Database initialization error", exception=e)
@@ -0,0 +1,78 @@
+"""
+Cluster-wide locks keeping a task from running twice at once.
+
+Every process, such as each uvicorn worker, runs its own scheduler, so the
+same task fires in several processes. The lock lives in the database:
+
+* PostgreSQL: a session-level advisory lock held on a pooled connection for
+  the duration of the task, released with the connection if the process dies;
+* SQLite: a row of `task_locks`, whose primary key admits a single holder. It
+  expires after a TTL, so a crashed holder does not block the task forever.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from tortoise import connections, timezone
+from tortoise.exceptions import IntegrityError
+
+from src.db.models import TaskLock
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+# Long enough for the slowest crawl, short enough to recover from a crash
+DEFAULT_LOCK_TTL = 3600.0
+
+
+@asynccontextmanager
+async def task_lock(name: str, ttl: float = DEFAULT_LOCK_TTL) -> AsyncIterator[bool]:
+    """Tries to take the lock of a task for the duration of the `with` block.
+
+    The lock is not waited for: a task finding it taken is already running
+    elsewhere and should skip this run.
+
+    Args:
+        name: The name of the task.
+        ttl: Seconds after which a lock row left by a crashed holder is taken
+            over. Advisory locks need none.
+
+    Yields:
+        Whether the lock was taken.
+
+    Raises:
+        NotImplementedError: If the database dialect is not supported.
+
+    """
+    connection = connections.get("default")
+    dialect = connection.capabilities.dialect
+    if dialect == "postgres":
+        async with connection.acquire_connection() as session:
+            acquired = await session.fetchval("SELECT pg_try_advisory_lock(hashtext($1))", name)
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    await session.execute("SELECT pg_advisory_unlock(hashtext($1))", name)
+    elif dialect == "sqlite":
+        owner = uuid4().hex
+        now = timezone.now()
+        await TaskLock.filter(name=name, expires_at__lte=now).delete()
+        try:
+            await TaskLock.create(name=name, owner=owner, expires_at=now + timedelta(seconds=ttl))
+        except IntegrityError:
+            acquired = False
+        else:
+            acquired = True
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                await TaskLock.filter(name=name, owner=owner).delete()
+    else:
+        msg = f"Task locks are not supported for the '{dialect}' dialect"
+        raise NotImplementedError(msg)
@@ -2,6 +2,11 @@
 This package contains the Tortoise ORM models for the application.
 """
 
+from .fetch_state import FetchState
 from .job import Job
+from .stats import JobStat
+from .task_lock import TaskLock
+from .task_run import TaskRun
+from .watermark import SourceWatermark
 
-__all__ = ["Job"]
+__all__ = ["FetchState", "Job", "JobStat", "SourceWatermark", "TaskLock", "TaskRun"]
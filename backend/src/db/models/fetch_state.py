@@ -0,0 +1,30 @@
+from tortoise import fields, models
+
+
+class FetchState(models.Model):
+    """
+    Model for storing HTTP caching metadata of fetched source pages.
+
+    Attributes:
+        id (int): Unique record identifier, primary key.
+        url (str): Unique URL of the fetched page.
+        etag (str | None): The `ETag` header of the last response, can be None.
+        last_modified (str | None): The `Last-Modified` header of the last
+            response, can be None.
+        content_hash (str): SHA-256 hex digest of the last response body.
+        updated_at (datetime): Date and time of the last record update.
+    """
+
+    id = fields.IntField(primary_key=True)
+    url = fields.CharField(max_length=512, unique=True, db_index=True)
+    etag = fields.CharField(max_length=255, null=True)
+    last_modified = fields.CharField(max_length=64, null=True)
+    content_hash = fields.CharField(max_length=64)
+
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        table = "fetch_states"
+
+    def __str__(self) -> str:
+        return self.url
@@ -15,7 +15,15 @@ class Job(models.Model):
         url (str): Unique job URL, used to prevent duplicates.
         description (str): Full job description.
         salary (str | None): Salary information, can be None.
+        salary_min (int | None): Lower bound of the salary parsed from
+            `salary`, can be None.
+        salary_max (int | None): Upper bound of the salary parsed from
+            `salary`, can be None.
+        salary_currency (str | None): ISO 4217 code of the salary currency,
+            can be None.
         posted_date (datetime | None): Job posting date, can be None.
+        content_hash (str | None): Fingerprint of the scraped content, used to
+            detect changed vacancies. None for rows saved before it existed.
         created_at (datetime): Date and time of record creation.
         updated_at (datetime): Date and time of the last record update.
     """
@@ -27,7 +35,11 @@ class Job(models.Model):
     url = fields.CharField(max_length=512, unique=True, db_index=True)
     description = fields.TextField(null=True)
     salary = fields.CharField(max_length=255, null=True)
+    salary_min = fields.IntField(null=True)
+    salary_max = fields.IntField(null=True, db_index=True)
+    salary_currency = fields.CharField(max_length=3, null=True)
     posted_date = fields.DatetimeField(null=True)
+    content_hash = fields.CharField(max_length=64, null=True)
 
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
@@ -35,6 +47,15 @@ class Job(models.Model):
     class Meta:  # type: ignore[reportIncompatibleVariableOverride]
         table = "jobs"
         ordering: ClassVar[list[str]] = ["-created_at"]
+        # Keyset pagination walks (created_at, id) or (salary_min, id),
+        # optionally within a filter
+        indexes = (
+            ("created_at", "id"),
+            ("company", "created_at", "id"),
+            ("location", "created_at", "id"),
+            ("salary_min", "id"),
+            ("salary_currency", "salary_min", "id"),
+        )
 
     def __str__(self) -> str:
         return f"{self.title} at {self.company}"
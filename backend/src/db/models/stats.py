@@ -0,0 +1,33 @@
+from typing import ClassVar
+
+from tortoise import fields, models
+
+
+class JobStat(models.Model):
+    """
+    Model for storing a precomputed counter of the job statistics.
+
+    Counters are updated incrementally whenever jobs are saved, so the
+    statistics are read without scanning the jobs table.
+
+    Attributes:
+        id (int): Unique record identifier, primary key.
+        metric (str): Kind of the counter: "total", "company", "day" or "salary".
+        key (str): What is counted within the metric: the company name, the
+            ISO date, the salary bucket such as "RUB:150000", or "" for the total.
+        count (int): Number of jobs counted.
+    """
+
+    id = fields.IntField(primary_key=True)
+    metric = fields.CharField(max_length=16)
+    key = fields.CharField(max_length=255)
+    count = fields.IntField(default=0)
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        table = "job_stats"
+        unique_together: ClassVar[tuple[tuple[str, ...], ...]] = (("metric", "key"),)
+        # Top companies are read in descending order of count
+        indexes = (("metric", "count"),)
+
+    def __str__(self) -> str:
+        return f"{self.metric} {self.key}: {self.count}"
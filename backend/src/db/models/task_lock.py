@@ -0,0 +1,26 @@
+from tortoise import fields, models
+
+
+class TaskLock(models.Model):
+    """
+    Model for storing the lock of a task running somewhere in the cluster.
+
+    Used on databases without advisory locks (SQLite): the primary key lets
+    a single process hold the lock of a task at a time.
+
+    Attributes:
+        name (str): Name of the locked task, primary key.
+        owner (str): Random token of the holder, so only it releases the lock.
+        expires_at (datetime): Date and time after which the lock is
+            considered abandoned by a crashed holder and can be taken over.
+    """
+
+    name = fields.CharField(max_length=128, primary_key=True)
+    owner = fields.CharField(max_length=32)
+    expires_at = fields.DatetimeField()
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        table = "task_locks"
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.owner}"
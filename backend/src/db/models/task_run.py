@@ -0,0 +1,53 @@
+from tortoise import fields, models
+
+
+class TaskRun(models.Model):
+    """
+    Model for storing the outcome of a scheduled task run.
+
+    Attributes:
+        id (int): Unique record identifier, primary key.
+        task (str): Name of the task, such as "parse_habr".
+        status (str): "running", "succeeded" or "failed".
+        started_at (datetime): Date and time the run started.
+        finished_at (datetime | None): Date and time the run ended, None
+            while it is running.
+        duration (float | None): Wall time of the run in seconds.
+        pages (int): Number of listing pages visited.
+        jobs_parsed (int): Number of job cards parsed from the pages.
+        jobs_created (int): Number of new jobs inserted.
+        jobs_updated (int): Number of changed jobs updated.
+        errors (int): Number of pages that failed to load.
+        fetch_seconds (float): Time spent fetching pages, summed over pages.
+        parse_seconds (float): Time spent parsing pages, summed over pages.
+        dedupe_seconds (float): Time spent telling new and changed jobs
+            from known ones, summed over pages.
+        write_seconds (float): Time spent writing jobs, statistics and page
+            states, summed over pages.
+        error (str | None): The error that made the run fail.
+    """
+
+    id = fields.IntField(primary_key=True)
+    task = fields.CharField(max_length=128)
+    status = fields.CharField(max_length=16)
+    started_at = fields.DatetimeField(auto_now_add=True)
+    finished_at = fields.DatetimeField(null=True)
+    duration = fields.FloatField(null=True)
+    pages = fields.IntField(default=0)
+    jobs_parsed = fields.IntField(default=0)
+    jobs_created = fields.IntField(default=0)
+    jobs_updated = fields.IntField(default=0)
+    errors = fields.IntField(default=0)
+    fetch_seconds = fields.FloatField(default=0)
+    parse_seconds = fields.FloatField(default=0)
+    dedupe_seconds = fields.FloatField(default=0)
+    write_seconds = fields.FloatField(default=0)
+    error = fields.TextField(null=True)
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        table = "task_runs"
+        # Recent runs are listed newest first, optionally of a single task
+        indexes = (("task", "id"),)
+
+    def __str__(self) -> str:
+        return f"{self.task} #{self.id}: {self.status}"
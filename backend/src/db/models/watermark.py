@@ -0,0 +1,34 @@
+from tortoise import fields, models
+
+
+class SourceWatermark(models.Model):
+    """
+    Model for storing how far the last ingestion run got in a source listing.
+
+    Attributes:
+        id (int): Unique record identifier, primary key.
+        source (str): Name of the job source the listing belongs to.
+        listing_url (str): Unique URL of the first page of the listing.
+        newest_url (str | None): URL of the newest vacancy seen in the
+            listing, can be None if no run has parsed its first page yet.
+        caught_up (bool): Whether the last run crawled down to the previous
+            watermark. False after a failed run, whose gap is still to fill.
+        gap_url (str | None): URL of the vacancy the next run must crawl down
+            to when not caught up; None means down to the end of the listing.
+        updated_at (datetime): Date and time of the last record update.
+    """
+
+    id = fields.IntField(primary_key=True)
+    source = fields.CharField(max_length=64, db_index=True)
+    listing_url = fields.CharField(max_length=512, unique=True, db_index=True)
+    newest_url = fields.CharField(max_length=512, null=True)
+    caught_up = fields.BooleanField(default=True)
+    gap_url = fields.CharField(max_length=512, null=True)
+
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        table = "source_watermarks"
+
+    def __str__(self) -> str:
+        return f"{self.source}: {self.newest_url}"
@@ -1,18 +1,64 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING, Any
 
+from tortoise import timezone
+from tortoise.expressions import F, Q
+from tortoise.transactions import in_transaction
+
+from src.core.metrics import db_query_seconds
+from src.core.runs import RunStage, RunStatus
+from src.core.schemas import JobSort
+from src.db.models.fetch_state import FetchState
 from src.db.models.job import Job
+from src.db.models.stats import JobStat
+from src.db.models.task_run import TaskRun
+from src.db.models.watermark import SourceWatermark
+from src.db.search import search_job_ids
 
 if TYPE_CHECKING:
+    from collections import Counter
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+    from datetime import datetime
+
     from pydantic import HttpUrl
 
-    from src.core.schemas import JobSchema
+    from src.core.runs import RunReport
+    from src.core.schemas import JobFilters, JobSchema
+    from src.core.stats import StatKey, StatMetric
+
+
+# The columns refreshed when a stored vacancy changes
+_CONTENT_FIELDS = [
+    "title",
+    "company",
+    "description",
+    "location",
+    "salary",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "content_hash",
+    "updated_at",
+]
+
+
+def _timed[**P, R](method: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Records the latency of a repository method under its name."""
+
+    @functools.wraps(method)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        with db_query_seconds.time(operation=method.__name__):
+            return await method(*args, **kwargs)
+
+    return wrapper
 
 
 class JobRepository:
     """A repository for handling job data persistence."""
 
+    @_timed
     async def get_all_jobs(self) -> list[Job]:
         """
         Retrieves all job entries from the database.
@@ -22,6 +68,151 @@ class JobRepository:
         """
         return await Job.all()
 
+    @_timed
+    async def get_jobs_page(
+        self,
+        limit: int,
+        fields: Sequence[str],
+        after: tuple[datetime | int, int] | None = None,
+        filters: JobFilters | None = None,
+        sort: JobSort = JobSort.NEWEST,
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieves a page of jobs using keyset pagination.
+
+        Jobs are ordered by `(sort field, id)`, and the page starts right after
+        the `after` position, so the cost does not depend on how deep the page is.
+        Jobs are read as plain rows: building model instances is most of the
+        cost of reading large pages that are only serialized.
+
+        Args:
+            limit: The maximum number of jobs to return.
+            fields: The columns of the rows.
+            after: The (sort key, id) of the last job of the previous page.
+            filters: Optional filters on company, location, creation time and salary.
+            sort: The order of the jobs, newest first by default.
+
+        Returns:
+            The jobs of the page as dicts keyed by column.
+        """
+        field = sort.field
+        query = Job.filter(*self._filter_conditions(filters))
+        if sort is not JobSort.NEWEST:
+            query = query.filter(**{f"{field}__isnull": False})
+        if after is not None:
+            position, job_id = after
+            op = "lt" if sort.descending else "gt"
+            query = query.filter(
+                Q(**{f"{field}__{op}": position}) | Q(**{field: position, f"id__{op}": job_id}),
+            )
+        prefix = "-" if sort.descending else ""
+        query = query.order_by(f"{prefix}{field}", f"{prefix}id").limit(limit)
+        return await query.values(*fields)
+
+    async def iter_job_chunks(
+        self,
+        fields: Sequence[str],
+        chunk_size: int = 500,
+        filters: JobFilters | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Iterates over all matching jobs, newest first, in chunks.
+
+        Each chunk is a separate keyset query, so memory use depends on the
+        chunk size and not on the size of the table.
+
+        Args:
+            fields: The columns of the rows; `created_at` and `id` are always
+                included, as the keyset walks them.
+            chunk_size: The number of jobs fetched per query.
+            filters: Optional filters on company, location, creation time and salary.
+
+        Yields:
+            The next chunk of jobs as dicts keyed by column.
+        """
+        fields = list(dict.fromkeys([*fields, "created_at", "id"]))
+        after: tuple[datetime, int] | None = None
+        while True:
+            rows = await self.get_jobs_page(chunk_size, fields, after=after, filters=filters)
+            if rows:
+                yield rows
+            if len(rows) < chunk_size:
+                return
+            after = (rows[-1]["created_at"], rows[-1]["id"])
+
+    @_timed
+    async def get_latest_job_id(self) -> int:
+        """
+        Returns the highest job ID, i.e. the ID of the last inserted job.
+
+        Returns:
+            The ID, or 0 if there are no jobs.
+        """
+        job_id = await Job.all().order_by("-id").first().values_list("id", flat=True)
+        return job_id or 0
+
+    @_timed
+    async def get_jobs_after_id(self, after_id: int, limit: int) -> list[Job]:
+        """
+        Retrieves the jobs inserted after the given one, in insertion order.
+
+        Args:
+            after_id: The ID of the last job already known.
+            limit: The maximum number of jobs to return.
+
+        Returns:
+            The jobs with a higher ID, in ascending order of ID.
+        """
+        return await Job.filter(id__gt=after_id).order_by("id").limit(limit)
+
+    @staticmethod
+    def _filter_conditions(filters: JobFilters | None) -> list[Q]:
+        """Translates job filters into query conditions."""
+        if filters is None:
+            return []
+        conditions: list[Q] = []
+        if filters.company is not None:
+            conditions.append(Q(company=filters.company))
+        if filters.location is not None:
+            conditions.append(Q(location=filters.location))
+        if filters.created_from is not None:
+            conditions.append(Q(created_at__gte=filters.created_from))
+        if filters.created_to is not None:
+            conditions.append(Q(created_at__lt=filters.created_to))
+        if filters.salary_from is not None:
+            conditions.append(Q(salary_min__gte=filters.salary_from))
+        if filters.salary_to is not None:
+            conditions.append(Q(salary_max__lte=filters.salary_to))
+        if filters.salary_currency is not None:
+            conditions.append(Q(salary_currency=filters.salary_currency))
+        return conditions
+
+    @_timed
+    async def search_jobs(
+        self,
+        query: str,
+        fields: Sequence[str],
+        limit: int,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """
+        Finds jobs whose title or description match a full-text query.
+
+        Args:
+            query: The search query.
+            fields: The columns of the rows.
+            limit: The maximum number of jobs to return.
+            offset: The number of best matches to skip.
+
+        Returns:
+            The matching jobs as dicts keyed by column, best match first.
+        """
+        job_ids = await search_job_ids(query, limit=limit, offset=offset)
+        rows = await Job.filter(id__in=job_ids).values(*dict.fromkeys(["id", *fields]))
+        rows_by_id = {row["id"]: row for row in rows}
+        return [rows_by_id[job_id] for job_id in job_ids if job_id in rows_by_id]
+
+    @_timed
     async def create_job(
         self,
         title: str,
@@ -57,6 +248,7 @@ class JobRepository:
             **kwargs,
         )
 
+    @_timed
     async def get_job_by_url(self, url: HttpUrl | str) -> Job | None:
         """
         Retrieves a job by its URL.
@@ -69,16 +261,125 @@ class JobRepository:
         """
         return await Job.get_or_none(url=str(url))
 
+    @_timed
+    async def get_fingerprints(self, urls: Iterable[HttpUrl | str]) -> dict[str, str | None]:
+        """
+        Returns the stored content fingerprints of the given URLs.
+
+        Uses a single `WHERE url IN (...)` query instead of one lookup per URL.
+
+        Args:
+            urls: The job URLs to look up.
+
+        Returns:
+            The fingerprint of every URL that is already stored, keyed by URL.
+            Rows saved before fingerprints existed map to None.
+        """
+        unique_urls = list({str(url) for url in urls})
+        if not unique_urls:
+            return {}
+        rows = await Job.filter(url__in=unique_urls).values_list("url", "content_hash")
+        return {str(url): content_hash for url, content_hash in rows}
+
+    @_timed
+    async def get_by_urls(self, urls: Iterable[HttpUrl | str]) -> list[Job]:
+        """
+        Retrieves the stored jobs with the given URLs in a single query.
+
+        Args:
+            urls: The job URLs to look up.
+
+        Returns:
+            The jobs found, in no particular order.
+        """
+        unique_urls = list({str(url) for url in urls})
+        if not unique_urls:
+            return []
+        return await Job.filter(url__in=unique_urls)
+
+    @_timed
+    async def bulk_create_jobs(self, jobs: Iterable[JobSchema], batch_size: int = 500) -> None:
+        """
+        Inserts many jobs at once, silently skipping URLs that already exist.
+
+        Conflicts on the unique `url` column are ignored, so two overlapping
+        runs inserting the same vacancy do not fail each other.
+
+        Args:
+            jobs: The jobs to insert.
+            batch_size: The maximum number of rows per INSERT statement.
+        """
+        objects = [
+            Job(
+                title=job.title,
+                url=str(job.url),
+                company=job.company,
+                description=job.description,
+                location=job.location,
+                salary=job.salary,
+                salary_min=job.salary_range.min,
+                salary_max=job.salary_range.max,
+                salary_currency=job.salary_range.currency,
+                content_hash=job.fingerprint,
+            )
+            for job in jobs
+        ]
+        if objects:
+            await Job.bulk_create(objects, batch_size=batch_size, ignore_conflicts=True)
+
+    @_timed
+    async def bulk_update_jobs(self, jobs: Iterable[JobSchema], batch_size: int = 500) -> int:
+        """
+        Overwrites the scraped content of already stored jobs, matched by URL.
+
+        Loads the rows in one query and writes them back with batched
+        `UPDATE ... CASE` statements; `updated_at` is set to the current time.
+
+        Args:
+            jobs: The jobs with their new content.
+            batch_size: The maximum number of rows per UPDATE statement.
+
+        Returns:
+            The number of updated rows.
+        """
+        by_url = {str(job.url): job for job in jobs}
+        if not by_url:
+            return 0
+
+        objects = await Job.filter(url__in=list(by_url))
+        now = timezone.now()
+        for obj in objects:
+            job = by_url[obj.url]
+            obj.title = job.title
+            obj.company = job.company
+            obj.description = job.description
+            obj.location = job.location
+            obj.salary = job.salary
+            obj.salary_min, obj.salary_max, obj.salary_currency = job.salary_range
+            obj.content_hash = job.fingerprint
+            obj.updated_at = now
+        if objects:
+            await Job.bulk_update(objects, fields=_CONTENT_FIELDS, batch_size=batch_size)
+        return len(objects)
+
+    @_timed
     async def update_or_create(self, job_schema: JobSchema) -> Job:
         """
         Updates an existing job or creates a new one based on the URL.
         """
         job_dict = job_schema.model_dump(mode="json", exclude_unset=True)
+        job_dict["content_hash"] = job_schema.fingerprint
+        salary_range = job_schema.salary_range
+        job_dict["salary_min"] = salary_range.min
+        job_dict["salary_max"] = salary_range.max
+        job_dict["salary_currency"] = salary_range.currency
         job, _ = await Job.update_or_create(
-            defaults=job_dict, url=job_dict["url"],
+            defaults=job_dict,
+            url=job_dict["url"],
         )
         return job
 
+    @_timed
     async def add_one(self, **kwargs: Any) -> Job:
         """
         Adds a single object to the database.
@@ -91,6 +392,7 @@ class JobRepository:
         """
         return await Job.create(**kwargs)
 
+    @_timed
     async def get_by_id(self, obj_id: int) -> Job | None:
         """
         Retrieves an object by its ID.
@@ -102,3 +404,255 @@ class JobRepository:
             The retrieved object or None if not found.
         """
         return await Job.get_or_none(id=obj_id)
+
+
+class FetchStateRepository:
+    """A repository for HTTP caching metadata of fetched source pages."""
+
+    async def get_by_url(self, url: str) -> FetchState | None:
+        """
+        Retrieves the fetch state of a page by its URL.
+
+        Args:
+            url: The URL of the page.
+
+        Returns:
+            The FetchState object if found, otherwise None.
+        """
+        return await FetchState.get_or_none(url=url)
+
+    async def save(
+        self,
+        url: str,
+        etag: str | None,
+        last_modified: str | None,
+        content_hash: str,
+    ) -> FetchState:
+        """
+        Creates or updates the fetch state of a page.
+
+        Args:
+            url: The URL of the page.
+            etag: The `ETag` header of the response.
+            last_modified: The `Last-Modified` header of the response.
+            content_hash: The hash of the response body.
+
+        Returns:
+            The saved FetchState object.
+        """
+        state, _ = await FetchState.update_or_create(
+            defaults={
+                "etag": etag,
+                "last_modified": last_modified,
+                "content_hash": content_hash,
+            },
+            url=url,
+        )
+        return state
+
+
+class WatermarkRepository:
+    """A repository for the ingestion watermarks of source listings."""
+
+    async def get_by_listing_url(self, listing_url: str) -> SourceWatermark | None:
+        """
+        Retrieves the watermark of a listing.
+
+        Args:
+            listing_url: The URL of the first page of the listing.
+
+        Returns:
+            The SourceWatermark object if found, otherwise None.
+        """
+        return await SourceWatermark.get_or_none(listing_url=listing_url)
+
+    async def save(
+        self,
+        source: str,
+        listing_url: str,
+        newest_url: str | None,
+        caught_up: bool,  # noqa: FBT001
+        gap_url: str | None = None,
+    ) -> SourceWatermark:
+        """
+        Creates or updates the watermark of a listing.
+
+        Args:
+            source: The name of the job source.
+            listing_url: The URL of the first page of the listing.
+            newest_url: The URL of the newest vacancy seen in the listing.
+            caught_up: Whether the run crawled down to the previous watermark.
+            gap_url: The URL the next run must crawl down to if not caught up.
+
+        Returns:
+            The saved SourceWatermark object.
+        """
+        watermark, _ = await SourceWatermark.update_or_create(
+            defaults={
+                "source": source,
+                "newest_url": newest_url,
+                "caught_up": caught_up,
+                "gap_url": gap_url,
+            },
+            listing_url=listing_url,
+        )
+        return watermark
+
+
+class StatsRepository:
+    """A repository for the precomputed counters of the job statistics."""
+
+    async def apply(self, deltas: Counter[StatKey]) -> None:
+        """
+        Adds the given changes to the counters, creating missing ones.
+
+        Missing counters are inserted at zero with conflicts ignored, then
+        counters are incremented in the database (`count = count + n`), one
+        UPDATE per distinct change, so concurrent writers never lose updates.
+
+        Args:
+            deltas: The change of every counter, keyed by (metric, key).
+        """
+        if not deltas:
+            return
+        await JobStat.bulk_create(
+            [JobStat(metric=metric, key=key, count=0) for metric, key in deltas],
+            ignore_conflicts=True,
+        )
+
+        keys_by_delta: dict[int, dict[str, list[str]]] = {}
+        for (metric, key), delta in deltas.items():
+            keys_by_delta.setdefault(delta, {}).setdefault(metric, []).append(key)
+        for delta, keys_by_metric in keys_by_delta.items():
+            for metric, keys in keys_by_metric.items():
+                await JobStat.filter(metric=metric, key__in=keys).update(
+                    count=F("count") + delta,
+                )
+
+    async def get_count(self, metric: StatMetric, key: str = "") -> int:
+        """
+        Returns the value of a single counter, 0 if it does not exist.
+
+        Args:
+            metric: The metric of the counter.
+            key: The key of the counter within the metric.
+        """
+        count = (
+            await JobStat.filter(metric=metric, key=key)
+            .first()
+            .values_list(
+                "count",
+                flat=True,
+            )
+        )
+        return count or 0
+
+    async def get_top(self, metric: StatMetric, limit: int) -> list[tuple[str, int]]:
+        """
+        Returns the highest non-zero counters of a metric.
+
+        Args:
+            metric: The metric of the counters.
+            limit: The maximum number of counters returned.
+
+        Returns:
+            (key, count) pairs in descending order of count.
+        """
+        rows = (
+            await JobStat.filter(metric=metric, count__gt=0)
+            .order_by("-count", "key")
+            .limit(limit)
+            .values_list("key", "count")
+        )
+        return [(key, count) for key, count in rows]
+
+    async def get_all(self, metric: StatMetric, key_from: str | None = None) -> dict[str, int]:
+        """
+        Returns the non-zero counters of a metric.
+
+        Args:
+            metric: The metric of the counters.
+            key_from: Only counters whose key sorts at or after this one.
+
+        Returns:
+            The count of every counter, keyed by key.
+        """
+        query = JobStat.filter(metric=metric, count__gt=0)
+        if key_from is not None:
+            query = query.filter(key__gte=key_from)
+        rows = await query.values_list("key", "count")
+        return dict(rows)
+
+    async def rebuild(self, counts: Counter[StatKey]) -> None:
+        """
+        Replaces all counters with the given values.
+
+        Args:
+            counts: The value of every counter, keyed by (metric, key).
+        """
+        async with in_transaction():
+            await JobStat.all().delete()
+            await self.apply(counts)
+
+
+class TaskRunRepository:
+    """A repository for the history of scheduled task runs."""
+
+    async def start(self, task: str) -> TaskRun:
+        """
+        Records that a run of a task has started.
+
+        Args:
+            task: The name of the task.
+
+        Returns:
+            The created TaskRun object.
+        """
+        return await TaskRun.create(task=task, status=RunStatus.RUNNING)
+
+    async def finish(
+        self,
+        run: TaskRun,
+        status: RunStatus,
+        report: RunReport,
+        error: str | None = None,
+    ) -> None:
+        """
+        Records the outcome of a run.
+
+        Args:
+            run: The run returned by `start`.
+            status: How the run ended.
+            report: The counters and stage timings collected during the run.
+            error: The error that made the run fail.
+        """
+        run.status = status
+        run.finished_at = timezone.now()
+        run.duration = (run.finished_at - run.started_at).total_seconds()
+        run.pages = report.pages
+        run.jobs_parsed = report.jobs_parsed
+        run.jobs_created = report.jobs_created
+        run.jobs_updated = report.jobs_updated
+        run.errors = report.errors
+        run.fetch_seconds = report.stage_seconds[RunStage.FETCH]
+        run.parse_seconds = report.stage_seconds[RunStage.PARSE]
+        run.dedupe_seconds = report.stage_seconds[RunStage.DEDUPE]
+        run.write_seconds = report.stage_seconds[RunStage.WRITE]
+        run.error = error
+        await run.save()
+
+    async def get_recent(self, limit: int, task: str | None = None) -> list[TaskRun]:
+        """
+        Retrieves the most recent runs, newest first.
+
+        Args:
+            limit: The maximum number of runs to return.
+            task: Only runs of this task, if given.
+
+        Returns:
+            A list of TaskRun objects.
+        """
+        query = TaskRun.all()
+        if task is not None:
+            query = query.filter(task=task)
+        return await query.order_by("-id").limit(limit)
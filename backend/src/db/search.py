@@ -0,0 +1,143 @@
+"""
+Full-text search index over job titles and descriptions.
+
+The index lives in the database and is maintained by the database itself,
+so every write to the `jobs` table (single inserts, bulk inserts and
+updates) is reflected immediately:
+
+* SQLite: an external-content FTS5 table `jobs_fts` kept in sync by triggers;
+* PostgreSQL: a generated `tsvector` column with a GIN index.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from tortoise import connections
+
+if TYPE_CHECKING:
+    from tortoise.backends.base.client import BaseDBAsyncClient
+
+_SQLITE_SCHEMA = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS "jobs_fts" USING fts5(
+        title,
+        description,
+        content='jobs',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS "jobs_fts_ai" AFTER INSERT ON "jobs" BEGIN
+        INSERT INTO "jobs_fts" (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS "jobs_fts_ad" AFTER DELETE ON "jobs" BEGIN
+        INSERT INTO "jobs_fts" ("jobs_fts", rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS "jobs_fts_au" AFTER UPDATE ON "jobs" BEGIN
+        INSERT INTO "jobs_fts" ("jobs_fts", rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO "jobs_fts" (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+# Title matches weigh ten times more than description matches
+_SQLITE_SEARCH = """
+    SELECT rowid AS id FROM "jobs_fts"
+    WHERE "jobs_fts" MATCH ?
+    ORDER BY bm25("jobs_fts", 10.0, 1.0), rowid DESC
+    LIMIT ? OFFSET ?
+"""
+
+_POSTGRES_SCHEMA = [
+    """
+    ALTER TABLE "jobs" ADD COLUMN IF NOT EXISTS "search_vector" tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('russian', coalesce("title", '')), 'A')
+        || setweight(to_tsvector('russian', coalesce("description", '')), 'B')
+    ) STORED
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS "idx_jobs_search_vector" ON "jobs" USING GIN ("search_vector")
+    """,
+]
+_POSTGRES_SEARCH = """
+    SELECT "id" FROM "jobs", websearch_to_tsquery('russian', $1) AS query
+    WHERE "search_vector" @@ query
+    ORDER BY ts_rank("search_vector", query) DESC, "id" DESC
+    LIMIT $2 OFFSET $3
+"""
+
+
+def _connection() -> BaseDBAsyncClient:
+    return connections.get("default")
+
+
+async def ensure_search_index() -> None:
+    """Creates the full-text index if it does not exist yet.
+
+    Safe to call on every startup. On SQLite, a freshly created index is
+    filled from the rows already present in `jobs`.
+
+    Raises:
+        NotImplementedError: If the database dialect is not supported.
+
+    """
+    connection = _connection()
+    dialect = connection.capabilities.dialect
+    if dialect == "sqlite":
+        rows = await connection.execute_query_dict(
+            "SELECT name FROM sqlite_master WHERE name = 'jobs_fts'",
+        )
+        for statement in _SQLITE_SCHEMA:
+            await connection.execute_script(statement)
+        if not rows:
+            await connection.execute_query(
+                """INSERT INTO "jobs_fts" ("jobs_fts") VALUES ('rebuild')""",
+            )
+    elif dialect == "postgres":
+        for statement in _POSTGRES_SCHEMA:
+            await connection.execute_script(statement)
+    else:
+        msg = f"Full-text search is not supported for the '{dialect}' dialect"
+        raise NotImplementedError(msg)
+
+
+async def search_job_ids(query: str, limit: int, offset: int = 0) -> list[int]:
+    """Returns the IDs of the jobs matching the query, best match first.
+
+    Args:
+        query: The user's search query.
+        limit: The maximum number of IDs to return.
+        offset: The number of best matches to skip.
+
+    Returns:
+        The matching job IDs, ordered by relevance.
+
+    """
+    connection = _connection()
+    if connection.capabilities.dialect == "sqlite":
+        match = _to_fts5_query(query)
+        if not match:
+            return []
+        rows = await connection.execute_query_dict(_SQLITE_SEARCH, [match, limit, offset])
+    else:
+        rows = await connection.execute_query_dict(_POSTGRES_SEARCH, [query, limit, offset])
+    return [row["id"] for row in rows]
+
+
+def _to_fts5_query(query: str) -> str:
+    """Turns free text into an FTS5 query matching all words as prefixes.
+
+    Every word is quoted, so FTS5 operators in user input are taken literally.
+    """
+    terms = ['"{}"*'.format(word.replace('"', '""')) for word in query.split()]
+    return " ".join(terms)
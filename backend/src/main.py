@@ -2,11 +2,18 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from tortoise.contrib.fastapi import register_tortoise  # type: ignore[reportUnknownReturnType]
+from tortoise.contrib.fastapi import tortoise_exception_handlers
 
-from src.api.v1.endpoints import jobs
+from src.api.metrics import RequestMetricsMiddleware
+from src.api.metrics import router as metrics_router
+from src.api.v1.endpoints import jobs, runs, stats
 from src.config import get_main_config
+from src.core.fetcher import Fetcher
+from src.core.http import create_http_client
+from src.core.parsers import ParserPool
+from src.db import close_db, init_db
 from src.db.config import get_tortoise_orm_config
+from src.scheduler import TaskScheduler
 from src.utils.notify_logger.logger import NotifyLogger
 
 settings = get_main_config()
@@ -15,6 +22,11 @@ settings = get_main_config()
 # Определяем список файлов моделей для Tortoise ORM
 _MODELS_FILES = [
     "src.db.models.job",
+    "src.db.models.fetch_state",
+    "src.db.models.watermark",
+    "src.db.models.stats",
+    "src.db.models.task_lock",
+    "src.db.models.task_run",
 ]
 
 # Получаем конфигурацию Tortoise ORM
@@ -30,19 +42,38 @@ logger = NotifyLogger()
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     Контекстный менеджер для управления жизненным циклом приложения.
-    Инициализирует подключение к базе данных при старте и закрывает при завершении.
+    Инициализирует подключение к базе данных, общий HTTP-клиент, пул парсеров
+    и планировщик при старте и закрывает их при завершении. Планировщик
+    запускается, только если он включён в конфигурации.
     """
     logger.info("Starting up application...")
-    register_tortoise(
-        app,
-        config=TORTOISE_ORM_CONFIG,
-        generate_schemas=True,
-        add_exception_handlers=True,
-    )
+    await init_db(settings.backend.database)
     logger.info("Database connection established.")
+
+    http_client = create_http_client(settings.backend.http_client)
+    app.state.http_client = http_client
+    parser_pool = None
+    scheduler = None
+    if settings.backend.scheduler.enabled:
+        parser_pool = ParserPool.from_config(settings.backend.ingestion)
+        scheduler = TaskScheduler(
+            fetcher=Fetcher(http_client, settings.backend.ingestion),
+            parser_pool=parser_pool,
+        )
+        scheduler.start()
+    else:
+        logger.info("Scheduler is disabled in this process.")
+
     yield
+
     logger.info("Shutting down application...")
-    # Tortoise-ORM автоматически закроет соединение при выключении приложения
+    if scheduler is not None and parser_pool is not None:
+        await scheduler.stop()
+        parser_pool.shutdown()
+        logger.info("Parser pool stopped.")
+    await http_client.aclose()
+    logger.info("HTTP client closed.")
+    await close_db()
     logger.info("Database connection closed.")
 
 
@@ -61,6 +92,12 @@ def create_app() -> FastAPI:
     )
 
     app.include_router(jobs.router, prefix="/api/v1", tags=["jobs"])
+    app.include_router(stats.router, prefix="/api/v1", tags=["stats"])
+    app.include_router(runs.router, prefix="/api/v1", tags=["runs"])
+    app.include_router(metrics_router)
+    app.add_middleware(RequestMetricsMiddleware)
+    for exception_type, handler in tortoise_exception_handlers().items():
+        app.add_exception_handler(exception_type, handler)
 
     return app
 
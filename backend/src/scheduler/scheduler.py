@@ -1,34 +1,97 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+    JobSubmissionEvent,
+)
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.date import DateTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from src.core.tasks import parse_habr_vacancies
+from src.core.metrics import scheduler_lag_seconds, scheduler_skipped_runs
+from src.core.sources import source_registry
+from src.core.tasks import parse_source
 from src.utils.notify_logger.logger import logger
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
-    from datetime import datetime
+
+    from src.core.fetcher import Fetcher
+    from src.core.parsers import ParserPool
+    from src.core.sources import SourceRegistry
 
 
 class TaskScheduler:
     """Class for managing tasks."""
 
-    def __init__(self) -> None:
-        """Initialize the scheduler."""
+    def __init__(
+        self,
+        fetcher: Fetcher | None = None,
+        sources: SourceRegistry | None = None,
+        parser_pool: ParserPool | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            fetcher: The shared fetcher passed to the parsing jobs.
+            sources: The job sources to schedule, the global registry by default.
+            parser_pool: The pool the parsing jobs parse pages in.
+        """
         self.scheduler = AsyncIOScheduler()
+        self.fetcher = fetcher
+        self.sources = source_registry if sources is None else sources
+        self.parser_pool = parser_pool
         self._is_running = False
+        # Tasks of the runs in progress, awaited on shutdown
+        self._running: set[asyncio.Task[Any]] = set()
         self.name = self.__class__.__name__
+        self.scheduler.add_listener(
+            self._record_run_metrics,
+            EVENT_JOB_SUBMITTED | EVENT_JOB_MISSED | EVENT_JOB_MAX_INSTANCES,
+        )
         self.setup_jobs()
 
     def setup_jobs(self) -> None:
-        """Add all scheduled jobs to the scheduler."""
-        self.add_interval_job(parse_habr_vacancies, minutes=60)
+        """Add all scheduled jobs to the scheduler.
+
+        Every job source gets its own parsing job on its own schedule. The jobs
+        run concurrently and share the fetcher, which holds the HTTP client and
+        the fetch budget, and the parser pool. A tick more than half an
+        interval late is dropped, as the next one is due soon anyway.
+        """
+        for source in self.sources:
+            self.add_interval_job(
+                parse_source,
+                minutes=source.interval_minutes,
+                kwargs={
+                    "source_name": source.name,
+                    "fetcher": self.fetcher,
+                    "parser_pool": self.parser_pool,
+                },
+                job_id=f"parse_{source.name}",
+                misfire_grace_time=source.interval_minutes * 30,
+            )
         logger.info("Parsing jobs have been set up.", author=self.name)
 
+    def _record_run_metrics(self, event: JobEvent) -> None:
+        """Records how late runs start, and the runs skipped."""
+        if event.code == EVENT_JOB_SUBMITTED and isinstance(event, JobSubmissionEvent):
+            # Coalesced runs are late from their most recent planned time
+            lag = datetime.now(UTC) - max(event.scheduled_run_times)
+            scheduler_lag_seconds.observe(max(lag.total_seconds(), 0.0), job=event.job_id)
+        elif event.code == EVENT_JOB_MISSED:
+            scheduler_skipped_runs.inc(job=event.job_id, reason="misfire")
+        elif event.code == EVENT_JOB_MAX_INSTANCES:
+            scheduler_skipped_runs.inc(job=event.job_id, reason="overlap")
+
     def start(self) -> None:
         """Start the scheduler."""
         if not self._is_running:
@@ -36,10 +99,18 @@ class TaskScheduler:
             self._is_running = True
             logger.info("планировщик запущен", author=self.name)
 
-    def stop(self) -> None:
-        """Stop the scheduler."""
+    async def stop(self) -> None:
+        """Stop the scheduler.
+
+        Running tasks are cancelled, and their cleanup, such as releasing
+        their locks, is waited for, so it is done before the database closes.
+        """
         if self._is_running:
+            running = list(self._running)
             self.scheduler.shutdown()
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
             self._is_running = False
             logger.info("планировщик остановлен", author=self.name)
 
@@ -53,8 +124,31 @@ class TaskScheduler:
         args: tuple[Any, ...] | None = None,
         kwargs: dict[str, Any] | None = None,
         job_id: str | None = None,
+        max_instances: int = 1,
+        coalesce: bool = True,  # noqa: FBT001, FBT002
+        misfire_grace_time: int | None = None,
     ) -> None:
-        """Add a periodic task."""
+        """Add a periodic task.
+
+        By default a run never overlaps the previous one in this process,
+        and the ticks missed while the task was running or the event loop was
+        busy are merged into a single late run instead of piling up.
+
+        Args:
+            func: The coroutine function to run.
+            hours: The interval hours.
+            minutes: The interval minutes.
+            seconds: The interval seconds.
+            start_date: When the first run is due, one interval from now by default.
+            args: The positional arguments of the task.
+            kwargs: The keyword arguments of the task.
+            job_id: The job ID, replacing an existing job with the same ID.
+            max_instances: The maximum number of concurrent runs; a tick
+                beyond it is skipped.
+            coalesce: Whether missed ticks are merged into a single run.
+            misfire_grace_time: Seconds a tick may run late before it is
+                dropped, unlimited if None.
+        """
         trigger = IntervalTrigger(
             hours=hours,
             minutes=minutes,
@@ -63,16 +157,37 @@ class TaskScheduler:
         )
 
         self.scheduler.add_job(
-            func,
+            self._tracked(func),
             trigger=trigger,
             args=args or (),
             kwargs=kwargs or {},
             id=job_id,
             replace_existing=True,
+            max_instances=max_instances,
+            coalesce=coalesce,
+            misfire_grace_time=misfire_grace_time,
         )
         log = f"periodic task added: {func.__name__}"
         logger.info(log, author=self.name)
 
+    def _tracked(
+        self,
+        func: Callable[..., Coroutine[Any, Any, Any]],
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """Wraps a task so that its runs in progress are known to `stop`."""
+
+        @functools.wraps(func)
+        async def run(*args: Any, **kwargs: Any) -> Any:
+            task = asyncio.current_task()
+            if task is not None:
+                self._running.add(task)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                self._running.discard(task)  # type: ignore[arg-type]
+
+        return run
+
     def remove_job(self, job_id: str) -> None:
         """Remove a task by ID."""
         self.scheduler.remove_job(job_id)
@@ -93,7 +208,7 @@ class TaskScheduler:
         trigger = DateTrigger(run_date=run_date)
 
         self.scheduler.add_job(
-            func,
+            self._tracked(func),
             trigger=trigger,
             args=args or (),
             kwargs=kwargs or {},
@@ -30,6 +30,15 @@ class TelegramHandlerConfig(BaseTelegramConfig):
 
     level: LogLevel = "WARNING"
 
+    queue_size: int = Field(default=1000, gt=0)
+    """Messages waiting for delivery; further messages are dropped and counted"""
+
+    batch_interval: float = Field(default=2.0, ge=0)
+    """Seconds a burst of messages is collected before it is sent as one"""
+
+    chat_interval: float = Field(default=1.0, ge=0)
+    """Minimum seconds between two messages to the same chat"""
+
 
 class WebSocketHandlerConfig(BaseModel):
     """Configuration for the WebSocket handler."""
@@ -37,6 +46,9 @@ class WebSocketHandlerConfig(BaseModel):
     level: LogLevel = "DEBUG"
     max_history: int = 200
 
+    queue_size: int = Field(default=5000, gt=0)
+    """Log records waiting for delivery; further records below ERROR are dropped"""
+
 
 class TelegramNotifierConfig(BaseTelegramConfig):
     """Configuration for the Telegram notifier."""
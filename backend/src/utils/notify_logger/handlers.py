@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import queue
 import sys
+import threading
+import time
+from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from .formatters import InternalLogFormatter
 from .types import LogHandler, LogLevel, LogMessage
-from .websocket_manager import WebSocketHandlerManager
+from .websocket_manager import CRITICAL_LEVELS, WebSocketHandlerManager
 
 if TYPE_CHECKING:
     from loguru import Message, Record
@@ -21,12 +26,15 @@ if TYPE_CHECKING:
     )
 
 TeleBot: Any
+ApiTelegramException: Any
 smart_split: Any
 try:
     from telebot import TeleBot
+    from telebot.apihelper import ApiTelegramException
     from telebot.util import smart_split
 except ImportError:
     TeleBot = None
+    ApiTelegramException = None
     smart_split = None
 
 _python_logger = logging.getLogger(__name__)
@@ -68,7 +76,28 @@ class FileHandler(LogHandler):
 
 
 class TelegramHandler(LogHandler):
-    """Log handler that sends log entries to Telegram."""
+    """
+    Log handler that sends log entries to Telegram.
+
+    Logging never waits for Telegram: the sink only queues the message, and a
+    background thread delivers it. The queue is bounded; once it is full,
+    further messages are dropped and the next delivery reports how many.
+
+    The worker collects a burst of messages for `batch_interval` seconds and
+    sends it as one message per chat. Messages of the same level whose text
+    starts with the same subject, as in "✅ Found new job: <title>", are
+    coalesced into a single "✅ Found new job ×37:" entry listing the details.
+    Deliveries to a chat are spaced by `chat_interval` seconds and by the
+    global Telegram limit, and a "429 Too Many Requests" answer is retried
+    after the delay Telegram asks for.
+    """
+
+    # Telegram accepts about 30 messages per second across all chats
+    GLOBAL_INTERVAL = 1 / 30
+    # Details listed under a coalesced subject before the rest is counted
+    MAX_DETAILS = 20
+    MAX_BATCH = 500
+    MAX_RETRIES = 3
 
     def __init__(self, config: TelegramHandlerConfig) -> None:
         """
@@ -88,29 +117,40 @@ class TelegramHandler(LogHandler):
         self.bot = TeleBot(self.config.bot_token, threaded=False)
         self.formatter = InternalLogFormatter()
         self.format = self.formatter.telegram_format
+        self.dropped_count = 0
+        self._reported_dropped = 0
+        self._queue: queue.Queue[Message | None] = queue.Queue(maxsize=config.queue_size)
+        self._worker: threading.Thread | None = None
+        self._next_send: dict[int, float] = {}
+        self._next_send_any = 0.0
 
-    def sink(self, message: str) -> None:
+    def write(self, message: Message) -> None:
         """
-        The sink function that actually sends the message.
+        The sink function: queues the message for delivery without waiting.
 
         Args:
             message: The pre-formatted message from loguru.
         """
-        list_messages: list[str] = (
-            smart_split(message) if smart_split else [message]
-        )
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped_count += 1
 
-        for admin_id in self.config.admin_ids:
-            for msg in list_messages:
-                try:
-                    self.bot.send_message(
-                        admin_id,
-                        msg,
-                        timeout=self.config.timeout,
-                    )
-                except Exception as e:
-                    log = f"[{self.name}]: failed to send Telegram notification: {e}"
-                    _python_logger.exception(log)
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Delivers the queued messages and stops the worker.
+
+        Called by loguru when the handler is removed.
+
+        Args:
+            timeout: Seconds to wait for the delivery.
+        """
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        with contextlib.suppress(queue.Full):
+            self._queue.put(None, timeout=timeout)
+        worker.join(timeout)
 
     def filter(self, record: Record) -> bool:
         """
@@ -120,17 +160,122 @@ class TelegramHandler(LogHandler):
         return record["extra"].get("notify", False) is True
 
     def add(self) -> None:
-        """Adds the Telegram handler to loguru with the filter and sink."""
+        """Adds the Telegram handler to loguru and starts the delivery worker."""
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._deliver,
+                name=self.name,
+                daemon=True,
+            )
+            self._worker.start()
         logger.add(
-            self.sink,
+            self,
             format=self.format,
             level=self.config.level,
             filter=self.filter,
         )
 
+    def _deliver(self) -> None:
+        """Sends the queued messages in batches until stopped."""
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.config.batch_interval
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    message = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if message is None:
+                    stopping = True
+                    break
+                batch.append(message)
+            self._send(self._render(batch))
+
+    def _render(self, batch: list[Message]) -> str:
+        """Renders a batch as one text, coalescing messages of the same subject."""
+        groups: list[list[Message]] = []
+        by_subject: dict[tuple[str, str], list[Message]] = {}
+        for message in batch:
+            record = message.record
+            subject, separator, _ = record["message"].partition(": ")
+            # Messages with a traceback or without a subject are kept apart
+            if record["exception"] is None and separator:
+                key = (record["level"].name, subject)
+                if key in by_subject:
+                    by_subject[key].append(message)
+                    continue
+                by_subject[key] = [message]
+                groups.append(by_subject[key])
+            else:
+                groups.append([message])
+
+        parts: list[str] = []
+        dropped = self.dropped_count - self._reported_dropped
+        if dropped:
+            self._reported_dropped += dropped
+            parts.append(f"⚠️ {dropped} log messages were dropped: the Telegram queue was full")
+        for messages in groups:
+            if len(messages) == 1:
+                parts.append(messages[0].rstrip("\n"))
+                continue
+            level = messages[0].record["level"]
+            subject = messages[0].record["message"].partition(": ")[0]
+            details = [m.record["message"].partition(": ")[2] for m in messages]
+            lines = [f"{level.icon} {level.name}|{subject} ×{len(messages)}:"]
+            lines.extend(f"• {detail}" for detail in details[: self.MAX_DETAILS])
+            if len(details) > self.MAX_DETAILS:
+                lines.append(f"… and {len(details) - self.MAX_DETAILS} more")
+            parts.append("\n".join(lines))
+        return "\n\n".join(parts)
+
+    def _send(self, text: str) -> None:
+        """Sends a text to every admin, split to Telegram's message size."""
+        list_messages: list[str] = smart_split(text) if smart_split else [text]
+
+        for admin_id in self.config.admin_ids:
+            for msg in list_messages:
+                try:
+                    self._send_message(admin_id, msg)
+                except Exception as e:
+                    log = f"[{self.name}]: failed to send Telegram notification: {e}"
+                    _python_logger.exception(log)
+
+    def _send_message(self, chat_id: int, text: str) -> None:
+        """Sends one message within the rate limits, retrying when throttled."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            now = time.monotonic()
+            delay = max(self._next_send.get(chat_id, 0.0), self._next_send_any) - now
+            if delay > 0:
+                time.sleep(delay)
+                now += delay
+            self._next_send[chat_id] = now + self.config.chat_interval
+            self._next_send_any = now + self.GLOBAL_INTERVAL
+            try:
+                self.bot.send_message(chat_id, text, timeout=self.config.timeout)
+            except ApiTelegramException as e:
+                if e.error_code != HTTPStatus.TOO_MANY_REQUESTS or attempt == self.MAX_RETRIES:
+                    raise
+                retry_after = (e.result_json.get("parameters") or {}).get("retry_after", 1)
+                self._next_send[chat_id] = time.monotonic() + retry_after
+            else:
+                return
+
 
 class WebSocketHandler(LogHandler):
-    """Обработчик для отправки логов через WebSocket"""
+    """
+    Обработчик для отправки логов через WebSocket
+
+    loguru вызывает `process_log` в своём потоке (`enqueue=True`), где нет
+    цикла событий. Записи складываются в буфер под блокировкой, а перенос в
+    очередь `WebSocketHandlerManager` планируется в цикле через
+    `loop.call_soon_threadsafe` — один раз на пачку, а не на каждую запись.
+    Буфер ограничен размером очереди: при переполнении записи ниже ERROR
+    отбрасываются и учитываются, ERROR и CRITICAL не теряются никогда.
+    """
 
     def __init__(self, config: WebSocketHandlerConfig) -> None:
         """
@@ -142,9 +287,16 @@ class WebSocketHandler(LogHandler):
         self.manager = WebSocketHandlerManager()
         self.formatter = InternalLogFormatter()
         self.level = config.level
+        self.buffer_size = config.queue_size
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+        self._buffer: list[LogMessage] = []
+        self._dropped = 0
+        self._flush_scheduled = False
 
     def add(self) -> None:
-        """Добавляет обработчик к loguru"""
+        """Добавляет обработчик к loguru; вызывается из работающего цикла событий"""
+        self._loop = asyncio.get_running_loop()
         logger.add(
             self.process_log,
             level=self.level,
@@ -155,23 +307,48 @@ class WebSocketHandler(LogHandler):
 
     def process_log(self, message: Message) -> None:
         """
-        Обрабатывает сообщение лога
+        Обрабатывает сообщение лога в потоке loguru
 
         Args:
             message: Объект Message от loguru, содержащий record
         """
+        record = message.record
+        # Формируем LogMessage из record
+        log_entry: LogMessage = {
+            "level": record["level"].name,
+            "timestamp": record["time"].strftime("%Y-%m-%d %H:%M:%S.%f"),
+            "message": record["message"],
+        }
+        self.push(log_entry)
+
+    def push(self, log_entry: LogMessage) -> None:
+        """
+        Кладёт запись в буфер из любого потока, не дожидаясь цикла событий
+
+        Args:
+            log_entry: Запись лога
+        """
+        with self._lock:
+            if len(self._buffer) >= self.buffer_size and log_entry["level"] not in CRITICAL_LEVELS:
+                self._dropped += 1
+                return
+            self._buffer.append(log_entry)
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        if self._loop is None:
+            return
         try:
-            record = message.record
-            # Формируем LogMessage из record
-            log_entry: LogMessage = {
-                "level": record["level"].name,
-                "timestamp": record["time"].strftime("%Y-%m-%d %H:%M:%S.%f"),
-                "message": record["message"],
-            }
-
-            # Добавляем в очередь асинхронно, без блокировки
-            task = asyncio.create_task(self.manager.add_log(log_entry))
-            self.manager.pending_tasks.add(task)
-            task.add_done_callback(self.manager.pending_tasks.discard)
-        except Exception:
-            _python_logger.exception("Ошибка при обработке лога для WebSocket")
+            self._loop.call_soon_threadsafe(self._flush)
+        except RuntimeError:
+            # Цикл событий уже закрыт: приложение завершается
+            _python_logger.debug("Цикл событий закрыт, логи для WebSocket пропущены")
+
+    def _flush(self) -> None:
+        """Переносит накопленную пачку записей в очередь менеджера (в цикле событий)"""
+        with self._lock:
+            log_entries, self._buffer = self._buffer, []
+            dropped, self._dropped = self._dropped, 0
+            self._flush_scheduled = False
+        self.manager.add_logs(log_entries, dropped)
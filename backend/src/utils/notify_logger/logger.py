@@ -42,6 +42,9 @@ class NotifyLogger:
         self.name = self.__class__.__name__
         self.formatter = ExternalLogFormatter()
         self._original = loguru_logger
+        # Bound once: binding creates a new logger on every call
+        self._notifying = loguru_logger.bind(notify=True)
+        self._silent = loguru_logger.bind(notify=False)
 
         self._remove_loguru_logger()
         self._init_default_handler()
@@ -113,6 +116,20 @@ class NotifyLogger:
         manager = WebSocketHandlerManager()
         await manager.stop()
 
+    def is_enabled(self, level: LogLevel) -> bool:
+        """
+        Tells whether a record of the given level would reach any handler.
+
+        Reads the minimum level loguru keeps up to date as handlers are added
+        and removed, so the check costs a couple of lookups. Useful to guard
+        building an expensive message.
+
+        Args:
+            level: The log level.
+        """
+        core = self.original._core  # noqa: SLF001
+        return bool(core.handlers) and core.levels_lookup[level][2] >= core.min_level
+
     def _log(  # noqa: PLR0913
         self,
         level: LogLevel,
@@ -126,6 +143,10 @@ class NotifyLogger:
         """
         Internal logging function that binds the 'notify' flag to the record.
 
+        Records below the level of every handler are dropped before any work.
+        Otherwise the message is formatted lazily, once loguru accepts the
+        record.
+
         Args:
             level: The log level.
             message: The log message.
@@ -134,24 +155,25 @@ class NotifyLogger:
             details: Additional details for the log.
             notify: If True, the Telegram handler will be triggered.
         """
+        if not self.is_enabled(level):
+            return
+
         author = author or _author_context.get()
         details = details or _details_context.get()
-
         func_path = get_dynamic_func_path()
-        formatted_message = self.formatter.format_message(
-            message=message,
-            func_path=func_path,
-            exception=exception,
-            author=author,
-            details=details,
-        )
 
-        # Bind the notify flag to the log record's "extra" dict
-        bound_logger = self.original.bind(notify=notify)
-        bound_logger.opt(exception=exception, lazy=True).log(
-            level,
-            formatted_message,
-        )
+        def format_message() -> str:
+            return self.formatter.format_message(
+                message=message,
+                func_path=func_path,
+                exception=exception,
+                author=author,
+                details=details,
+            )
+
+        # The notify flag is bound to the log record's "extra" dict
+        bound_logger = self._notifying if notify else self._silent
+        bound_logger.opt(exception=exception, lazy=True).log(level, "{}", format_message)
 
     # --- High-level logging methods ---
     def debug(
@@ -394,9 +416,7 @@ def create_handlers_from_config(config: LoggerConfig) -> list[LogHandler]:
 
     if config.use_websocket_handler and config.websocket_handler:
         manager = WebSocketHandlerManager()
-        log_file_path = (
-            str(config.file_handler.path) if config.use_file_handler else None
-        )
+        log_file_path = str(config.file_handler.path) if config.use_file_handler else None
         manager.configure(config.websocket_handler, log_file_path)
         handlers.append(WebSocketHandler(config.websocket_handler))
 
@@ -1,5 +1,8 @@
 import datetime
-import inspect
+import functools
+import sys
+from pathlib import Path
+from types import CodeType
 from typing import Any
 
 from .types import LogLevel, LogMessage
@@ -60,13 +63,23 @@ def _normalize_log_message(raw_log_message: dict[str, Any]) -> LogMessage:
     return log_message
 
 
+# Files of the logger wrappers, skipped when looking for the caller
+_LOGGER_FILES = frozenset({__file__, str(Path(__file__).with_name("logger.py"))})
+
+
 def get_dynamic_func_path() -> str:
-    """Get caller info dynamically by skipping logger module frames."""
-    frame = inspect.currentframe()
-    if not frame or not frame.f_back:
-        return ""
-    caller = frame.f_back.f_back or frame.f_back
-    filename = caller.f_code.co_filename
-    func_name = caller.f_code.co_name
-    line_no = caller.f_lineno
-    return f"{filename}:{func_name}:{line_no}"
+    """
+    Get caller info dynamically by skipping logger module frames.
+
+    The path of a call site is formatted once and then served from a cache
+    keyed by its code object and line, so only the frame walk is paid per call.
+    """
+    frame = sys._getframe(1)  # noqa: SLF001
+    while frame.f_back is not None and frame.f_code.co_filename in _LOGGER_FILES:
+        frame = frame.f_back
+    return _format_func_path(frame.f_code, frame.f_lineno)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_func_path(code: CodeType, line_no: int) -> str:
+    return f"{code.co_filename}:{code.co_name}:{line_no}"
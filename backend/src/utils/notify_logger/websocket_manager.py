@@ -18,6 +18,9 @@ if TYPE_CHECKING:
 
 _python_logger = logging.getLogger(__name__)
 
+# Levels never dropped when the log queue is full
+CRITICAL_LEVELS = frozenset({"ERROR", "CRITICAL"})
+
 
 class WebSocketHandlerManager:
     """Менеджер для управления WebSocket клиентами и отправкой логов"""
@@ -37,9 +40,10 @@ class WebSocketHandlerManager:
             return
 
         self.clients: set[WebSocketClient] = set()
-        self.log_queue: asyncio.Queue[LogMessage] = asyncio.Queue(
-            maxsize=5000,
-        )
+        # Batches of log records; the bound is on records, see add_logs
+        self.log_queue: asyncio.Queue[list[LogMessage]] = asyncio.Queue()
+        self.max_queued_records = 5000
+        self.queued_records = 0
         self.log_history: deque[LogMessage] = deque(maxlen=200)
         self.processor_task: asyncio.Task[None] | None = None
         self.initialized = True
@@ -47,6 +51,7 @@ class WebSocketHandlerManager:
         self.pending_tasks: set[asyncio.Task[None]] = set()
         self.config: WebSocketHandlerConfig | None = None
         self.log_file_path: str | None = None
+        self.dropped_count = 0
 
     def configure(
         self,
@@ -59,6 +64,7 @@ class WebSocketHandlerManager:
         self.config = config
         self.log_file_path = log_file_path
         self.log_history = deque(maxlen=self.config.max_history)
+        self.max_queued_records = self.config.queue_size
 
     def start(self) -> None:
         """Запускает обработчик логов"""
@@ -138,17 +144,18 @@ class WebSocketHandlerManager:
         """Обрабатывает очередь логов и отправляет их клиентам"""
         while True:
             try:
-                log_entry = await self.log_queue.get()
+                log_entries = await self.log_queue.get()
+                self.queued_records -= len(log_entries)
 
                 # Добавляем в историю
-                self.log_history.append(log_entry)
+                self.log_history.extend(log_entries)
 
-                # Если есть подключенные клиенты, отправляем им лог
+                # Если есть подключенные клиенты, отправляем им логи
                 if self.clients:
                     # Создаем задачу для отправки логов, чтобы не блокировать
                     # основной цикл
                     send_task = asyncio.create_task(
-                        self._send_to_clients(log_entry),
+                        self._send_to_clients(log_entries),
                     )
                     self.pending_tasks.add(send_task)
                     send_task.add_done_callback(self.pending_tasks.discard)
@@ -161,18 +168,19 @@ class WebSocketHandlerManager:
                 _python_logger.exception(log)
                 await asyncio.sleep(0.1)  # Небольшая пауза при ошибке
 
-    async def _send_to_clients(self, log_entry: LogMessage) -> None:
+    async def _send_to_clients(self, log_entries: list[LogMessage]) -> None:
         """
-        Отправляет лог всем клиентам
+        Отправляет пачку логов всем клиентам
 
         Args:
-            log_entry: Запись лога для отправки
+            log_entries: Записи лога для отправки, по порядку
         """
         disconnected: set[WebSocketClient] = set()
         clients = set(self.clients)
         for client in clients:
             try:
-                await client.send_json(log_entry)
+                for log_entry in log_entries:
+                    await client.send_json(log_entry)
             except Exception as e:
                 log = f"Ошибка при отправке логов клиенту: {e}"
                 _python_logger.exception(log)
@@ -226,23 +234,34 @@ class WebSocketHandlerManager:
             print(f"Ошибка при отправке истории логов: {e}")
             self.remove_client(client)
 
-    async def add_log(self, log_entry: LogMessage) -> None:
+    def add_logs(self, log_entries: list[LogMessage], dropped: int = 0) -> None:
         """
-        Добавляет лог в очередь отправки
+        Добавляет пачку логов в очередь отправки, не блокируя цикл событий.
+
+        В очереди помещается не больше `max_queued_records` записей. Если
+        пачка не помещается целиком, ERROR и CRITICAL ставятся в очередь
+        всегда, а оставшееся место занимают первые записи ниже ERROR;
+        остальные отбрасываются и учитываются в `dropped_count`.
 
         Args:
-            log_entry: Запись лога
+            log_entries: Записи лога, по порядку
+            dropped: Записи, уже отброшенные до очереди
         """
-        # Защита от переполнения очереди
-        try:
-            # Используем non-blocking put с тайм-аутом
-            await asyncio.wait_for(self.log_queue.put(log_entry), timeout=0.5)
-        except asyncio.TimeoutError:  # noqa: UP041
-            # Если очередь переполнена, пропускаем некритичные логи
-            if log_entry.get("level") in ["ERROR", "CRITICAL"]:
-                # Для критичных логов пробуем еще раз, но уже в
-                # блокирующем режиме
-                await self.log_queue.put(log_entry)
-            else:
-                log = f"Очередь логов переполнена, лог пропущен: {log_entry.get('message', '')}"
-                _python_logger.exception(log)
+        self.dropped_count += dropped
+        room = self.max_queued_records - self.queued_records
+        if len(log_entries) > room:
+            critical_count = sum(entry["level"] in CRITICAL_LEVELS for entry in log_entries)
+            other_room = max(room - critical_count, 0)
+            kept: list[LogMessage] = []
+            for entry in log_entries:
+                if entry["level"] in CRITICAL_LEVELS:
+                    kept.append(entry)
+                elif other_room:
+                    kept.append(entry)
+                    other_room -= 1
+            self.dropped_count += len(log_entries) - len(kept)
+            log_entries = kept
+        if not log_entries:
+            return
+        self.queued_records += len(log_entries)
+        self.log_queue.put_nowait(log_entries)
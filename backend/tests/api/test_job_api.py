@@ -1,12 +1,21 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import pytest
 from fastapi.testclient import TestClient
-from pydantic import ValidationError
+from pydantic import HttpUrl, ValidationError
 
+from src.api.events import stream_sse
 from src.api.schemas import JobResponse
-from src.db.repository import JobRepository
+from src.core.cache import job_cache
+from src.core.runs import RunReport, RunStatus
+from src.core.schemas import JobSchema
+from src.core.services import JobService
+from src.db.repository import JobRepository, TaskRunRepository
 from src.main import app  # Импортируем наше FastAPI приложение
 
 if TYPE_CHECKING:
@@ -148,3 +157,389 @@ async def test_get_job_by_id_with_existing_job(job_repository: JobRepository) ->
     assert response_data["title"] == test_job.title
     assert response_data["company"] == test_job.company
     assert response_data["url"] == test_job.url
+
+
+@pytest.mark.asyncio
+async def test_get_all_jobs_paginates_with_cursor(job_repository: JobRepository) -> None:
+    """
+    Test that GET /api/v1/jobs returns newest jobs first in pages of `limit` items and
+    that following the `X-Next-Cursor` header walks every job exactly once.
+    """
+    # Arrange
+    jobs_count = 5
+    for i in range(jobs_count):
+        await job_repository.add_one(
+            title=f"Job {i}",
+            company="Corp",
+            url=f"https://example.com/job/{i}",
+        )
+    client = TestClient(app)
+
+    # Act
+    seen_titles: list[str] = []
+    pages_count = 0
+    params: dict[str, Any] = {"limit": 2}
+    while True:
+        response = client.get("/api/v1/jobs", params=params)
+        assert response.status_code == 200  # noqa: PLR2004
+        seen_titles.extend(job["title"] for job in response.json())
+        pages_count += 1
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params["cursor"] = next_cursor
+
+    # Assert
+    expected_pages_count = 3
+    assert pages_count == expected_pages_count
+    assert seen_titles == [f"Job {i}" for i in reversed(range(jobs_count))]
+
+
+@pytest.mark.asyncio
+async def test_get_all_jobs_filters_by_company_and_location(
+    job_repository: JobRepository,
+) -> None:
+    """
+    Test that GET /api/v1/jobs applies the company and location filters.
+    """
+    await job_repository.add_one(
+        title="Match",
+        company="A",
+        location="Moscow",
+        url="https://example.com/job/1",
+    )
+    await job_repository.add_one(
+        title="Other company",
+        company="B",
+        location="Moscow",
+        url="https://example.com/job/2",
+    )
+    await job_repository.add_one(
+        title="Other location",
+        company="A",
+        location="Remote",
+        url="https://example.com/job/3",
+    )
+    client = TestClient(app)
+
+    response = client.get("/api/v1/jobs", params={"company": "A", "location": "Moscow"})
+
+    assert [job["title"] for job in response.json()] == ["Match"]
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_get_all_jobs_filters_by_creation_date(job_repository: JobRepository) -> None:
+    """
+    Test that GET /api/v1/jobs applies the created_from/created_to date range.
+    """
+    job = await job_repository.add_one(
+        title="Job",
+        company="Corp",
+        url="https://example.com/job/1",
+    )
+    client = TestClient(app)
+
+    created_at = job.created_at.isoformat()
+    inside = client.get("/api/v1/jobs", params={"created_from": created_at})
+    outside = client.get("/api/v1/jobs", params={"created_to": created_at})
+
+    assert [item["title"] for item in inside.json()] == ["Job"]
+    assert outside.json() == []
+
+
+def test_get_all_jobs_rejects_invalid_cursor() -> None:
+    """
+    Test that GET /api/v1/jobs returns 400 Bad Request for a malformed cursor.
+    """
+    client = TestClient(app)
+    response = client.get("/api/v1/jobs", params={"cursor": "not-a-cursor"})
+    bad_request_status_code = 400
+
+    assert response.status_code == bad_request_status_code
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_endpoint_returns_ranked_matches(job_repository: JobRepository) -> None:
+    """
+    Test that GET /api/v1/jobs/search returns matching jobs only, best match first.
+    """
+    await job_repository.add_one(
+        title="Backend Developer",
+        company="A",
+        url="https://example.com/job/1",
+        description="FastAPI and PostgreSQL",
+    )
+    await job_repository.add_one(
+        title="FastAPI Developer", company="B", url="https://example.com/job/2"
+    )
+    await job_repository.add_one(title="Designer", company="C", url="https://example.com/job/3")
+    client = TestClient(app)
+
+    response = client.get("/api/v1/jobs/search", params={"q": "fastapi"})
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert [job["title"] for job in response.json()] == ["FastAPI Developer", "Backend Developer"]
+
+
+@pytest.mark.asyncio
+async def test_export_jobs_streams_ndjson(job_repository: JobRepository) -> None:
+    """
+    Test that GET /api/v1/jobs/export streams one JSON document per job, newest first.
+    """
+    for i in range(3):
+        await job_repository.add_one(
+            title=f"Job {i}",
+            company="Corp",
+            url=f"https://example.com/job/{i}",
+        )
+    client = TestClient(app)
+
+    response = client.get("/api/v1/jobs/export")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["title"] for line in lines] == ["Job 2", "Job 1", "Job 0"]
+
+
+@pytest.mark.asyncio
+async def test_export_jobs_streams_filtered_csv(job_repository: JobRepository) -> None:
+    """
+    Test that GET /api/v1/jobs/export?format=csv streams a CSV with a header row
+    and honours the list filters.
+    """
+    await job_repository.add_one(title="Kept", company="A", url="https://example.com/job/1")
+    await job_repository.add_one(title="Dropped", company="B", url="https://example.com/job/2")
+    client = TestClient(app)
+
+    response = client.get("/api/v1/jobs/export", params={"format": "csv", "company": "A"})
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in rows] == ["Kept"]
+    assert rows[0]["url"] == "https://example.com/job/1"
+
+
+@pytest.mark.asyncio
+async def test_job_endpoints_serve_not_modified_until_jobs_are_ingested(
+    job_repository: JobRepository,
+) -> None:
+    """
+    Test that list and detail responses carry an ETag, that presenting it yields
+    304 Not Modified, and that ingesting new jobs changes the ETag.
+    """
+    job = await job_repository.add_one(
+        title="Cached Job",
+        company="Corp",
+        url="https://example.com/job/1",
+    )
+    client = TestClient(app)
+    not_modified_status_code = 304
+
+    list_response = client.get("/api/v1/jobs")
+    detail_response = client.get(f"/api/v1/jobs/{job.id}")
+    etag = list_response.headers["ETag"]
+    assert detail_response.headers["ETag"] != etag
+    assert (
+        client.get(
+            f"/api/v1/jobs/{job.id}",
+            headers={"If-None-Match": detail_response.headers["ETag"]},
+        ).status_code
+        == not_modified_status_code
+    )
+
+    revalidated = client.get("/api/v1/jobs", headers={"If-None-Match": etag})
+    assert revalidated.status_code == not_modified_status_code
+    assert revalidated.content == b""
+
+    await JobService()._save_jobs(  # noqa: SLF001
+        [JobSchema(title="Fresh Job", company="Corp", url=HttpUrl("https://example.com/job/2"))],
+    )
+
+    refreshed = client.get("/api/v1/jobs", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200  # noqa: PLR2004
+    assert refreshed.headers["ETag"] != etag
+    assert {item["title"] for item in refreshed.json()} == {"Cached Job", "Fresh Job"}
+
+
+@pytest.mark.asyncio
+async def test_etag_changes_when_jobs_are_written_behind_the_cache(
+    job_repository: JobRepository,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that a write the cache is not told about, such as one by another
+    worker or a maintenance command, changes the ETag once the cached
+    response expires, instead of revalidating the stale one forever.
+    """
+    monkeypatch.setattr(job_cache, "ttl", 0)
+    await job_repository.add_one(title="Old Job", company="Corp", url="https://example.com/job/1")
+    client = TestClient(app)
+
+    etag = client.get("/api/v1/jobs").headers["ETag"]
+    assert client.get("/api/v1/jobs", headers={"If-None-Match": etag}).status_code == 304  # noqa: PLR2004
+
+    await job_repository.add_one(title="New Job", company="Corp", url="https://example.com/job/2")
+
+    refreshed = client.get("/api/v1/jobs", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200  # noqa: PLR2004
+    assert refreshed.headers["ETag"] != etag
+    assert {item["title"] for item in refreshed.json()} == {"Old Job", "New Job"}
+
+
+@pytest.mark.asyncio
+async def test_get_all_jobs_filters_and_sorts_by_salary(job_repository: JobRepository) -> None:
+    """
+    Test that GET /api/v1/jobs filters on the parsed salary columns and that the
+    salary sort is paginated with a cursor, skipping jobs without a salary and
+    refusing to compare amounts in different currencies.
+    """
+    salaries = {"Low": (100_000, 150_000), "Mid": (200_000, 250_000), "High": (300_000, 400_000)}
+    for i, (title, (salary_min, salary_max)) in enumerate(salaries.items()):
+        await job_repository.add_one(
+            title=title,
+            company="Corp",
+            url=f"https://example.com/job/{i}",
+            salary_min=salary_min,
+            salary_max=salary_max,
+            salary_currency="RUB",
+        )
+    await job_repository.add_one(
+        title="Dollars",
+        company="Corp",
+        url="https://example.com/job/usd",
+        salary_min=5000,
+        salary_max=7000,
+        salary_currency="USD",
+    )
+    await job_repository.add_one(title="Unknown", company="Corp", url="https://example.com/job/x")
+    client = TestClient(app)
+
+    filtered = client.get(
+        "/api/v1/jobs",
+        params={"salary_from": 150_000, "salary_to": 300_000, "salary_currency": "RUB"},
+    )
+    first_page = client.get(
+        "/api/v1/jobs",
+        params={"sort": "-salary", "salary_currency": "RUB", "limit": 2},
+    )
+    second_page = client.get(
+        "/api/v1/jobs",
+        params={
+            "sort": "-salary",
+            "salary_currency": "RUB",
+            "limit": 2,
+            "cursor": first_page.headers["X-Next-Cursor"],
+        },
+    )
+    ascending = client.get("/api/v1/jobs", params={"sort": "salary", "salary_currency": "USD"})
+    mixed_currencies = client.get("/api/v1/jobs", params={"sort": "salary"})
+
+    assert [job["title"] for job in filtered.json()] == ["Mid"]
+    assert [job["title"] for job in first_page.json()] == ["High", "Mid"]
+    assert [job["title"] for job in second_page.json()] == ["Low"]
+    assert [job["title"] for job in ascending.json()] == ["Dollars"]
+    assert mixed_currencies.status_code == 400  # noqa: PLR2004
+    assert filtered.json()[0]["salary_min"] == 200_000  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_get_stats_returns_precomputed_counters() -> None:
+    """
+    Test that GET /api/v1/stats serves the counters kept up to date when jobs are saved.
+    """
+    client = TestClient(app)
+    empty = client.get("/api/v1/stats", params={"days": 7})
+    await JobService()._save_jobs(  # noqa: SLF001
+        [
+            JobSchema(
+                title="A",
+                url=HttpUrl("https://example.com/job/1"),
+                company="Corp",
+                salary="$5500 - $7000",
+            ),
+            JobSchema(title="B", url=HttpUrl("https://example.com/job/2"), company="Corp"),
+        ],
+    )
+
+    response = client.get("/api/v1/stats", params={"days": 7})
+
+    assert empty.json()["total_jobs"] == 0
+    stats = response.json()
+    assert stats["total_jobs"] == 2  # noqa: PLR2004
+    assert stats["top_companies"] == [{"company": "Corp", "jobs_count": 2}]
+    assert len(stats["new_per_day"]) == 7  # noqa: PLR2004
+    assert stats["new_per_day"][-1]["jobs_count"] == 2  # noqa: PLR2004
+    assert stats["salary_distribution"] == [
+        {"currency": "USD", "salary_from": 5000, "salary_to": 6000, "jobs_count": 1},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_runs_lists_recent_task_runs() -> None:
+    """
+    Test that GET /api/v1/runs lists the recorded task runs newest first,
+    optionally of a single task.
+    """
+    runs = TaskRunRepository()
+    report = RunReport()
+    report.pages = 4
+    for task in ("parse_habr", "parse_other", "parse_habr"):
+        await runs.finish(await runs.start(task), RunStatus.SUCCEEDED, report)
+    client = TestClient(app)
+
+    response = client.get("/api/v1/runs", params={"limit": 2})
+    habr_runs = client.get("/api/v1/runs", params={"task": "parse_habr"}).json()
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert [run["id"] for run in response.json()] == [3, 2]
+    assert [run["id"] for run in habr_runs] == [3, 1]
+    assert habr_runs[0]["status"] == "succeeded"
+    assert habr_runs[0]["pages"] == 4  # noqa: PLR2004
+    assert habr_runs[0]["fetch_seconds"] == 0.0
+
+
+def test_metrics_endpoint_exposes_request_latency_per_route() -> None:
+    """
+    Test that GET /metrics serves the process metrics in the Prometheus text
+    format, with API requests labelled by route template, not by raw path.
+    """
+    client = TestClient(app)
+
+    client.get("/api/v1/jobs/999999")
+    client.get("/no/such/path")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert (
+        'api_request_seconds_count{method="GET",route="/api/v1/jobs/{job_id}",status="404"}' in body
+    )
+    assert 'api_request_seconds_count{method="GET",route="unmatched",status="404"}' in body
+    assert "/api/v1/jobs/999999" not in body
+    assert "# TYPE db_query_seconds histogram" in body
+    assert "log_websocket_queue_depth " in body
+    assert "log_websocket_dropped_total " in body
+
+
+@pytest.mark.asyncio
+async def test_stream_sse_serializes_jobs_as_events(job_repository: JobRepository) -> None:
+    """
+    Test that the job stream emits one `job` event per job with the job ID as
+    event ID, and a comment for heartbeats.
+    """
+    job = await job_repository.add_one(title="Job", company="Corp", url="https://example.com/job/1")
+
+    async def batches() -> AsyncIterator[list["Job"]]:
+        yield [job]
+        yield []
+
+    events = [event async for event in stream_sse(batches())]
+
+    assert events[0].startswith("retry: ")
+    assert events[1].startswith(f"id: {job.id}\nevent: job\ndata: ")
+    assert json.loads(events[1].split("data: ", 1)[1])["title"] == "Job"
+    assert events[2] == ": keep-alive\n\n"
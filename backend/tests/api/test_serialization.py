@@ -0,0 +1,77 @@
+from datetime import UTC, datetime
+
+import msgpack
+import pytest
+from fastapi.testclient import TestClient
+from pydantic_core import to_json
+
+from src.api import serialization
+from src.api.serialization import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    negotiate_media_type,
+    serialize,
+)
+from src.db.repository import JobRepository
+from src.main import app
+
+ROWS = [{"id": 1, "title": "Job", "created_at": datetime(2026, 10, 18, tzinfo=UTC)}]
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("application/json", JSON_MEDIA_TYPE),
+        ("application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/x-msgpack, application/json;q=0.5", MSGPACK_MEDIA_TYPE),
+    ],
+)
+def test_negotiate_media_type(accept: str | None, expected: str) -> None:
+    """
+    Test that MessagePack is chosen only when the client asks for it.
+    """
+    assert negotiate_media_type(accept) == expected
+
+
+def test_negotiate_media_type_falls_back_to_json_without_msgpack(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that JSON is served when the optional msgpack package is missing.
+    """
+    monkeypatch.setattr(serialization, "msgpack", None)
+
+    assert negotiate_media_type("application/msgpack") == JSON_MEDIA_TYPE
+
+
+def test_serialize_rows_as_json_and_msgpack() -> None:
+    """
+    Test that plain rows serialize to the same document in both formats.
+    """
+    expected = [{"id": 1, "title": "Job", "created_at": "2026-10-18T00:00:00Z"}]
+
+    assert serialize(ROWS) == to_json(expected)
+    assert msgpack.unpackb(serialize(ROWS, MSGPACK_MEDIA_TYPE)) == expected
+
+
+@pytest.mark.asyncio
+async def test_job_list_is_cached_per_media_type() -> None:
+    """
+    Test that GET /api/v1/jobs negotiates MessagePack, caches each format
+    separately and tells caches that the response varies with `Accept`.
+    """
+    await JobRepository().add_one(title="Job", company="Corp", url="https://example.com/job/1")
+    client = TestClient(app)
+
+    as_json = client.get("/api/v1/jobs")
+    as_msgpack = client.get("/api/v1/jobs", headers={"Accept": MSGPACK_MEDIA_TYPE})
+    as_json_again = client.get("/api/v1/jobs")
+
+    assert as_json.headers["content-type"] == JSON_MEDIA_TYPE
+    assert as_msgpack.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert as_msgpack.headers["vary"] == "Accept"
+    assert msgpack.unpackb(as_msgpack.content) == as_json.json()
+    assert as_json_again.headers["content-type"] == JSON_MEDIA_TYPE
+    assert as_json_again.json() == as_json.json()
@@ -3,8 +3,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from _pytest.monkeypatch import MonkeyPatch
+from pydantic import ValidationError
 
 from src.config import get_main_config
+from src.config.config import HttpClientConfig
 
 get_main_config.cache_clear()
 
@@ -107,3 +109,32 @@ def test_get_main_config_is_cached(mock_load_yaml: MagicMock) -> None:
             get_main_config()
 
         mock_load_yaml.assert_called_once()
+
+
+def test_scheduler_can_be_disabled_per_process(
+    mock_config_files: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    """
+    Tests that the scheduler is enabled by default and that an environment
+    variable turns it off, e.g. in all API workers but one.
+    """
+    assert get_main_config().backend.scheduler.enabled
+
+    (mock_config_files / "config.yaml").write_text("backend:\n  scheduler:\n    enabled: true\n")
+    monkeypatch.setenv("BACKEND__SCHEDULER__ENABLED", "false")
+    get_main_config.cache_clear()
+
+    assert not get_main_config().backend.scheduler.enabled
+
+
+def test_http2_without_h2_is_rejected_at_validation(monkeypatch: MonkeyPatch) -> None:
+    """
+    Tests that enabling HTTP/2 without the h2 package fails when the config is
+    validated, with a hint to install it, instead of when the client starts.
+    """
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+    with pytest.raises(ValidationError, match="httpx\\[http2\\]"):
+        HttpClientConfig(http2=True)
+    assert HttpClientConfig(http2=False).http2 is False
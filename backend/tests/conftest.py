@@ -3,10 +3,16 @@ from collections.abc import AsyncGenerator
 import pytest_asyncio
 
 from src.config.config import DatabaseConfig
+from src.core.cache import job_cache
 from src.db.db import close_db, init_db
 
 _MODELS_FILES = [
     "src.db.models.job",
+    "src.db.models.fetch_state",
+    "src.db.models.watermark",
+    "src.db.models.stats",
+    "src.db.models.task_lock",
+    "src.db.models.task_run",
     "aerich.models",
 ]
 
@@ -18,7 +24,8 @@ async def db_init() -> AsyncGenerator[None, None]:
 
     This fixture creates an in-memory SQLite database, initializes
     Tortoise ORM using the centralized `init_db` function, and then closes
-    the connection after the test completes.
+    the connection after the test completes. The job response cache is
+    invalidated, so no cached response outlives its database.
 
     Yields:
         None
@@ -28,5 +35,6 @@ async def db_init() -> AsyncGenerator[None, None]:
         engine="tortoise.backends.sqlite",
     )
     await init_db(db_config)
+    job_cache.invalidate()
     yield
     await close_db()
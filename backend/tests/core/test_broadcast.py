@@ -0,0 +1,44 @@
+import pytest
+
+from src.core.broadcast import JobBroadcaster
+from src.db.models import Job
+
+
+def make_job(job_id: int) -> Job:
+    """Creates an unsaved job with the given ID."""
+    return Job(id=job_id, title=f"Job {job_id}", url=f"https://example.com/job/{job_id}")
+
+
+@pytest.mark.asyncio
+async def test_publish_delivers_each_job_once_to_every_subscriber() -> None:
+    """
+    Test that every subscriber gets the published jobs, without the jobs
+    already published by an overlapping crawl.
+    """
+    broadcaster = JobBroadcaster()
+    with broadcaster.subscribe() as first, broadcaster.subscribe() as second:
+        broadcaster.publish([make_job(1), make_job(2)])
+        broadcaster.publish([make_job(2), make_job(3)])
+
+        for subscription in (first, second):
+            assert [job.id for job in await subscription.get(timeout=1)] == [1, 2]
+            assert [job.id for job in await subscription.get(timeout=1)] == [3]
+            assert await subscription.get(timeout=0.01) is None
+    assert not broadcaster.has_subscribers
+
+
+@pytest.mark.asyncio
+async def test_full_subscription_is_marked_as_lagging() -> None:
+    """
+    Test that a subscriber not taking its jobs is marked as lagging instead of
+    queueing them without bound, and that reset empties its queue.
+    """
+    broadcaster = JobBroadcaster(queue_size=2)
+    with broadcaster.subscribe() as subscription:
+        for job_id in range(1, 4):
+            broadcaster.publish([make_job(job_id)])
+
+        assert subscription.lagging
+        subscription.reset()
+        assert not subscription.lagging
+        assert await subscription.get(timeout=0.01) is None
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.cache import TTLCache
+
+
+class FakeClock:
+    """A manually advanced clock for expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_expires_entries_after_ttl() -> None:
+    """
+    Tests that entries are served until their TTL runs out.
+    """
+    clock = FakeClock()
+    cache: TTLCache[str] = TTLCache(ttl=10, clock=clock)
+    cache.set("key", "value")
+
+    clock.now = 9.9
+    assert cache.get("key") == "value"
+
+    clock.now = 10.0
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used_entry() -> None:
+    """
+    Tests that the size bound evicts the entry that was used least recently.
+    """
+    cache: TTLCache[int] = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3  # noqa: PLR2004
+
+
+def test_invalidate_clears_entries_and_changes_version() -> None:
+    """
+    Tests that invalidation drops all entries and moves to a new version.
+    """
+    cache: TTLCache[int] = TTLCache()
+    cache.set("a", 1)
+    version = cache.version
+
+    cache.invalidate()
+
+    assert cache.get("a") is None
+    assert cache.version != version
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_does_not_store_value_loaded_across_invalidation() -> None:
+    """
+    Tests that a value loaded while the cache was invalidated is not cached.
+    """
+    cache: TTLCache[str] = TTLCache()
+
+    async def stale_loader() -> str:
+        cache.invalidate()  # a write happens while the value is being read
+        return "stale"
+
+    async def fresh_loader() -> str:
+        return "fresh"
+
+    assert await cache.get_or_set("key", stale_loader) == "stale"
+    assert await cache.get_or_set("key", fresh_loader) == "fresh"
+    assert await cache.get_or_set("key", stale_loader) == "fresh"
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from src.config.config import IngestionConfig
+from src.core.fetcher import CircuitOpenError, Fetcher, TokenBucket
+from src.core.metrics import http_fetches
+
+URL = "https://jobs.example.com/list"
+
+
+class FakeTime:
+    """A clock and a sleep function where sleeping only moves the clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_fetcher(
+    handler: Callable[[httpx.Request], httpx.Response],
+    fake_time: FakeTime,
+    **config: float,
+) -> tuple[Fetcher, list[httpx.Request]]:
+    """Creates a fetcher over a mock transport, returning it with its request log."""
+    requests: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+    fetcher = Fetcher(
+        client,
+        IngestionConfig(**config),  # type: ignore[arg-type]
+        clock=fake_time.clock,
+        sleep=fake_time.sleep,
+    )
+    return fetcher, requests
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_queues_callers_at_the_configured_rate() -> None:
+    """
+    Tests that a burst beyond the bucket capacity is spread out at the refill rate.
+    """
+    sleeps: list[float] = []
+
+    async def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    # The callers arrive at the same instant
+    bucket = TokenBucket(rate=2, clock=lambda: 0.0, sleep=sleep)
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    assert sleeps == [0.5, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_fetcher_honours_retry_after_and_retries_until_success() -> None:
+    """
+    Tests that 429/503 responses are retried after the delay asked by the host.
+    """
+    fake_time = FakeTime()
+    responses = iter(
+        [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(503, headers={"Retry-After": "0"}),
+            httpx.Response(200, text="ok"),
+        ],
+    )
+    fetcher, requests = make_fetcher(lambda _: next(responses), fake_time)
+    fetches_before = {
+        status: http_fetches.value(host="jobs.example.com", status=status)
+        for status in ("200", "429", "503")
+    }
+
+    response = await fetcher.get(URL)
+
+    assert response.text == "ok"
+    assert len(requests) == 3  # noqa: PLR2004
+    assert fake_time.sleeps == [7.0, 0.0]
+    for status, before in fetches_before.items():
+        assert http_fetches.value(host="jobs.example.com", status=status) == before + 1
+
+
+@pytest.mark.asyncio
+async def test_fetcher_gives_up_after_max_retries_with_growing_backoff() -> None:
+    """
+    Tests that network errors are retried with exponential, jittered backoff
+    and re-raised once the retries are exhausted.
+    """
+    fake_time = FakeTime()
+
+    def fail(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    fetcher, requests = make_fetcher(
+        fail,
+        fake_time,
+        max_retries=3,
+        retry_backoff=1,
+        circuit_failure_threshold=10,
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        await fetcher.get(URL)
+
+    assert len(requests) == 4  # noqa: PLR2004
+    # Full jitter: each delay is drawn below a doubling ceiling
+    assert len(fake_time.sleeps) == 3  # noqa: PLR2004
+    for attempt, delay in enumerate(fake_time.sleeps):
+        assert 0 <= delay <= 2**attempt
+
+
+@pytest.mark.asyncio
+async def test_fetcher_does_not_retry_client_errors_or_not_modified() -> None:
+    """
+    Tests that 304 is returned as is and a 404 is raised without retrying.
+    """
+    fake_time = FakeTime()
+    fetcher, requests = make_fetcher(
+        lambda request: httpx.Response(304 if request.url.path == "/list" else 404),
+        fake_time,
+    )
+
+    response = await fetcher.get(URL)
+    assert response.status_code == 304  # noqa: PLR2004
+    with pytest.raises(httpx.HTTPStatusError):
+        await fetcher.get("https://jobs.example.com/missing")
+
+    assert len(requests) == 2  # noqa: PLR2004
+    assert fake_time.sleeps == []
+    assert not fetcher.breaker("jobs.example.com").is_open
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_after_repeated_failures_and_recovers() -> None:
+    """
+    Tests that a host is not requested while its circuit is open, and that a
+    successful trial request after the reset timeout closes the circuit.
+    """
+    fake_time = FakeTime()
+    healthy = False
+
+    def respond(_: httpx.Request) -> httpx.Response:
+        return httpx.Response(200 if healthy else 502)
+
+    fetcher, requests = make_fetcher(
+        respond,
+        fake_time,
+        max_retries=0,
+        circuit_failure_threshold=2,
+        circuit_reset_timeout=60,
+    )
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetcher.get(URL)
+    with pytest.raises(CircuitOpenError):
+        await fetcher.get(URL)
+    assert len(requests) == 2  # noqa: PLR2004
+
+    fake_time.now += 60
+    healthy = True
+    assert (await fetcher.get(URL)).status_code == 200  # noqa: PLR2004
+    assert not fetcher.breaker("jobs.example.com").is_open
+
+
+@pytest.mark.asyncio
+async def test_failed_trial_request_reopens_circuit() -> None:
+    """
+    Tests that a failing trial request opens the circuit again at once.
+    """
+    fake_time = FakeTime()
+    fetcher, requests = make_fetcher(
+        lambda _: httpx.Response(500),
+        fake_time,
+        max_retries=0,
+        circuit_failure_threshold=3,
+        circuit_reset_timeout=60,
+    )
+    breaker = fetcher.breaker("jobs.example.com")
+    for _ in range(3):
+        breaker.record_failure()
+
+    fake_time.now += 60
+    with pytest.raises(httpx.HTTPStatusError):
+        await fetcher.get(URL)
+    with pytest.raises(CircuitOpenError):
+        await fetcher.get(URL)
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_trial_request_ending_unexpectedly_releases_the_circuit() -> None:
+    """
+    Tests that a trial request failing with an error other than a network
+    error does not leave the circuit half-open with a trial forever in flight.
+    """
+    fake_time = FakeTime()
+
+    def respond(_: httpx.Request) -> httpx.Response:
+        raise RuntimeError("transport bug")
+
+    fetcher, requests = make_fetcher(
+        respond,
+        fake_time,
+        max_retries=0,
+        circuit_failure_threshold=1,
+        circuit_reset_timeout=60,
+    )
+    fetcher.breaker("jobs.example.com").record_failure()
+
+    fake_time.now += 60
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await fetcher.get(URL)
+    assert len(requests) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_request_in_flight_before_half_open_does_not_release_the_trial() -> None:
+    """
+    Tests that a request sent before the circuit went half-open, ending while
+    the trial is in flight, does not let a second trial through.
+    """
+    fake_time = FakeTime()
+    responses: dict[str, asyncio.Future[httpx.Response]] = {}
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        responses[request.url.path] = asyncio.get_running_loop().create_future()
+        return await responses[request.url.path]
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    fetcher = Fetcher(
+        client,
+        IngestionConfig(max_retries=0, circuit_failure_threshold=1, circuit_reset_timeout=60),
+        clock=fake_time.clock,
+        sleep=fake_time.sleep,
+    )
+    slow = asyncio.create_task(fetcher.get("https://jobs.example.com/slow"))
+    await asyncio.sleep(0.01)
+    fetcher.breaker("jobs.example.com").record_failure()
+    fake_time.now += 60
+    trial = asyncio.create_task(fetcher.get("https://jobs.example.com/trial"))
+    await asyncio.sleep(0.01)
+
+    responses["/slow"].set_exception(RuntimeError("transport bug"))
+    with pytest.raises(RuntimeError):
+        await slow
+    with pytest.raises(CircuitOpenError):
+        await asyncio.wait_for(fetcher.get(URL), timeout=1)
+
+    responses["/trial"].set_result(httpx.Response(200))
+    assert (await trial).status_code == 200  # noqa: PLR2004
+    assert not fetcher.breaker("jobs.example.com").is_open
+
+
+@pytest.mark.asyncio
+async def test_throttled_host_does_not_hold_the_shared_budget() -> None:
+    """
+    Tests that a request waiting for its host's rate limit token does not
+    occupy a slot of the shared budget, so other hosts are fetched meanwhile.
+    """
+    token_released = asyncio.Event()
+
+    async def sleep(_: float) -> None:
+        await token_released.wait()
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(200)))
+    fetcher = Fetcher(
+        client,
+        IngestionConfig(max_concurrent_fetches=1),
+        clock=lambda: 0.0,
+        sleep=sleep,
+    )
+    await fetcher.get(URL, rate=1)
+
+    throttled = asyncio.create_task(fetcher.get(URL, rate=1))
+    await asyncio.sleep(0)
+    other = await asyncio.wait_for(fetcher.get("https://other.example.com/list"), timeout=1)
+    assert other.status_code == 200  # noqa: PLR2004
+    assert not throttled.done()
+
+    token_released.set()
+    assert (await throttled).status_code == 200  # noqa: PLR2004
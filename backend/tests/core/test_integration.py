@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 import httpx
 import pytest
 
-from src.core.tasks import parse_habr_vacancies
+from src.core.tasks import parse_source
 from src.db.models.job import Job
 from src.scheduler.scheduler import TaskScheduler
 
@@ -43,12 +43,13 @@ async def test_full_cycle_via_scheduler(
     # 3. Patch the scheduler's default job setup to run immediately
     # We prevent the original setup (e.g., 60-minute interval) from running.
     mocker.patch(
-        "src.scheduler.scheduler.TaskScheduler.setup_jobs", return_value=None,
+        "src.scheduler.scheduler.TaskScheduler.setup_jobs",
+        return_value=None,
     )
 
     # 4. Initialize the scheduler and manually add a fast, repeating job
     scheduler = TaskScheduler()
-    scheduler.add_interval_job(parse_habr_vacancies, seconds=1)
+    scheduler.add_interval_job(parse_source, seconds=1, kwargs={"source_name": "habr"})
     scheduler.start()
 
     try:
@@ -73,4 +74,4 @@ async def test_full_cycle_via_scheduler(
 
     finally:
         # 9. Clean up by stopping the scheduler
-        scheduler.stop()
+        await scheduler.stop()
@@ -1,13 +1,64 @@
 # This file will contain tests for the JobService.
 
 import asyncio
+import hashlib
+from collections.abc import Callable, Iterator
+from dataclasses import replace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from pydantic import HttpUrl
 
+from src.config.config import HttpClientConfig, IngestionConfig
+from src.core.fetcher import Fetcher
+from src.core.http import create_http_client
+from src.core.parsers import BaseParser
 from src.core.schemas import JobSchema
 from src.core.services import JobService
+from src.core.sources import HABR_SOURCE, HABR_VACANCIES_URL, JobSource
+from src.db.repository import FetchStateRepository, JobRepository, WatermarkRepository
+
+
+class RecordingTransport(httpx.MockTransport):
+    """A mock transport that remembers every request it has handled."""
+
+    def __init__(self, handler: Callable[[httpx.Request], httpx.Response]) -> None:
+        self.requests: list[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return handler(request)
+
+        super().__init__(record)
+
+
+def make_client(transport: httpx.AsyncBaseTransport) -> httpx.AsyncClient:
+    """Creates the service HTTP client on top of a mock transport."""
+    return create_http_client(HttpClientConfig(), transport=transport)
+
+
+EXISTING_JOB = JobSchema(
+    title="Existing Job",
+    url=HttpUrl("https://example.com/job/existing"),
+    company="Old Corp",
+)
+
+
+def page_number(request: httpx.Request) -> int:
+    """Returns the listing page number requested."""
+    return int(request.url.params.get("page", 1))
+
+
+@pytest.fixture(autouse=True)
+def unthrottled_habr_source() -> Iterator[None]:
+    """Lifts the Habr rate limit so the crawl tests do not wait between requests."""
+    with patch(
+        "src.core.services.HABR_SOURCE",
+        replace(HABR_SOURCE, requests_per_second=None),
+    ):
+        yield
 
 
 @pytest.fixture
@@ -15,18 +66,12 @@ def mock_job_repo() -> AsyncMock:
     """Fixture to create a mock JobRepository."""
     mock_repo = AsyncMock()
 
-    # Simulate that one job already exists, and the other doesn't
-    async def get_job_by_url(url: HttpUrl | str) -> JobSchema | None:
-        if str(url) == "https://example.com/job/existing":
-            return JobSchema(
-                title="Existing Job",
-                url=HttpUrl("https://example.com/job/existing"),
-                company="Old Corp",
-            )
-        return None
-
-    mock_repo.get_job_by_url.side_effect = get_job_by_url
-    mock_repo.create_job = AsyncMock()
+    # Simulate that one job already exists unchanged, and the other doesn't
+    mock_repo.get_fingerprints.return_value = {
+        "https://example.com/job/existing": EXISTING_JOB.fingerprint,
+    }
+    mock_repo.bulk_create_jobs = AsyncMock()
+    mock_repo.bulk_update_jobs = AsyncMock(return_value=0)
     return mock_repo
 
 
@@ -34,11 +79,7 @@ def mock_job_repo() -> AsyncMock:
 def fake_jobs_from_parser() -> list[JobSchema]:
     """Fixture to provide a list of fake jobs."""
     return [
-        JobSchema(
-            title="Existing Job",
-            url=HttpUrl("https://example.com/job/existing"),
-            company="Old Corp",
-        ),
+        EXISTING_JOB,
         JobSchema(
             title="New Python Developer",
             url=HttpUrl("https://example.com/job/new"),
@@ -50,11 +91,9 @@ def fake_jobs_from_parser() -> list[JobSchema]:
 
 @pytest.mark.asyncio
 @patch("src.core.services.HabrParser")
-@patch("src.core.services.httpx.AsyncClient")
 @patch("src.core.services.logger")
 async def test_process_habr_vacancies_saves_new_jobs_and_notifies(
     mock_logger: MagicMock,
-    mock_client: MagicMock,
     mock_parser: MagicMock,
     mock_job_repo: AsyncMock,
     fake_jobs_from_parser: list[JobSchema],
@@ -67,39 +106,40 @@ async def test_process_habr_vacancies_saves_new_jobs_and_notifies(
     - Sends a notification for new jobs only.
     """
     # 1. Arrange
-    # Setup mock for httpx response
-    mock_response = AsyncMock()
-    mock_response.text = "<html></html>"
-    mock_client.return_value.__aenter__.return_value = mock_response
+    # Setup mock transport for the injected HTTP client
+    transport = RecordingTransport(
+        lambda request: httpx.Response(200, text=f"<html>{page_number(request)}</html>"),
+    )
 
     # Setup mock for parser
     mock_parser_instance = MagicMock()
-    mock_parser_instance.parse.return_value = fake_jobs_from_parser
+    # The second page is empty, which ends the crawl
+    mock_parser_instance.parse.side_effect = lambda content: (
+        fake_jobs_from_parser if content == "<html>1</html>" else []
+    )
     mock_parser.return_value = mock_parser_instance
 
     mock_notify_logger = MagicMock()
     mock_logger.bind.return_value = mock_notify_logger
 
     # Instantiate the service with the mocked repository
-    service = JobService(repo=mock_job_repo)
-
-    # 2. Act
-    await service.process_habr_vacancies()
+    async with make_client(transport) as client:
+        service = JobService(repo=mock_job_repo, client=client)
 
+        # 2. Act
+        await service.process_habr_vacancies()
 
     # 3. Assert
-    # Check that we tried to find both jobs in the DB
-    expected_call_count = 2
-    assert mock_job_repo.get_job_by_url.call_count == expected_call_count
-    mock_job_repo.get_job_by_url.assert_any_call(HttpUrl("https://example.com/job/existing"))
-    mock_job_repo.get_job_by_url.assert_any_call(HttpUrl("https://example.com/job/new"))
-
-    # Check that a new job was created ONLY ONCE
-    mock_job_repo.create_job.assert_called_once()
-    # Check that the created job is the new one
-    args, kwargs = mock_job_repo.create_job.call_args
-    assert kwargs["title"] == "New Python Developer"
-    assert kwargs["url"] == HttpUrl("https://example.com/job/new")
+    # Check that both URLs were looked up in a single query
+    mock_job_repo.get_fingerprints.assert_any_call(
+        [HttpUrl("https://example.com/job/existing"), HttpUrl("https://example.com/job/new")],
+    )
+
+    # Check that only the new job was inserted, in one bulk call
+    mock_job_repo.bulk_create_jobs.assert_called_once()
+    (created_jobs,) = mock_job_repo.bulk_create_jobs.call_args.args
+    assert [job.title for job in created_jobs] == ["New Python Developer"]
+    assert created_jobs[0].url == HttpUrl("https://example.com/job/new")
 
     # Check that the notification was sent ONLY ONCE
     mock_logger.bind.assert_called_once_with(notify=True)
@@ -113,3 +153,475 @@ async def test_process_habr_vacancies_saves_new_jobs_and_notifies(
     del service
 
     await asyncio.sleep(0)  # Allow other tasks to run
+
+
+@pytest.mark.asyncio
+@patch("src.core.services.HabrParser")
+async def test_process_habr_vacancies_stops_on_page_without_new_jobs(
+    mock_parser: MagicMock,
+    mock_job_repo: AsyncMock,
+) -> None:
+    """
+    Tests that the crawl walks `?page=N` pages and stops at the first page
+    whose jobs are all already known, ignoring pages fetched after it.
+    """
+    # 1. Arrange
+    transport = RecordingTransport(
+        lambda request: httpx.Response(200, text=str(page_number(request))),
+    )
+
+    pages = {
+        "1": [JobSchema(title="New 1", url=HttpUrl("https://example.com/job/1"))],
+        "2": [EXISTING_JOB],
+        "3": [JobSchema(title="New 3", url=HttpUrl("https://example.com/job/3"))],
+    }
+    mock_parser.return_value.parse.side_effect = lambda content: pages[content]
+
+    async with make_client(transport) as client:
+        service = JobService(repo=mock_job_repo, client=client)
+
+        # 2. Act
+        await service.process_habr_vacancies(max_pages=10, concurrency=2)
+
+    # 3. Assert
+    # Page 1 alone, then a window of pages 2 and 3
+    assert "page" not in transport.requests[0].url.params
+    assert sorted(page_number(request) for request in transport.requests) == [1, 2, 3]
+
+    mock_job_repo.bulk_create_jobs.assert_called_once()
+    (created_jobs,) = mock_job_repo.bulk_create_jobs.call_args.args
+    assert [job.title for job in created_jobs] == ["New 1"]
+
+
+@pytest.mark.asyncio
+@patch("src.core.services.HabrParser")
+@patch("src.core.services.logger")
+async def test_process_habr_vacancies_skips_not_modified_page(
+    mock_logger: MagicMock,
+    mock_parser: MagicMock,
+    mock_job_repo: AsyncMock,
+) -> None:
+    """
+    Tests that stored validators are sent and a 304 response is not parsed.
+    """
+    # 1. Arrange
+    await FetchStateRepository().save(
+        url=HABR_VACANCIES_URL,
+        etag='"abc"',
+        last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+        content_hash="0" * 64,
+    )
+    transport = RecordingTransport(lambda _: httpx.Response(304))
+
+    async with make_client(transport) as client:
+        service = JobService(repo=mock_job_repo, client=client)
+
+        # 2. Act
+        await service.process_habr_vacancies()
+
+    # 3. Assert
+    (request,) = transport.requests
+    assert request.headers["If-None-Match"] == '"abc"'
+    assert request.headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+    mock_parser.return_value.parse.assert_not_called()
+    mock_job_repo.bulk_create_jobs.assert_not_called()
+    logged = [call.args[0] for call in mock_logger.info.call_args_list]
+    assert any("skipped: unchanged" in message for message in logged)
+
+
+@pytest.mark.asyncio
+@patch("src.core.services.HabrParser")
+async def test_process_habr_vacancies_skips_page_with_same_hash(
+    mock_parser: MagicMock,
+    mock_job_repo: AsyncMock,
+    fake_jobs_from_parser: list[JobSchema],
+) -> None:
+    """
+    Tests that a page whose body did not change between runs is parsed only once,
+    and that its validators and hash are stored after the first run.
+    """
+    # 1. Arrange
+    body = "<html>same</html>"
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if page_number(request) == 1:
+            return httpx.Response(200, text=body, headers={"ETag": '"v1"'})
+        return httpx.Response(200, text="")
+
+    transport = RecordingTransport(respond)
+
+    def parse(content: str) -> list[Any]:
+        return fake_jobs_from_parser if content == body else []
+
+    mock_parser.return_value.parse.side_effect = parse
+
+    async with make_client(transport) as client:
+        service = JobService(repo=mock_job_repo, client=client)
+
+        # 2. Act
+        await service.process_habr_vacancies()
+        await service.process_habr_vacancies()
+
+    # 3. Assert
+    parsed_contents = [call.args[0] for call in mock_parser.return_value.parse.call_args_list]
+    assert parsed_contents.count(body) == 1
+
+    state = await FetchStateRepository().get_by_url(HABR_VACANCIES_URL)
+    assert state is not None
+    assert state.etag == '"v1"'
+    assert state.content_hash == hashlib.sha256(body.encode()).hexdigest()
+
+
+class StubParser(BaseParser):
+    """A parser that turns every word of a page into a job."""
+
+    def parse(self, content: str) -> list[JobSchema]:
+        return [
+            JobSchema(title=word, url=HttpUrl(f"https://jobs.example.com/{word}"))
+            for word in content.split()
+        ]
+
+
+def make_source(name: str, **kwargs: Any) -> JobSource:
+    """Creates a single-page job source served at `https://{name}.example.com/jobs`."""
+    return JobSource(
+        name=name,
+        title=name.title(),
+        urls=(f"https://{name}.example.com/jobs",),
+        parser_factory=StubParser,
+        max_pages=1,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_source_uses_source_parser_and_page_param(
+    mock_job_repo: AsyncMock,
+) -> None:
+    """
+    Tests that a source other than Habr is crawled with its own parser and
+    pagination parameter.
+    """
+
+    # 1. Arrange
+    def respond(request: httpx.Request) -> httpx.Response:
+        offset = request.url.params.get("p")
+        return httpx.Response(200, text="" if offset else "a b")
+
+    transport = RecordingTransport(respond)
+    source = replace(make_source("board"), max_pages=3, page_param="p")
+
+    async with make_client(transport) as client:
+        service = JobService(repo=mock_job_repo, client=client)
+
+        # 2. Act
+        await service.process_source(source, concurrency=1)
+
+    # 3. Assert
+    assert [str(request.url) for request in transport.requests] == [
+        "https://board.example.com/jobs",
+        "https://board.example.com/jobs?p=2",
+    ]
+    (created_jobs,) = mock_job_repo.bulk_create_jobs.call_args.args
+    assert [job.title for job in created_jobs] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_process_source_shares_fetch_budget_across_sources(
+    mock_job_repo: AsyncMock,
+) -> None:
+    """
+    Tests that sources are crawled concurrently, but never with more requests
+    in flight than the shared fetch budget allows.
+    """
+    # 1. Arrange
+    in_flight = 0
+    max_in_flight = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, text=request.url.host.split(".")[0])
+
+    sources = [make_source(name) for name in ("one", "two", "three")]
+
+    async with make_client(httpx.MockTransport(respond)) as client:
+        # 2. Act
+        fetcher = Fetcher(client, IngestionConfig(max_concurrent_fetches=2))
+        service = JobService(repo=mock_job_repo, fetcher=fetcher)
+        await asyncio.gather(*(service.process_source(source) for source in sources))
+
+    # 3. Assert
+    assert max_in_flight == 2  # noqa: PLR2004
+    titles = {
+        job.title for call in mock_job_repo.bulk_create_jobs.call_args_list for job in call.args[0]
+    }
+    assert titles == {"one", "two", "three"}
+
+
+@pytest.mark.asyncio
+@patch("src.core.services.logger")
+async def test_save_jobs_updates_only_changed_jobs(mock_logger: MagicMock) -> None:
+    """
+    Tests that saving a page inserts unknown jobs, updates changed ones and
+    writes nothing for unchanged ones, notifying about new jobs only.
+    """
+    # 1. Arrange
+    await JobService()._save_jobs(  # noqa: SLF001
+        [
+            JobSchema(title="Stable", url=HttpUrl("https://example.com/job/1")),
+            JobSchema(title="Raise", url=HttpUrl("https://example.com/job/2"), salary="100"),
+        ],
+    )
+    mock_logger.reset_mock()
+
+    # 2. Act
+    saved = await JobService()._save_jobs(  # noqa: SLF001
+        [
+            JobSchema(title="Stable", url=HttpUrl("https://example.com/job/1")),
+            JobSchema(title="Raise", url=HttpUrl("https://example.com/job/2"), salary="200"),
+            JobSchema(title="Fresh", url=HttpUrl("https://example.com/job/3")),
+        ],
+    )
+
+    # 3. Assert
+    assert saved == (1, 1)
+    salaries = {job.url: job.salary for job in await JobRepository().get_all_jobs()}
+    assert salaries == {
+        "https://example.com/job/1": None,
+        "https://example.com/job/2": "200",
+        "https://example.com/job/3": None,
+    }
+    notified = [call.kwargs["title"] for call in mock_logger.bind.return_value.info.call_args_list]
+    assert notified == ["Fresh"]
+
+
+@pytest.mark.asyncio
+async def test_save_jobs_keeps_stats_up_to_date() -> None:
+    """
+    Tests that saving pages updates the statistics counters incrementally:
+    new jobs are counted, changed jobs move between counters.
+    """
+    service = JobService()
+    await service._save_jobs(  # noqa: SLF001
+        [
+            JobSchema(
+                title="A",
+                url=HttpUrl("https://example.com/job/1"),
+                company="Corp",
+                salary="от 100 000 ₽",
+            ),
+            JobSchema(title="B", url=HttpUrl("https://example.com/job/2"), company="Corp"),
+            JobSchema(title="C", url=HttpUrl("https://example.com/job/3"), company="Other"),
+        ],
+    )
+    await service._save_jobs(  # noqa: SLF001
+        [
+            JobSchema(
+                title="A",
+                url=HttpUrl("https://example.com/job/1"),
+                company="Other",
+                salary="от 200 000 ₽",
+            ),
+        ],
+    )
+
+    stats = await service.get_stats(days=1)
+
+    assert stats.total_jobs == 3  # noqa: PLR2004
+    assert stats.top_companies == [("Other", 2), ("Corp", 1)]
+    assert [day.jobs_count for day in stats.new_per_day] == [3]
+    assert stats.salary_distribution == [("RUB", 200_000, 250_000, 1)]
+
+
+@pytest.mark.asyncio
+async def test_stream_new_jobs_resumes_then_pushes_new_jobs() -> None:
+    """
+    Tests that the job stream first replays the jobs inserted after the
+    resume ID, then delivers jobs as they are saved, with heartbeats between.
+    """
+    service = JobService()
+    await service._save_jobs(  # noqa: SLF001
+        [
+            JobSchema(title=f"Old {i}", url=HttpUrl(f"https://example.com/old/{i}"))
+            for i in range(3)
+        ],
+    )
+    first_id = (await JobRepository().get_job_by_url("https://example.com/old/0")).id
+    stream = service.stream_new_jobs(after_id=first_id, heartbeat=0.01)
+
+    replayed = await anext(stream)
+    heartbeat = await anext(stream)
+    await service._save_jobs(  # noqa: SLF001
+        [JobSchema(title="Fresh", url=HttpUrl("https://example.com/fresh"))],
+    )
+    pushed = await anext(stream)
+    await stream.aclose()
+
+    assert [job.title for job in replayed] == ["Old 1", "Old 2"]
+    assert heartbeat == []
+    assert [job.title for job in pushed] == ["Fresh"]
+    assert pushed[0].id == replayed[-1].id + 1
+
+
+@pytest.mark.asyncio
+async def test_stream_new_jobs_catches_up_on_jobs_inserted_by_another_process() -> None:
+    """
+    Tests that jobs inserted without being published, as by the scheduler of
+    another worker, are read from the database once the stream is idle.
+    """
+    service = JobService()
+    stream = service.stream_new_jobs(heartbeat=0.01, catch_up_interval=0.02)
+
+    first_heartbeat = await anext(stream)
+    await JobRepository().bulk_create_jobs(
+        [JobSchema(title="Elsewhere", url=HttpUrl("https://example.com/elsewhere"))],
+    )
+    batches = [await anext(stream) for _ in range(4)]
+    await stream.aclose()
+
+    assert first_heartbeat == []
+    assert [job.title for batch in batches for job in batch] == ["Elsewhere"]
+
+
+class Listing:
+    """A mutable listing served page by page, words standing for vacancies."""
+
+    def __init__(self, *pages: str) -> None:
+        self.pages = list(pages)
+        self.broken_pages: set[int] = set()
+        self.requested: list[int] = []
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        number = page_number(request)
+        self.requested.append(number)
+        if number in self.broken_pages:
+            return httpx.Response(404)
+        return httpx.Response(200, text=self.pages[number - 1] if number <= len(self.pages) else "")
+
+
+async def crawl(listing: Listing, source: JobSource) -> None:
+    """Runs one crawl of the listing with real repositories."""
+    listing.requested.clear()
+    async with make_client(httpx.MockTransport(listing.respond)) as client:
+        await JobService(client=client).process_source(source, concurrency=1)
+
+
+@pytest.mark.asyncio
+async def test_steady_state_crawl_stops_at_watermark() -> None:
+    """
+    Tests that once the listing has been crawled, a run only reads pages down to
+    the newest vacancy seen before, even if that page also has new vacancies.
+    """
+    source = replace(make_source("board"), max_pages=10)
+    listing = Listing("d c", "b a")
+    await crawl(listing, source)
+    assert listing.requested == [1, 2, 3]
+
+    listing.pages = ["e d", "c b", "a"]
+    await crawl(listing, source)
+
+    assert listing.requested == [1]
+    watermark = await WatermarkRepository().get_by_listing_url("https://board.example.com/jobs")
+    assert watermark is not None
+    assert watermark.newest_url == "https://jobs.example.com/e"
+    assert watermark.caught_up
+
+
+@pytest.mark.asyncio
+async def test_crawl_fills_gap_left_by_failed_run() -> None:
+    """
+    Tests that after a run failed halfway, the next run crawls past unchanged
+    and known pages down to the watermark of the last complete run.
+    """
+    source = replace(make_source("board"), max_pages=10)
+    listing = Listing("b a")
+    await crawl(listing, source)
+
+    # Four new vacancies push the old ones to page 3, and page 2 fails once
+    listing.pages = ["f e", "d c", "b a"]
+    listing.broken_pages = {2}
+    await crawl(listing, source)
+    watermark = await WatermarkRepository().get_by_listing_url("https://board.example.com/jobs")
+    assert watermark is not None
+    assert not watermark.caught_up
+    assert watermark.gap_url == "https://jobs.example.com/b"
+
+    listing.broken_pages = set()
+    await crawl(listing, source)
+
+    # Page 1 is unchanged, but the crawl goes on down to "b"
+    assert listing.requested == [1, 2, 3]
+    titles = {job.title for job in await JobRepository().get_all_jobs()}
+    assert titles == {"a", "b", "c", "d", "e", "f"}
+    watermark = await WatermarkRepository().get_by_listing_url("https://board.example.com/jobs")
+    assert watermark is not None
+    assert watermark.caught_up
+    assert watermark.newest_url == "https://jobs.example.com/f"
+
+    await crawl(listing, source)
+    assert listing.requested == [1]
+
+
+@pytest.mark.asyncio
+async def test_crawl_fills_gap_left_by_crashed_run() -> None:
+    """
+    Tests that a run crashing after saving its first page leaves the gap
+    recorded, so the next run crawls down to the watermark of the last
+    complete run instead of stopping at the already saved first page.
+    """
+    source = replace(make_source("board"), max_pages=10)
+    listing = Listing("b a")
+    await crawl(listing, source)
+
+    listing.pages = ["f e", "d c", "b a"]
+
+    def crash(request: httpx.Request) -> httpx.Response:
+        if page_number(request) == 2:  # noqa: PLR2004
+            raise RuntimeError("worker killed")
+        return Listing.respond(listing, request)
+
+    listing.respond = crash  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError):
+        await crawl(listing, source)
+    watermark = await WatermarkRepository().get_by_listing_url("https://board.example.com/jobs")
+    assert watermark is not None
+    assert not watermark.caught_up
+    assert watermark.gap_url == "https://jobs.example.com/b"
+
+    del listing.respond
+    await crawl(listing, source)
+
+    assert listing.requested == [1, 2, 3]
+    titles = {job.title for job in await JobRepository().get_all_jobs()}
+    assert titles == {"a", "b", "c", "d", "e", "f"}
+    watermark = await WatermarkRepository().get_by_listing_url("https://board.example.com/jobs")
+    assert watermark is not None
+    assert watermark.caught_up
+    assert watermark.newest_url == "https://jobs.example.com/f"
+
+
+@pytest.mark.asyncio
+async def test_process_source_reports_counters_and_stage_timings() -> None:
+    """
+    Tests that a crawl fills in the run report: pages, parsed, created and
+    updated jobs, failed pages and the time spent in every stage.
+    """
+    source = replace(make_source("board"), max_pages=10)
+    listing = Listing("b a", "c")
+    listing.broken_pages = {2}
+
+    async with make_client(httpx.MockTransport(listing.respond)) as client:
+        report = await JobService(client=client).process_source(source, concurrency=1)
+
+    assert (report.pages, report.jobs_parsed, report.jobs_created, report.jobs_updated) == (
+        1,
+        2,
+        2,
+        0,
+    )
+    assert report.errors == 1
+    assert all(seconds > 0 for seconds in report.stage_seconds.values())
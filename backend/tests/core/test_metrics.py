@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from src.core.metrics import CallbackCounter, Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_registry_renders_counters_and_gauges_in_text_format() -> None:
+    """
+    Tests that counters are rendered per label values, with escaped labels,
+    and that gauges read their value when collected.
+    """
+    registry = MetricsRegistry()
+    fetches = registry.register(Counter("fetches_total", "HTTP fetches.", ("host", "status")))
+    depth = [0]
+    registry.register(Gauge("queue_depth", "Queued records.", lambda: depth[0]))
+    registry.register(CallbackCounter("dropped_total", "Dropped records.", lambda: 2))
+
+    fetches.inc(host="a.example", status="200")
+    fetches.inc(2, host="a.example", status="200")
+    fetches.inc(host='b"x', status="503")
+    depth[0] = 7
+
+    assert registry.render() == (
+        "# HELP fetches_total HTTP fetches.\n"
+        "# TYPE fetches_total counter\n"
+        'fetches_total{host="a.example",status="200"} 3\n'
+        'fetches_total{host="b\\"x",status="503"} 1\n'
+        "# HELP queue_depth Queued records.\n"
+        "# TYPE queue_depth gauge\n"
+        "queue_depth 7\n"
+        "# HELP dropped_total Dropped records.\n"
+        "# TYPE dropped_total counter\n"
+        "dropped_total 2\n"
+    )
+
+
+def test_histogram_renders_cumulative_buckets_sum_and_count() -> None:
+    """
+    Tests that observations are counted in cumulative buckets, bounds
+    included, with +Inf, the sum and the count.
+    """
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, route="/jobs")
+
+    assert histogram.count(route="/jobs") == 4  # noqa: PLR2004
+    assert histogram.render().splitlines()[2:] == [
+        'latency_seconds_bucket{route="/jobs",le="0.1"} 2',
+        'latency_seconds_bucket{route="/jobs",le="1"} 3',
+        'latency_seconds_bucket{route="/jobs",le="+Inf"} 4',
+        'latency_seconds_sum{route="/jobs"} 3.65',
+        'latency_seconds_count{route="/jobs"} 4',
+    ]
+
+
+def test_metrics_reject_wrong_labels_and_duplicate_names() -> None:
+    """
+    Tests that a sample must carry exactly the declared labels, and that a
+    metric name is registered once.
+    """
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("runs_total", "Runs.", ("job",)))
+
+    with pytest.raises(ValueError, match="expects labels"):
+        counter.inc(source="habr")
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(Counter("runs_total", "Runs again."))
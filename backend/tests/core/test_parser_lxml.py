@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.core.parsers.habr import HabrParser
+from src.core.parsers.habr_lxml import HabrLxmlParser
+
+TEST_DATA_DIR = Path(__file__).parent.parent / "test_data"
+
+
+@pytest.mark.parametrize(
+    "fixture_path",
+    [
+        TEST_DATA_DIR / "html" / "habr_python_developer.html",
+        TEST_DATA_DIR / "habr_vacancies.html",
+    ],
+)
+def test_lxml_parser_matches_habr_parser(fixture_path: Path) -> None:
+    """
+    Tests that HabrLxmlParser returns exactly the same jobs as HabrParser.
+
+    Args:
+        fixture_path: Path to the HTML fixture.
+    """
+    content = fixture_path.read_text(encoding="utf-8")
+
+    expected = HabrParser().parse(content)
+    actual = HabrLxmlParser().parse(content)
+
+    assert actual
+    assert actual == expected
+
+
+def test_lxml_parser_yields_jobs_incrementally() -> None:
+    """
+    Tests that iter_jobs is lazy and handles large multi-card pages.
+    """
+    card = (TEST_DATA_DIR / "html" / "habr_python_developer.html").read_text(encoding="utf-8")
+    card = card[card.index('<div class="vacancy-card">') : card.rindex("</body>")]
+    cards_count = 50
+    content = (
+        "<html><body>"
+        + "".join(card.replace("1000123456", str(i)) for i in range(cards_count))
+        + "</body></html>"
+    )
+
+    jobs = HabrLxmlParser().iter_jobs(content)
+    first_job = next(jobs)
+
+    assert first_job.title == "Python-разработчик"
+    assert str(first_job.url) == "https://career.habr.com/vacancies/0"
+    assert len(list(jobs)) == cards_count - 1
+
+
+def test_lxml_parser_returns_empty_list_for_empty_content() -> None:
+    """
+    Tests that empty content produces no jobs instead of an error.
+    """
+    assert HabrLxmlParser().parse("") == []
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.config.config import IngestionConfig
+from src.core.parsers import ParserPool
+from src.core.parsers.habr import HabrParser
+from src.core.parsers.habr_lxml import HabrLxmlParser
+
+HTML_PATH = Path(__file__).parent.parent / "test_data" / "habr_vacancies.html"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["process", "thread", "inline"])
+async def test_parser_pool_returns_same_jobs_as_parser(executor: str) -> None:
+    """
+    Tests that parsing in the pool yields exactly what the parser returns
+    when called directly.
+
+    Args:
+        executor: The kind of parser pool.
+    """
+    content = HTML_PATH.read_text(encoding="utf-8")
+    pool = ParserPool.from_config(
+        IngestionConfig(parser_executor=executor, parser_workers=2),  # type: ignore[arg-type]
+    )
+
+    try:
+        bs4_jobs, lxml_jobs = await asyncio.gather(
+            pool.parse(HabrParser(), content),
+            pool.parse(HabrLxmlParser(), content),
+        )
+    finally:
+        pool.shutdown()
+
+    expected = HabrParser().parse(content)
+    assert expected
+    assert bs4_jobs == expected
+    assert lxml_jobs == expected
+
+
+@pytest.mark.asyncio
+async def test_parser_pool_keeps_event_loop_responsive() -> None:
+    """
+    Tests that the event loop keeps running other tasks while a page is parsed.
+    """
+    content = HTML_PATH.read_text(encoding="utf-8") * 20
+    pool = ParserPool.from_config(IngestionConfig(parser_executor="thread", parser_workers=1))
+    ticks = 0
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        await pool.parse(HabrParser(), content)
+    finally:
+        ticker_task.cancel()
+        pool.shutdown()
+
+    assert ticks > 1
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.runs import RunReport, RunStage, RunStatus
+from src.core.tasks import parse_source
+from src.db.models import TaskRun
+
+
+def test_run_report_sums_stage_times() -> None:
+    """
+    Tests that every block timed for a stage adds to that stage only.
+    """
+    ticks = iter([0.0, 1.5, 10.0, 10.25, 20.0, 22.0])
+    report = RunReport(clock=lambda: next(ticks))
+
+    with report.stage(RunStage.FETCH):
+        pass
+    with report.stage(RunStage.FETCH):
+        pass
+    with pytest.raises(RuntimeError), report.stage(RunStage.WRITE):
+        raise RuntimeError
+
+    assert report.stage_seconds == {
+        RunStage.FETCH: 1.75,
+        RunStage.PARSE: 0.0,
+        RunStage.DEDUPE: 0.0,
+        RunStage.WRITE: 2.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_parse_source_records_its_runs() -> None:
+    """
+    Tests that every scheduled run is recorded with its report, and that a
+    failed run keeps what it did before failing along with the error.
+    """
+
+    async def succeed(_: object, report: RunReport) -> RunReport:
+        report.pages = 3
+        report.jobs_created = 2
+        report.stage_seconds[RunStage.FETCH] = 0.5
+        return report
+
+    async def fail(_: object, report: RunReport) -> RunReport:
+        report.pages = 1
+        raise RuntimeError("parser crashed")
+
+    with patch("src.core.tasks.JobService") as service_class:
+        service_class.return_value.process_source = AsyncMock(side_effect=succeed)
+        await parse_source("habr")
+        service_class.return_value.process_source = AsyncMock(side_effect=fail)
+        with pytest.raises(RuntimeError):
+            await parse_source("habr")
+
+    succeeded, failed = await TaskRun.all().order_by("id")
+    assert succeeded.task == "parse_habr"
+    assert succeeded.status == RunStatus.SUCCEEDED
+    assert (succeeded.pages, succeeded.jobs_created, succeeded.fetch_seconds) == (3, 2, 0.5)
+    assert succeeded.finished_at is not None
+    assert succeeded.duration is not None
+    assert failed.status == RunStatus.FAILED
+    assert failed.pages == 1
+    assert failed.error == "RuntimeError('parser crashed')"
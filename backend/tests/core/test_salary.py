@@ -0,0 +1,31 @@
+import pytest
+
+from src.core.salary import EMPTY_SALARY, SalaryRange, parse_salary
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("от 200 000 до 300 000 ₽", SalaryRange(200_000, 300_000, "RUB")),
+        ("от 150 000 ₽", SalaryRange(150_000, None, "RUB")),
+        ("до 250 000 руб.", SalaryRange(None, 250_000, "RUB")),
+        ("$5000 - $7000", SalaryRange(5000, 7000, "USD")),
+        ("up to 4 000 €", SalaryRange(None, 4000, "EUR")),
+        ("from 3000 USD", SalaryRange(3000, None, "USD")),
+        ("500 000 ₸", SalaryRange(500_000, 500_000, "KZT")),
+        ("120 000", SalaryRange(120_000, 120_000, None)),
+    ],
+)
+def test_parse_salary(text: str, expected: SalaryRange) -> None:
+    """
+    Test that parse_salary extracts the bounds and currency of common salary formats.
+    """
+    assert parse_salary(text) == expected
+
+
+@pytest.mark.parametrize("text", [None, "", "По договорённости"])
+def test_parse_salary_without_amount(text: str | None) -> None:
+    """
+    Test that parse_salary returns an empty range when there is no amount.
+    """
+    assert parse_salary(text) == EMPTY_SALARY
@@ -0,0 +1,52 @@
+from datetime import date
+
+from src.core.salary import EMPTY_SALARY, SalaryRange
+from src.core.stats import StatMetric, job_stat_keys, salary_bucket_key, stat_deltas
+
+DAY = date(2026, 10, 18)
+
+
+def test_salary_bucket_key_rounds_down_to_currency_width() -> None:
+    """
+    Test that salaries are bucketed by lower bound, or upper bound if it is the
+    only one known, with a bucket width depending on the currency.
+    """
+    assert salary_bucket_key(SalaryRange(180_000, 250_000, "RUB")) == "RUB:150000"
+    assert salary_bucket_key(SalaryRange(None, 5_500, "USD")) == "USD:5000"
+    assert salary_bucket_key(SalaryRange(100_000, None, None)) is None
+    assert salary_bucket_key(EMPTY_SALARY) is None
+
+
+def test_job_stat_keys_skip_unknown_company_and_salary() -> None:
+    """
+    Test that a job always counts in the total and its day, and in the company
+    and salary counters only when these are known.
+    """
+    assert job_stat_keys(None, DAY, EMPTY_SALARY) == [
+        (StatMetric.TOTAL, ""),
+        (StatMetric.DAY, "2026-10-18"),
+    ]
+    assert job_stat_keys("Corp", DAY, SalaryRange(100_000, None, "RUB"))[2:] == [
+        (StatMetric.COMPANY, "Corp"),
+        (StatMetric.SALARY, "RUB:100000"),
+    ]
+
+
+def test_stat_deltas_keep_only_moved_counters() -> None:
+    """
+    Test that an updated job moves between counters without touching the
+    counters its old and new versions share.
+    """
+    old_version = job_stat_keys("Corp", DAY, SalaryRange(100_000, None, "RUB"))
+    new_version = job_stat_keys("Corp", DAY, SalaryRange(200_000, None, "RUB"))
+    fresh_job = job_stat_keys("Corp", DAY, EMPTY_SALARY)
+
+    deltas = stat_deltas([new_version, fresh_job], [old_version])
+
+    assert deltas == {
+        (StatMetric.TOTAL, ""): 1,
+        (StatMetric.DAY, "2026-10-18"): 1,
+        (StatMetric.COMPANY, "Corp"): 1,
+        (StatMetric.SALARY, "RUB:100000"): -1,
+        (StatMetric.SALARY, "RUB:200000"): 1,
+    }
@@ -0,0 +1,57 @@
+from collections import Counter
+
+import pytest
+
+from src.core.stats import StatMetric
+from src.db.backfill import backfill_salaries, rebuild_stats
+from src.db.models import Job
+from src.db.repository import StatsRepository
+
+
+@pytest.mark.asyncio
+async def test_backfill_salaries_parses_salary_text_in_batches() -> None:
+    """
+    Test that backfill_salaries fills the salary columns of every job with a
+    salary, across several batches, and leaves up-to-date jobs untouched.
+    """
+    for i in range(5):
+        await Job.create(
+            title=f"Job {i}",
+            url=f"https://example.com/job/{i}",
+            salary=f"от {i + 1}00 000 ₽",
+        )
+    await Job.create(title="No salary", url="https://example.com/job/none")
+
+    updated_count = await backfill_salaries(batch_size=2)
+    rerun_count = await backfill_salaries(batch_size=2)
+
+    assert updated_count == 5  # noqa: PLR2004
+    assert rerun_count == 0
+    job = await Job.get(url="https://example.com/job/2")
+    assert (job.salary_min, job.salary_max, job.salary_currency) == (300_000, None, "RUB")
+    no_salary = await Job.get(url="https://example.com/job/none")
+    assert no_salary.salary_min is None
+
+
+@pytest.mark.asyncio
+async def test_rebuild_stats_recounts_all_jobs() -> None:
+    """
+    Test that rebuild_stats replaces drifted counters with counts of the stored jobs.
+    """
+    stats_repo = StatsRepository()
+    await stats_repo.apply(Counter({(StatMetric.COMPANY, "Gone"): 5}))
+    for i in range(3):
+        await Job.create(
+            title=f"Job {i}",
+            url=f"https://example.com/job/{i}",
+            company="Corp",
+            salary_min=60_000,
+            salary_currency="RUB",
+        )
+
+    counted = await rebuild_stats(batch_size=2)
+
+    assert counted == 3  # noqa: PLR2004
+    assert await stats_repo.get_count(StatMetric.TOTAL) == 3  # noqa: PLR2004
+    assert await stats_repo.get_top(StatMetric.COMPANY, 10) == [("Corp", 3)]
+    assert await stats_repo.get_all(StatMetric.SALARY) == {"RUB:50000": 3}
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from tortoise import timezone
+
+from src.core.tasks import parse_source
+from src.db.locks import task_lock
+from src.db.models import TaskLock
+
+
+@pytest.mark.asyncio
+async def test_task_lock_admits_a_single_holder() -> None:
+    """
+    Tests that a task lock cannot be taken while held, and can be once released.
+    """
+    async with task_lock("parse_habr") as first:
+        async with task_lock("parse_habr") as second:
+            assert first
+            assert not second
+        async with task_lock("parse_other") as other:
+            assert other
+        # The refused attempt does not release the holder's lock
+        assert await TaskLock.filter(name="parse_habr").exists()
+
+    async with task_lock("parse_habr") as again:
+        assert again
+    assert not await TaskLock.exists()
+
+
+@pytest.mark.asyncio
+async def test_task_lock_left_by_crashed_holder_expires() -> None:
+    """
+    Tests that a lock row whose holder never released it is taken over once expired.
+    """
+    await TaskLock.create(
+        name="parse_habr",
+        owner="crashed",
+        expires_at=timezone.now() - timedelta(seconds=1),
+    )
+
+    async with task_lock("parse_habr") as acquired:
+        assert acquired
+        assert (await TaskLock.get(name="parse_habr")).owner != "crashed"
+
+
+@pytest.mark.asyncio
+async def test_parse_source_skips_source_processed_elsewhere() -> None:
+    """
+    Tests that the scheduled task does not process a source whose lock is held
+    by another process, and does once the lock is released.
+    """
+    with patch("src.core.tasks.JobService") as service_class:
+        service_class.return_value.process_source = AsyncMock()
+        async with task_lock("parse_habr"):
+            await parse_source("habr")
+        service_class.return_value.process_source.assert_not_awaited()
+
+        await parse_source("habr")
+        service_class.return_value.process_source.assert_awaited_once()
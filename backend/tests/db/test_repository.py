@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import HttpUrl
 
+from src.core.schemas import JobSchema
+from src.db.models import Job
 from src.db.repository import JobRepository
 
 
@@ -47,3 +50,90 @@ async def test_get_job_by_url() -> None:
 
     non_existent_job = await repo.get_job_by_url("https://example.com/job/nonexistent")
     assert non_existent_job is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_jobs_ignores_duplicate_urls() -> None:
+    """
+    Tests that bulk_create_jobs inserts new jobs and skips URLs that already exist.
+    """
+    repo = JobRepository()
+    await repo.create_job(
+        title="Old Title",
+        url="https://example.com/job/1",
+        company=None,
+        description=None,
+        location=None,
+        salary=None,
+    )
+
+    await repo.bulk_create_jobs(
+        [
+            JobSchema(title="New Title", url=HttpUrl("https://example.com/job/1")),
+            JobSchema(title="Second Job", url=HttpUrl("https://example.com/job/2")),
+        ],
+    )
+
+    jobs = {job.url: job.title for job in await Job.all()}
+    assert jobs == {
+        "https://example.com/job/1": "Old Title",
+        "https://example.com/job/2": "Second Job",
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_job_chunks_walks_all_jobs_in_chunks() -> None:
+    """
+    Tests that iter_job_chunks yields every job once, newest first, in bounded chunks.
+    """
+    repo = JobRepository()
+    jobs_count = 5
+    for i in range(jobs_count):
+        await repo.add_one(title=f"Job {i}", url=f"https://example.com/job/{i}")
+
+    chunks = [chunk async for chunk in repo.iter_job_chunks(["title"], chunk_size=2)]
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    titles = [job["title"] for chunk in chunks for job in chunk]
+    assert titles == [f"Job {i}" for i in reversed(range(jobs_count))]
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_jobs_overwrites_content_and_fingerprint() -> None:
+    """
+    Tests that bulk_update_jobs rewrites the content of stored jobs, refreshes
+    their fingerprints and updated_at, and leaves other jobs alone.
+    """
+    repo = JobRepository()
+    original = JobSchema(title="Job", url=HttpUrl("https://example.com/job/1"), salary="100")
+    untouched = JobSchema(title="Other", url=HttpUrl("https://example.com/job/2"))
+    await repo.bulk_create_jobs([original, untouched])
+    before = await Job.get(url="https://example.com/job/1")
+
+    changed = original.model_copy(update={"salary": "200"})
+    missing = JobSchema(title="Missing", url=HttpUrl("https://example.com/job/3"))
+    updated_count = await repo.bulk_update_jobs([changed, missing])
+
+    assert updated_count == 1
+    after = await Job.get(url="https://example.com/job/1")
+    assert after.salary == "200"
+    assert after.updated_at > before.updated_at
+    assert await repo.get_fingerprints(
+        ["https://example.com/job/1", "https://example.com/job/2", "https://example.com/job/3"],
+    ) == {
+        "https://example.com/job/1": changed.fingerprint,
+        "https://example.com/job/2": untouched.fingerprint,
+    }
+    assert await repo.bulk_update_jobs([]) == 0
+
+
+def test_job_fingerprint_tracks_content_but_not_url() -> None:
+    """
+    Tests that the fingerprint changes with the scraped content only.
+    """
+    job = JobSchema(title="Job", url=HttpUrl("https://example.com/job/1"), company="Corp")
+
+    assert job.fingerprint == job.model_copy(update={"url": "https://example.com/x"}).fingerprint
+    assert job.fingerprint != job.model_copy(update={"salary": "100"}).fingerprint
+    # An empty field and a missing one are different content
+    assert job.model_copy(update={"salary": ""}).fingerprint != job.fingerprint
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import HttpUrl
+
+from src.core.schemas import JobSchema
+from src.db.models import Job
+from src.db.repository import JobRepository
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_ranks_title_matches_first() -> None:
+    """
+    Tests that search_jobs matches titles and descriptions and ranks title hits higher.
+    """
+    repo = JobRepository()
+    await repo.add_one(
+        title="Data Engineer",
+        url="https://example.com/job/1",
+        description="Python and Spark",
+    )
+    await repo.add_one(title="Python-разработчик", url="https://example.com/job/2")
+    await repo.add_one(title="Frontend Developer", url="https://example.com/job/3")
+
+    jobs = await repo.search_jobs("python", ["title"], limit=10)
+
+    assert [job["title"] for job in jobs] == ["Python-разработчик", "Data Engineer"]
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_matches_prefixes_and_paginates() -> None:
+    """
+    Tests that words match as prefixes, case-insensitively, with limit/offset pages.
+    """
+    repo = JobRepository()
+    for i in range(3):
+        await repo.add_one(title=f"Разработчик {i}", url=f"https://example.com/job/{i}")
+
+    first_page = await repo.search_jobs("разраб", ["id"], limit=2)
+    second_page = await repo.search_jobs("разраб", ["id"], limit=2, offset=2)
+
+    expected_first_page_count = 2
+    assert len(first_page) == expected_first_page_count
+    assert len(second_page) == 1
+    assert {job["id"] for job in first_page}.isdisjoint({job["id"] for job in second_page})
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_bulk_inserts_and_updates() -> None:
+    """
+    Tests that bulk-inserted and updated jobs are searchable right away.
+    """
+    repo = JobRepository()
+    await repo.bulk_create_jobs(
+        [JobSchema(title="Golang Developer", url=HttpUrl("https://example.com/job/1"))],
+    )
+    assert [job["title"] for job in await repo.search_jobs("golang", ["title"], limit=10)] == [
+        "Golang Developer",
+    ]
+
+    await Job.filter(url="https://example.com/job/1").update(title="Rust Developer")
+
+    assert await repo.search_jobs("golang", ["title"], limit=10) == []
+    assert len(await repo.search_jobs("rust", ["title"], limit=10)) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_treats_operators_literally() -> None:
+    """
+    Tests that FTS syntax in the query does not raise and blank queries match nothing.
+    """
+    repo = JobRepository()
+    await repo.add_one(title="C++ Developer", url="https://example.com/job/1")
+
+    assert await repo.search_jobs('"C++ OR NEAR(', ["title"], limit=10) == []
+    assert await repo.search_jobs("   ", ["title"], limit=10) == []
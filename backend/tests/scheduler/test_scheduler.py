@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, cast
 
+import httpx
 import pytest
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_MISSED,
+    EVENT_JOB_SUBMITTED,
+    JobExecutionEvent,
+    JobSubmissionEvent,
+)
 
+from src.core.fetcher import Fetcher
+from src.core.metrics import scheduler_lag_seconds, scheduler_skipped_runs
+from src.core.sources import HABR_SOURCE, SourceRegistry, source_registry
+from src.core.tasks import parse_source
 from src.scheduler.scheduler import TaskScheduler
 
 if TYPE_CHECKING:
@@ -37,3 +52,133 @@ async def test_add_and_get_job(mocker: MockerFixture) -> None:  # noqa: ARG001
 
     scheduler.remove_job(job_id)
     assert scheduler.scheduler.get_job(job_id) is None
+
+
+@pytest.mark.asyncio
+async def test_parsing_jobs_receive_shared_fetcher() -> None:
+    """
+    Tests that every registered source gets its own parsing job on its own
+    schedule, sharing the fetcher.
+    """
+    sources = SourceRegistry()
+    sources.register(HABR_SOURCE)
+    sources.register(replace(HABR_SOURCE, name="other", interval_minutes=15))
+
+    async with httpx.AsyncClient() as http_client:
+        fetcher = Fetcher(http_client)
+        scheduler = TaskScheduler(fetcher=fetcher, sources=sources)
+
+        jobs = {job.id: job for job in scheduler.scheduler.get_jobs()}
+        assert set(jobs) == {"parse_habr", "parse_other"}
+        for name, job in (("habr", jobs["parse_habr"]), ("other", jobs["parse_other"])):
+            assert job.func.__wrapped__ is parse_source
+            assert job.kwargs == {
+                "source_name": name,
+                "fetcher": fetcher,
+                "parser_pool": None,
+            }
+        assert jobs["parse_other"].trigger.interval == timedelta(minutes=15)
+
+
+@pytest.mark.asyncio
+async def test_parsing_jobs_never_overlap_and_merge_missed_ticks() -> None:
+    """
+    Tests that a parsing job runs one instance at a time, that missed ticks
+    are coalesced, and that a tick too late for its interval is dropped.
+    """
+    sources = SourceRegistry()
+    sources.register(replace(HABR_SOURCE, interval_minutes=60))
+    scheduler = TaskScheduler(sources=sources)
+
+    job = cast("Job", scheduler.scheduler.get_job("parse_habr"))
+    assert job.max_instances == 1
+    assert job.coalesce
+    assert job.misfire_grace_time == 30 * 60  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_scheduler_records_run_lag_and_skipped_runs() -> None:
+    """
+    Tests that the scheduler measures how late runs are submitted, from their
+    most recent planned time, and counts misfired and overlapping runs.
+    """
+    scheduler = TaskScheduler(sources=SourceRegistry())
+    job_id = "metrics_job"
+    now = datetime.now(UTC)
+
+    scheduler.scheduler._dispatch_event(  # noqa: SLF001
+        JobSubmissionEvent(
+            EVENT_JOB_SUBMITTED,
+            job_id,
+            "default",
+            [now - timedelta(minutes=10), now - timedelta(seconds=3)],
+        ),
+    )
+    scheduler.scheduler._dispatch_event(  # noqa: SLF001
+        JobExecutionEvent(EVENT_JOB_MISSED, job_id, "default", now - timedelta(hours=1)),
+    )
+    scheduler.scheduler._dispatch_event(  # noqa: SLF001
+        JobSubmissionEvent(EVENT_JOB_MAX_INSTANCES, job_id, "default", [now]),
+    )
+
+    assert scheduler_lag_seconds.count(job=job_id) == 1
+    assert 3 <= scheduler_lag_seconds._sums[(job_id,)] < 60  # noqa: PLR2004, SLF001
+    assert scheduler_skipped_runs.value(job=job_id, reason="misfire") == 1
+    assert scheduler_skipped_runs.value(job=job_id, reason="overlap") == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_cancels_running_tasks_and_waits_for_their_cleanup() -> None:
+    """
+    Tests that stopping the scheduler cancels the runs in progress and
+    returns only once their cleanup is done.
+    """
+    started = asyncio.Event()
+    cleaned_up = []
+
+    async def long_task() -> None:
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        finally:
+            await asyncio.sleep(0.01)
+            cleaned_up.append(True)
+
+    scheduler = TaskScheduler(sources=SourceRegistry())
+    scheduler.add_interval_job(
+        long_task,
+        hours=1,
+        start_date=datetime.now(UTC) + timedelta(milliseconds=100),
+        job_id="long_task",
+    )
+    scheduler.start()
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    await scheduler.stop()
+
+    assert cleaned_up == [True]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_uses_global_source_registry_by_default() -> None:
+    """
+    Tests that the scheduler schedules the globally registered sources by default.
+    """
+    scheduler = TaskScheduler()
+
+    assert {job.id for job in scheduler.scheduler.get_jobs()} == {
+        f"parse_{source.name}" for source in source_registry
+    }
+
+
+def test_source_registry_rejects_duplicate_names() -> None:
+    """
+    Tests that two sources cannot be registered under the same name.
+    """
+    sources = SourceRegistry()
+    sources.register(HABR_SOURCE)
+
+    with pytest.raises(ValueError, match="already registered"):
+        sources.register(HABR_SOURCE)
+    assert sources.get("habr") is HABR_SOURCE
+    assert len(sources) == 1
@@ -1,6 +1,13 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlsplit
 
 import pytest
+from loguru import logger as loguru_logger
 from pytest_mock import MockerFixture
 
 from src.utils.notify_logger.config import TelegramHandlerConfig
@@ -48,20 +55,166 @@ def test_telegram_handler_with_notify_flag(mocker: MockerFixture) -> None:
     # 3. Setup the logger with our handler
     logger.setup(handlers=[telegram_handler], level="INFO")
 
-    # 4. Log two messages, one with notify=True, one with notify=False
+    # 4. Log three messages, two with notify=True, one with notify=False
     logger.info("This message should be sent to Telegram.", notify=True)
     logger.warning("This message should NOT be sent.", notify=False)
     logger.error("This one also should be sent.", notify=True)
 
-    # 5. Assert that send_message was called exactly twice
-    call_count = 2
-    assert mock_bot_instance.send_message.call_count == call_count, (
-        "send_message should be called twice for logs with notify=True"
+    # 5. Nothing is sent from the logging call; stopping delivers the batch
+    telegram_handler.stop()
+
+    # 6. Assert that both messages were batched into one send_message call
+    assert mock_bot_instance.send_message.call_count == 1, (
+        "send_message should be called once for the batch of logs with notify=True"
+    )
+    chat_id, text = mock_bot_instance.send_message.call_args.args
+    assert chat_id == 123  # noqa: PLR2004
+    assert "This message should be sent" in text
+    assert "This one also should be sent" in text
+    assert "should NOT be sent" not in text
+
+
+class StubBotApi(BaseHTTPRequestHandler):
+    """
+    A local Telegram Bot API answering `sendMessage` slowly, and throttling
+    the first request with "429 Too Many Requests".
+    """
+
+    delay = 0.2
+    messages: list[tuple[int, str, float]] = []
+    throttled = False
+
+    def do_POST(self) -> None:  # noqa: N802
+        query = urlsplit(self.path).query
+        params = {key: values[0] for key, values in parse_qs(query).items()}
+        time.sleep(self.delay)
+        if not StubBotApi.throttled:
+            StubBotApi.throttled = True
+            self._answer(
+                429,
+                {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": "Too Many Requests: retry after 0",
+                    "parameters": {"retry_after": 0},
+                },
+            )
+            return
+        StubBotApi.messages.append((int(params["chat_id"]), params["text"], time.monotonic()))
+        chat = {"id": int(params["chat_id"]), "type": "private"}
+        self._answer(200, {"ok": True, "result": {"message_id": 1, "date": 0, "chat": chat}})
+
+    def _answer(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Keeps the test output quiet."""
+
+
+@pytest.fixture
+def stub_bot_api(mocker: MockerFixture) -> Iterator[type[StubBotApi]]:
+    """Serves the stub Bot API locally and points pytelegrambotapi at it."""
+    StubBotApi.messages = []
+    StubBotApi.throttled = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBotApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.server_address[1]
+    mocker.patch("telebot.apihelper.API_URL", f"http://127.0.0.1:{port}/bot{{0}}/{{1}}")
+    mocker.patch.dict("os.environ", {"NO_PROXY": "127.0.0.1"})
+    try:
+        yield StubBotApi
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.unittest
+def test_telegram_handler_batches_bursts_without_blocking(
+    stub_bot_api: type[StubBotApi],
+) -> None:
+    """
+    Tests that logging a burst returns before anything is sent, and that the
+    burst reaches every admin as one message coalescing the messages of the
+    same subject, spaced per chat and retried after a 429 answer.
+
+    Args:
+        stub_bot_api: The local Bot API.
+    """
+    telegram_handler = TelegramHandler(
+        TelegramHandlerConfig(
+            bot_token="123:fake",  # noqa: S106
+            admin_ids=[1, 2],
+            level="INFO",
+            batch_interval=0.2,
+            chat_interval=0.3,
+        ),
     )
+    NotifyLogger().setup(handlers=[telegram_handler], level="INFO")
+
+    start = time.monotonic()
+    for i in range(37):
+        loguru_logger.bind(notify=True).info("✅ Found new job: {title}", title=f"Job {i}")
+    loguru_logger.bind(notify=True).warning("Source is slow")
+    logging_seconds = time.monotonic() - start
+    time.sleep(0.5)
+    loguru_logger.bind(notify=True).info("✅ Found new job: {title}", title="Late job")
+    telegram_handler.stop()
+
+    assert logging_seconds < stub_bot_api.delay
+    assert [chat_id for chat_id, _, _ in stub_bot_api.messages] == [1, 2, 1, 2]
+    first_text = stub_bot_api.messages[0][1]
+    assert first_text.startswith("🟢 INFO|✅ Found new job ×37:\n• Job 0\n• Job 1\n")
+    assert "… and 17 more" in first_text
+    assert "WARNING|Source is slow" in first_text
+    assert stub_bot_api.messages[2][1] == "🟢 INFO|✅ Found new job: Late job"
+    chat_1_times = [sent for chat_id, _, sent in stub_bot_api.messages if chat_id == 1]
+    assert chat_1_times[1] - chat_1_times[0] >= 0.3  # noqa: PLR2004
+
+
+@pytest.mark.unittest
+def test_suppressed_levels_skip_caller_lookup_and_formatting(mocker: MockerFixture) -> None:
+    """
+    Tests that a call below the level of every handler returns before
+    resolving the caller or formatting the message.
+
+    Args:
+        mocker: The pytest-mock fixture.
+    """
+    logger = NotifyLogger()
+    logger.setup(handlers=[], level="WARNING")
+    func_path = mocker.patch("src.utils.notify_logger.logger.get_dynamic_func_path")
+    format_message = mocker.spy(logger.formatter, "format_message")
+
+    logger.debug("Dropped.")
+    logger.info("Dropped as well.")
+
+    assert not logger.is_enabled("INFO")
+    assert logger.is_enabled("ERROR")
+    func_path.assert_not_called()
+    format_message.assert_not_called()
+
+
+@pytest.mark.unittest
+def test_logged_message_names_the_calling_function() -> None:
+    """
+    Tests that the message points at the code calling the logger, not at the
+    logger's own methods, including through the short aliases.
+    """
+    logger = NotifyLogger()
+    logger.setup(handlers=[], level="INFO")
+    messages: list[str] = []
+    logger.original.add(lambda message: messages.append(message.record["message"]))
 
-    # 6. Optional: Check the content of the calls
-    first_call_args = mock_bot_instance.send_message.call_args_list[0].args
-    assert "This message should be sent" in first_call_args[1]
+    logger.info("First call.", author="tests")
+    logger.i("Second call.", notify=False)
 
-    second_call_args = mock_bot_instance.send_message.call_args_list[1].args
-    assert "This one also should be sent" in second_call_args[1]
+    assert len(messages) == 2  # noqa: PLR2004
+    assert all(f"{__file__}:test_logged_message_names_the_calling_function:" in m for m in messages)
+    assert messages[0].endswith("[tests]: - First call.")
+    assert messages[1].endswith(" - Second call.")
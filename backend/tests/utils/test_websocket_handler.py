@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import pytest_asyncio
+from loguru import logger as loguru_logger
+
+from src.utils.notify_logger.config import WebSocketHandlerConfig
+from src.utils.notify_logger.handlers import WebSocketHandler
+from src.utils.notify_logger.logger import NotifyLogger
+from src.utils.notify_logger.websocket_manager import WebSocketHandlerManager
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from src.utils.notify_logger.types import LogMessage
+
+RECORDS_PER_SECOND = 100_000
+
+
+class FakeClient:
+    """A WebSocket client keeping what it receives."""
+
+    def __init__(self) -> None:
+        self.received: list[LogMessage] = []
+
+    async def send_json(self, data: Any) -> None:
+        self.received.append(data)
+
+
+@pytest_asyncio.fixture
+async def manager(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[WebSocketHandlerManager]:
+    """A fresh manager bound to the test's event loop, stopped afterwards."""
+    monkeypatch.setattr(WebSocketHandlerManager, "_instance", None)
+    manager = WebSocketHandlerManager()
+    try:
+        yield manager
+    finally:
+        NotifyLogger().setup(handlers=[], level="INFO")
+        await manager.stop()
+
+
+async def wait_until_delivered(
+    manager: WebSocketHandlerManager,
+    client: FakeClient,
+    expected: int,
+    timeout: float = 5.0,
+) -> None:
+    """Waits until the client got, or the manager dropped, the expected records."""
+    deadline = time.monotonic() + timeout
+    while len(client.received) + manager.dropped_count < expected:
+        assert time.monotonic() < deadline, "log records were not delivered in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_records_logged_from_loguru_thread_reach_clients(
+    manager: WebSocketHandlerManager,
+) -> None:
+    """
+    Tests that records handed over by loguru's enqueue thread, where there is
+    no event loop, are delivered to the clients in order.
+    """
+    handler = WebSocketHandler(WebSocketHandlerConfig(level="INFO"))
+    NotifyLogger().setup(handlers=[handler], level="WARNING")
+    client = FakeClient()
+    manager.add_client(client)
+
+    for i in range(1000):
+        loguru_logger.info("Record {i}", i=i)
+    loguru_logger.complete()
+    await wait_until_delivered(manager, client, 1000)
+
+    assert [entry["message"] for entry in client.received] == [f"Record {i}" for i in range(1000)]
+    assert client.received[0]["level"] == "INFO"
+
+
+@pytest.mark.asyncio
+async def test_bridge_sustains_100k_records_per_second_without_losing_errors(
+    manager: WebSocketHandlerManager,
+) -> None:
+    """
+    Tests that a thread pushing 100k records per second is never slowed down
+    by the event loop nor blocks it, that overflow drops only records below
+    ERROR, and that every record is either delivered in order or counted.
+    """
+    handler = WebSocketHandler(WebSocketHandlerConfig(queue_size=2000))
+    handler._loop = asyncio.get_running_loop()  # noqa: SLF001
+    manager.max_queued_records = 2000
+    manager.start()
+    client = FakeClient()
+    manager.add_client(client)
+    total = RECORDS_PER_SECOND
+
+    def produce() -> float:
+        start = time.perf_counter()
+        for i in range(total):
+            level = "ERROR" if i % 100 == 0 else "INFO"
+            handler.push({"level": level, "timestamp": "", "message": str(i)})
+            if i % 1000 == 999:  # noqa: PLR2004
+                ahead = start + (i + 1) / RECORDS_PER_SECOND - time.perf_counter()
+                if ahead > 0:
+                    time.sleep(ahead)
+        return time.perf_counter() - start
+
+    worst_loop_lag = 0.0
+    producer = asyncio.create_task(asyncio.to_thread(produce))
+    while not producer.done():
+        before = time.perf_counter()
+        await asyncio.sleep(0.001)
+        worst_loop_lag = max(worst_loop_lag, time.perf_counter() - before - 0.001)
+    producing_seconds = await producer
+    await wait_until_delivered(manager, client, total)
+
+    delivered = [int(entry["message"]) for entry in client.received]
+    assert producing_seconds < 1.5  # noqa: PLR2004
+    assert worst_loop_lag < 0.05  # noqa: PLR2004
+    assert delivered == sorted(delivered)
+    assert set(range(0, total, 100)) <= set(delivered)
+    assert len(delivered) + manager.dropped_count == total
+    assert manager.queued_records == 0
+
+
+@pytest.mark.asyncio
+async def test_overflowing_batch_keeps_what_fits_errors_first(
+    manager: WebSocketHandlerManager,
+) -> None:
+    """
+    Tests that a batch overflowing the queue keeps its ERROR records and as
+    many other records as still fit, in order, counting only the rest as dropped.
+    """
+    manager.max_queued_records = 5
+    manager.add_logs([{"level": "INFO", "timestamp": "", "message": "queued"}])
+    levels = ["INFO", "ERROR", "INFO", "INFO", "CRITICAL", "INFO", "INFO"]
+
+    manager.add_logs(
+        [{"level": level, "timestamp": "", "message": str(i)} for i, level in enumerate(levels)],
+        dropped=2,
+    )
+
+    manager.log_queue.get_nowait()
+    kept = manager.log_queue.get_nowait()
+    assert [entry["message"] for entry in kept] == ["0", "1", "2", "4"]
+    assert manager.queued_records == 5  # noqa: PLR2004
+    assert manager.dropped_count == 2 + 3
@@ -44,11 +44,30 @@ const validateResponse = async <T>(response: Response): Promise<T> => {
     return response.json() as Promise<T>;
 };
 
+const JOBS_PAGE_SIZE = 200;
+const NEXT_CURSOR_HEADER = 'X-Next-Cursor';
+
+/**
+ * Fetches all jobs, newest first.
+ *
+ * The backend returns one page at a time and puts the cursor of the next page
+ * in the `X-Next-Cursor` header, so pages are followed until it is missing.
+ */
 export const getJobs = async (): Promise<Job[]> => {
-    const getJobUrl = `${getApiUrl()}/jobs`;
+    const jobs: Job[] = [];
+    let cursor: string | null = null;
     try {
-        const response = await fetch(getJobUrl);
-        return validateResponse<Job[]>(response);
+        do {
+            const jobsUrl = new URL(`${getApiUrl()}/jobs`);
+            jobsUrl.searchParams.set('limit', JOBS_PAGE_SIZE.toString());
+            if (cursor) {
+                jobsUrl.searchParams.set('cursor', cursor);
+            }
+            const response = await fetch(jobsUrl.toString());
+            jobs.push(...(await validateResponse<Job[]>(response)));
+            cursor = response.headers.get(NEXT_CURSOR_HEADER);
+        } while (cursor);
+        return jobs;
     } catch (error) {
         console.warn('Could not fetch jobs from backend, returning mock data.', error);
         return mockJobs;
@@ -70,7 +89,22 @@ export const getJobById = async (id: string): Promise<Job | null> => {
     }
 };
 
-
-
-
-
+/**
+ * Subscribes to jobs as the backend ingests them, instead of re-polling the list.
+ *
+ * The browser reconnects by itself and resumes after the last received job.
+ * Pass `lastJobId` to also receive the jobs added since a previously seen one.
+ *
+ * @returns A function closing the subscription.
+ */
+export const subscribeToNewJobs = (onJob: (job: Job) => void, lastJobId?: number): (() => void) => {
+    const streamUrl = new URL(`${getApiUrl()}/jobs/stream`);
+    if (lastJobId !== undefined) {
+        streamUrl.searchParams.set('cursor', lastJobId.toString());
+    }
+    const source = new EventSource(streamUrl);
+    source.addEventListener('job', (event) => {
+        onJob(JSON.parse((event as MessageEvent<string>).data) as Job);
+    });
+    return () => source.close();
+};
@@ -34,11 +34,31 @@ describe('jobService', () => {
     const jobs = await getJobs();
 
     expect(fetchMock.mock.calls.length).toBe(1);
-    expect(fetchMock.mock.calls[0][0]).toBe(`${apiUrl}/jobs`);
+    expect(fetchMock.mock.calls[0][0]).toBe(`${apiUrl}/jobs?limit=200`);
 
     expect(jobs).toEqual(mockJobs);
   });
 
+  it('should follow the next page cursor until the last page', async () => {
+    const job = (id: number): Job => ({
+      id,
+      title: `Job ${id}`,
+      url: `http://example.com/job/${id}`,
+      company: 'Example Corp',
+      created_at: new Date().toISOString(),
+      description: 'A job.',
+    });
+    fetchMock
+      .mockResponseOnce(JSON.stringify([job(3), job(2)]), { headers: { 'X-Next-Cursor': 'abc=' } })
+      .mockResponseOnce(JSON.stringify([job(1)]));
+
+    const jobs = await getJobs();
+
+    expect(fetchMock.mock.calls.length).toBe(2);
+    expect(fetchMock.mock.calls[1][0]).toBe(`${apiUrl}/jobs?limit=200&cursor=abc%3D`);
+    expect(jobs.map((j) => j.id)).toEqual([3, 2, 1]);
+  });
+
   it('should fetch a single job by id', async () => {
     const mockJob: Job = {
         id: 1,